@@ -0,0 +1,107 @@
+"""
+Archivo: bench_insert_event.py
+Ubicación: src/benchmarks/
+
+Descripción:
+Benchmark de `EventDB.insert_event` sobre una base de datos temporal.
+Compara la ruta actual (una sentencia `INSERT ... ON CONFLICT ... RETURNING`)
+con la ruta anterior (SELECT de duplicado + INSERT + UPDATE de auto-root),
+ambas ejecutadas a través de la cola de escritura.
+
+Uso (desde la raíz del repositorio):
+    python -m src.benchmarks.bench_insert_event [--events 2000] [--concurrency 1]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.database.db import Database  # noqa: E402
+from src.database.event_db import with_epochs  # noqa: E402
+
+
+def _event(i: int, prefix: str) -> dict:
+    return {
+        "guild_id": 1,
+        "title": f"{prefix} {i}",
+        "created_by": 1,
+        "is_championship": i % 10 == 0,
+        "event_datetime_utc": "2030-01-01T20:00:00",
+    }
+
+
+async def _legacy_insert(db: Database, data: dict) -> int:
+    """Reproducción de la ruta anterior: SELECT + INSERT + UPDATE."""
+    now_iso = time.strftime("%Y-%m-%dT%H:%M:%S")
+    data.setdefault("created_at", now_iso)
+    with_epochs(data)
+    # El auto-root lo hace el UPDATE explícito, no el trigger
+    is_championship = data.pop("is_championship")
+
+    async def _op(conn):
+        async with conn.execute(
+            "SELECT event_id FROM events WHERE guild_id = ? AND title = ?",
+            (data["guild_id"], data["title"]),
+        ) as cur:
+            if await cur.fetchone():
+                raise ValueError("duplicado")
+        columns = ", ".join(data.keys())
+        placeholders = ", ".join(f":{k}" for k in data.keys())
+        cur = await conn.execute(f"INSERT INTO events ({columns}) VALUES ({placeholders})", data)
+        new_id = cur.lastrowid
+        async with conn.execute("SELECT last_insert_rowid()") as c:
+            await c.fetchone()
+        if is_championship:
+            await conn.execute(
+                "UPDATE events SET championship_id = ? WHERE event_id = ?", (new_id, new_id))
+        return new_id
+
+    return await db.submit_write(_op)
+
+
+async def _run(label: str, insert, n: int, concurrency: int) -> float:
+    queue = list(range(n))
+
+    async def worker():
+        while queue:
+            await insert(queue.pop())
+
+    start = time.perf_counter()
+    # Silenciar los print por evento del DAO para no medir la consola
+    with contextlib.redirect_stdout(io.StringIO()):
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {n} eventos en {elapsed:.3f}s — {n / elapsed:,.0f} ev/s")
+    return elapsed
+
+
+async def main(n: int, concurrency: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = await Database.get_instance(os.path.join(tmp, "bench.db"))
+        try:
+            async with db.writer() as conn:
+                await conn.execute("INSERT INTO servers (guild_id) VALUES (1)")
+                await conn.commit()
+
+            legacy = await _run(
+                "anterior", lambda i: _legacy_insert(db, _event(i, "legacy")), n, concurrency)
+            upsert = await _run(
+                "upsert", lambda i: db.events.insert_event(_event(i, "upsert")), n, concurrency)
+            print(f"Mejora: x{legacy / upsert:.2f}")
+        finally:
+            await db.safe_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[5])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(main(args.events, args.concurrency))
@@ -0,0 +1,266 @@
+"""
+Archivo: bench_scheduler.py
+Ubicación: src/benchmarks/
+
+Descripción:
+Banco de pruebas de los motores de agenda (publicación, recordatorios y
+purga de archivados) con reloj simulado y una base de datos temporal.
+
+- Siembra N eventos programados, M recordatorios pendientes y una parte de
+  eventos archivados con caducidad, repartidos a lo largo de `--horizon`.
+- Arranca `PublicationScheduler`, `ReminderDispatcher` y `RetentionJob` con un
+  `VirtualClock` y avanza el tiempo a saltos de `--tick` segundos virtuales.
+  En cada salto espera a que los motores terminen todo lo vencido.
+- Informa de:
+    · retraso de despacho (tiempo real desde que el reloj alcanza el plazo
+      hasta que el motor lo despacha): p50 / p95 / p99 / máx por motor;
+    · tiempo de base de datos por tick (suma de lecturas + escrituras, que
+      pueden solaparse entre motores): p50 / p95 / p99 / máx;
+    · memoria: pico de RSS (y pico de tracemalloc con `--tracemalloc`).
+
+Uso (desde la raíz del repositorio):
+    python -m src.benchmarks.bench_scheduler [--events 100000] [--reminders 300000]
+        [--archived 10000] [--horizon 604800] [--tick 60] [--tracemalloc]
+"""
+
+import argparse
+import asyncio
+import bisect
+import contextlib
+import io
+import math
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.database.db import Database  # noqa: E402
+from src.bot_core.publication import PublicationScheduler  # noqa: E402
+from src.bot_core.reminders import ReminderDispatcher  # noqa: E402
+from src.bot_core.retention import RetentionJob  # noqa: E402
+
+START_TS = 1_900_000_000  # epoch virtual de arranque
+
+
+# ---------------------------------------------------------
+# ⏱️ Reloj simulado
+# ---------------------------------------------------------
+class VirtualClock:
+    """
+    Reloj compatible con `DeadlineScheduler` (`now()` / `wait()`). El tiempo
+    solo avanza con `advance_to()`; se guarda el instante real de cada avance
+    para medir el retraso de despacho en tiempo real.
+    """
+
+    def __init__(self, start: float):
+        self._now = float(start)
+        self._waiters: List[list] = []
+        self._advances_virtual: List[float] = [self._now]
+        self._advances_real: List[float] = [time.perf_counter()]
+
+    def now(self) -> float:
+        return self._now
+
+    @property
+    def parked(self) -> int:
+        """Bucles dormidos sin nada que los despierte ya."""
+        return sum(1 for _, future, wake in self._waiters if not future.done() and not wake.is_set())
+
+    async def wait(self, wake: asyncio.Event, timeout: Optional[float]) -> None:
+        loop = asyncio.get_running_loop()
+        entry = [math.inf if timeout is None else self._now + timeout, loop.create_future(), wake]
+        self._waiters.append(entry)
+        woken = asyncio.ensure_future(wake.wait())
+        try:
+            await asyncio.wait({entry[1], woken}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            woken.cancel()
+            self._waiters.remove(entry)
+
+    def advance_to(self, when: float) -> None:
+        self._now = when
+        self._advances_virtual.append(when)
+        self._advances_real.append(time.perf_counter())
+        for deadline, future, _ in self._waiters:
+            if deadline <= when and not future.done():
+                future.set_result(None)
+
+    def reached_at(self, when: float) -> float:
+        """Instante real en que el reloj virtual alcanzó `when`."""
+        i = bisect.bisect_left(self._advances_virtual, when)
+        return self._advances_real[min(i, len(self._advances_real) - 1)]
+
+
+# ---------------------------------------------------------
+# 📏 Instrumentación
+# ---------------------------------------------------------
+class _Bot:
+    """Cliente mínimo: los eventos sembrados no tienen canales ni inscritos."""
+
+    def get_channel(self, channel_id):
+        return None
+
+    def get_user(self, user_id):
+        return None
+
+
+class DbTimer:
+    """Acumula el tiempo real dentro de lecturas y escrituras de `Database`."""
+
+    def __init__(self, db: Database):
+        self.total = 0.0
+        reader, submit_write = db.reader, db.submit_write
+
+        @asynccontextmanager
+        async def timed_reader():
+            started = time.perf_counter()
+            try:
+                async with reader() as conn:
+                    yield conn
+            finally:
+                self.total += time.perf_counter() - started
+
+        async def timed_write(op):
+            started = time.perf_counter()
+            try:
+                return await submit_write(op)
+            finally:
+                self.total += time.perf_counter() - started
+
+        db.reader = timed_reader
+        db.submit_write = timed_write
+
+
+def _instrument(engine, clock: VirtualClock, lags: List[float]) -> None:
+    dispatch = engine.scheduler._dispatch
+
+    async def timed(key, when):
+        lags.append(time.perf_counter() - clock.reached_at(when))
+        await dispatch(key, when)
+
+    engine.scheduler._dispatch = timed
+
+
+def _percentiles(values: List[float], scale: float = 1000.0) -> str:
+    if not values:
+        return "sin datos"
+    values = sorted(values)
+
+    def pick(p):
+        return values[min(len(values) - 1, int(p * len(values)))] * scale
+
+    return (f"p50 {pick(0.50):.2f} · p95 {pick(0.95):.2f} · "
+            f"p99 {pick(0.99):.2f} · máx {values[-1] * scale:.2f} ms (n={len(values)})")
+
+
+# ---------------------------------------------------------
+# 🌱 Siembra
+# ---------------------------------------------------------
+async def _seed(db: Database, events: int, reminders: int, archived: int, horizon: int) -> None:
+    now_iso = "2030-01-01T00:00:00"
+
+    def spread(i, n):
+        return START_TS + 1 + (i * horizon) // max(n, 1)
+
+    async with db.writer() as conn:
+        await conn.execute("INSERT INTO servers (guild_id) VALUES (1)")
+        await conn.executemany("""
+            INSERT INTO events (guild_id, title, created_by, created_at, status, publish_ts, event_ts)
+            VALUES (1, ?, 1, ?, 'scheduled', ?, ?)
+        """, ((f"E{i}", now_iso, spread(i, events), spread(i, events) + 86400) for i in range(events)))
+        await conn.executemany("""
+            INSERT INTO events (guild_id, title, created_by, created_at, status, archive_expires_ts)
+            VALUES (1, ?, 1, ?, 'archived', ?)
+        """, ((f"A{i}", now_iso, spread(i, archived)) for i in range(archived)))
+        await conn.executemany("""
+            INSERT INTO reminders (event_id, guild_id, fire_ts, notify_participants)
+            VALUES (?, 1, ?, 0)
+        """, ((1 + i % max(events, 1), spread(i, reminders) + i % 3) for i in range(reminders)))
+        await conn.commit()
+
+
+# ---------------------------------------------------------
+# ▶️ Simulación
+# ---------------------------------------------------------
+async def _settle(clock: VirtualClock, engines, reminders: ReminderDispatcher) -> None:
+    """Espera a que todos los motores estén dormidos en el reloj y sin envíos en curso."""
+    while clock.parked < len(engines) or reminders._inflight:
+        await asyncio.sleep(0)
+
+
+async def main(args) -> None:
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = await Database.get_instance(os.path.join(tmp, "bench.db"))
+        try:
+            started = time.perf_counter()
+            await _seed(db, args.events, args.reminders, args.archived, args.horizon)
+            print(f"🌱 Siembra: {args.events} eventos, {args.reminders} recordatorios, "
+                  f"{args.archived} archivados en {time.perf_counter() - started:.2f}s")
+
+            clock = VirtualClock(START_TS)
+            bot = _Bot()
+            publisher = PublicationScheduler(bot, db, clock=clock)
+            reminders = ReminderDispatcher(bot, db, clock=clock)
+            retention = RetentionJob(db, chunk_pause=0, clock=clock)
+            engines = {"publicación": publisher, "recordatorios": reminders, "purga": retention}
+
+            lags: Dict[str, List[float]] = {name: [] for name in engines}
+            for name, engine in engines.items():
+                _instrument(engine, clock, lags[name])
+            timer = DbTimer(db)
+
+            started = time.perf_counter()
+            for engine in engines.values():
+                await engine.start()
+            print(f"🚀 Arranque de motores: {time.perf_counter() - started:.2f}s")
+
+            db_per_tick: List[float] = []
+            ticks = math.ceil(args.horizon / args.tick) + 1
+            started = time.perf_counter()
+            # Silenciar los print por evento del DAO para no medir la consola
+            with contextlib.redirect_stdout(io.StringIO()):
+                await _settle(clock, engines, reminders)
+                for i in range(1, ticks + 1):
+                    before = timer.total
+                    clock.advance_to(START_TS + i * args.tick)
+                    await _settle(clock, engines, reminders)
+                    db_per_tick.append(timer.total - before)
+            elapsed = time.perf_counter() - started
+
+            for engine in engines.values():
+                await engine.stop()
+
+            print(f"⏱️ {ticks} ticks de {args.tick}s virtuales en {elapsed:.2f}s reales")
+            for name, values in lags.items():
+                print(f"  {name:<14} retraso de despacho: {_percentiles(values)}")
+            print(f"  BD por tick: {_percentiles(db_per_tick)}")
+            print(f"  Publicados: {publisher.scheduler.dispatched} · "
+                  f"recordatorios enviados: {reminders.sent} · purgas: {retention.scheduler.dispatched}")
+
+            rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            line = f"💾 Pico de RSS: {rss_mb:.1f} MB"
+            if args.tracemalloc:
+                line += f" · pico tracemalloc: {tracemalloc.get_traced_memory()[1] / 2**20:.1f} MB"
+            print(line)
+        finally:
+            await db.safe_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[5])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--reminders", type=int, default=300_000)
+    parser.add_argument("--archived", type=int, default=10_000)
+    parser.add_argument("--horizon", type=int, default=7 * 86400, help="segundos virtuales")
+    parser.add_argument("--tick", type=int, default=60, help="segundos virtuales por tick")
+    parser.add_argument("--tracemalloc", action="store_true")
+    asyncio.run(main(parser.parse_args()))
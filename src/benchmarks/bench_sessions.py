@@ -0,0 +1,101 @@
+"""
+Archivo: bench_sessions.py
+Ubicación: src/benchmarks/
+
+Descripción:
+Benchmark de actualizaciones concurrentes de sesiones de wizard.
+Compara un único candado global (`lock_stripes=1`, el esquema anterior) con el
+bloqueo por franjas de `SessionStore` para 1, 10, 100 y 1000 usuarios
+simultáneos. Cada usuario parte de una sesión persistida (como tras un
+reinicio), de modo que su primera modificación la recupera de la BD dentro
+del candado, y después hace `--updates` modificaciones intercaladas con el
+resto de usuarios.
+
+`--load-latency-ms` añade una espera a cada lectura de la BD para simular un
+disco ocupado o un volumen de red (0 = solo el coste real de SQLite).
+
+Uso (desde la raíz del repositorio):
+    python -m src.benchmarks.bench_sessions [--updates 20] [--users 1,10,100,1000]
+        [--load-latency-ms 1]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.database.db import Database  # noqa: E402
+from src.cogs.wizards_shared.session_store import LOCK_STRIPES, SessionStore  # noqa: E402
+
+
+class _SlowLoads:
+    """`WizardSessionDB` con latencia añadida en las lecturas."""
+
+    def __init__(self, backend, latency: float):
+        self.backend = backend
+        self.latency = latency
+
+    async def load(self, user_id: int):
+        await asyncio.sleep(self.latency)
+        return await self.backend.load(user_id)
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
+
+async def _seed(db: Database, users: int) -> None:
+    now_iso = "2030-01-01T00:00:00+00:00"
+    rows = [(u, "events", 1, '{"title":"Carrera"}', None, now_iso, now_iso) for u in range(users)]
+    await db.wizard_sessions.save(rows)
+
+
+async def _user(store: SessionStore, user_id: int, updates: int) -> None:
+    for i in range(updates):
+        async with store.locked(user_id) as sess:
+            sess.writable("events")["field"] = i
+        await asyncio.sleep(0)  # otro clic de otro usuario
+
+
+async def _run(backend, users: int, updates: int, stripes: int) -> float:
+    store = SessionStore(flush_interval=3600, lock_stripes=stripes)
+    store.attach(backend)
+    started = time.perf_counter()
+    await asyncio.gather(*(_user(store, u, updates) for u in range(users)))
+    elapsed = time.perf_counter() - started
+    for task in (store._sweep_task, store._flush_task):
+        if task is not None:
+            task.cancel()
+    return users * updates / elapsed
+
+
+async def main(args) -> None:
+    user_counts = [int(n) for n in args.users.split(",")]
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = await Database.get_instance(os.path.join(tmp, "bench.db"))
+            await _seed(db, max(user_counts))
+        backend = _SlowLoads(db.wizard_sessions, args.load_latency_ms / 1000)
+        try:
+            await _run(backend, 10, 1, stripes=1)  # calentamiento
+            print(f"{'usuarios':>9} {'global (upd/s)':>15} {f'{LOCK_STRIPES} franjas (upd/s)':>20} {'mejora':>7}")
+            for users in user_counts:
+                single = await _run(backend, users, args.updates, stripes=1)
+                striped = await _run(backend, users, args.updates, stripes=LOCK_STRIPES)
+                print(f"{users:>9} {single:>15,.0f} {striped:>20,.0f} {striped / single:>6.2f}x")
+        finally:
+            with contextlib.redirect_stdout(io.StringIO()):
+                await db.safe_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[5])
+    parser.add_argument("--updates", type=int, default=20)
+    parser.add_argument("--users", default="1,10,100,1000")
+    parser.add_argument("--load-latency-ms", type=float, default=1.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,68 @@
+"""
+Archivo: bench_timezones.py
+Ubicación: src/benchmarks/
+
+Descripción:
+Microbenchmark de la conversión de fechas locales a UTC de los wizards.
+Compara la ruta anterior (`ZoneInfo(...)` + `datetime.strptime` en cada envío)
+con el servicio de `manager_timezones` (zona cacheada + parser propio) y con
+su API por lotes (`localize_many`).
+
+Uso (desde la raíz del repositorio):
+    python -m src.benchmarks.bench_timezones [--n 50000] [--tz Europe/Madrid]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from src.utils import manager_timezones as tz
+
+
+def _inputs(n: int):
+    base = datetime(2030, 1, 1, 20, 0)
+    return [(base + timedelta(hours=7 * i)).strftime("%Y-%m-%d %H:%M") for i in range(n)]
+
+
+def _legacy(values, tz_name):
+    """Ruta anterior: zona y strptime por cada fecha."""
+    out = []
+    for v in values:
+        local_dt = datetime.strptime(v, "%Y-%m-%d %H:%M").replace(tzinfo=ZoneInfo(tz_name))
+        out.append(local_dt.astimezone(ZoneInfo("UTC")))
+    return out
+
+
+def _service(values, tz_name):
+    return [tz.local_to_utc(v, tz_name) for v in values]
+
+
+def _batch(values, tz_name):
+    return tz.localize_many(values, tz_name)
+
+
+def _run(label: str, fn, values, tz_name: str) -> float:
+    start = time.perf_counter()
+    result = fn(values, tz_name)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {len(values)} fechas en {elapsed:.3f}s — {len(values) / elapsed:,.0f} fechas/s")
+    return elapsed, result
+
+
+def main(n: int, tz_name: str):
+    values = _inputs(n)
+    legacy, expected = _run("anterior", _legacy, values, tz_name)
+    service, got_service = _run("servicio", _service, values, tz_name)
+    batch, got_batch = _run("lote", _batch, values, tz_name)
+
+    assert got_service == expected and got_batch == expected, "Resultados distintos"
+    print(f"Mejora: x{legacy / service:.2f} (servicio), x{legacy / batch:.2f} (lote)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[5])
+    parser.add_argument("--n", type=int, default=50000)
+    parser.add_argument("--tz", default="Europe/Madrid")
+    args = parser.parse_args()
+    main(args.n, args.tz)
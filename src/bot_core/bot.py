@@ -16,10 +16,20 @@ import discord
 from discord.ext import commands
 
 from src.database.db import Database
+from src.database.leases import LeaderElection
 from src.bot_core.loader import load_all_cogs
+from src.bot_core.catchup import DowntimeRecovery, PUBLICATION, REMINDER
+from src.bot_core.outbound import get_dispatcher
+from src.bot_core.publication import PublicationScheduler
+from src.bot_core.registration import RegistrationEngine
+from src.bot_core.reminders import ReminderDispatcher
+from src.bot_core.retention import RetentionJob
+from src.cogs.wizards_shared.session_store import attach_session_stores, close_session_stores
 
 logger = logging.getLogger("BotCore")
 
+BACKGROUND_JOBS_LEASE = "background-jobs"
+
 
 class BotApp:
     """
@@ -27,6 +37,8 @@ class BotApp:
       - instancia de commands.Bot
       - acceso a Database
       - configuración básica
+      - servicios en segundo plano (publicación automática, inscripciones,
+        recordatorios, purga); los de agenda solo en el proceso líder
     """
 
     def __init__(self, config: dict, db: Database):
@@ -45,6 +57,32 @@ class BotApp:
 
         # Exponer la DB en el bot para que los Cogs puedan acceder
         setattr(self.bot, "db", db)
+        # Sesiones de los wizards persistidas en diferido
+        attach_session_stores(db)
+
+        # Cola de salida hacia Discord (prioridades y límites por ruta)
+        self.outbound = get_dispatcher(self.bot)
+
+        # Publicación automática de eventos programados
+        self.publisher = PublicationScheduler(self.bot, db)
+        # Ciclo de vida de las inscripciones (botón de inscripción incluido)
+        self.registration = RegistrationEngine(self.bot, db)
+        setattr(self.bot, "registration", self.registration)
+        # Envío de recordatorios persistidos
+        self.reminders = ReminderDispatcher(self.bot, db)
+        # Purga incremental de eventos archivados caducados
+        self.retention = RetentionJob(db)
+        # Plazos vencidos mientras no había líder (se buscan al ganar el lease)
+        self.recovery = DowntimeRecovery(db, config)
+        # Un único proceso ejecuta los trabajos anteriores (salvo inscripciones)
+        self.leader = LeaderElection(
+            db, BACKGROUND_JOBS_LEASE,
+            on_elected=self._start_leader_jobs,
+            on_demoted=self._stop_leader_jobs,
+        )
+        # Sus escrituras se descartan si el lease pasa a otro proceso
+        for job in (self.publisher, self.reminders, self.retention, self.recovery):
+            job.fence = self.leader.fence
 
         self._register_events()
 
@@ -79,6 +117,22 @@ class BotApp:
             except Exception as e:
                 logger.warning(f"⚠️ No se pudieron sincronizar comandos: {e}")
 
+            # Cambios de otros procesos que comparten la base de datos
+            if self.db.changes is not None:
+                try:
+                    await self.db.changes.start()
+                except Exception as e:
+                    logger.error(f"❌ Error al iniciar el registro de cambios: {e}")
+
+            # Inscripciones: cada proceso atiende los clics que recibe
+            try:
+                await self.registration.start()
+            except Exception as e:
+                logger.error(f"❌ Error al iniciar las inscripciones: {e}")
+
+            # Trabajos en segundo plano: solo en el proceso líder (lease en BD)
+            self.leader.start()
+
         @self.bot.event
         async def on_disconnect():
             logger.warning("⚠️ Desconexión detectada de Discord.")
@@ -87,6 +141,47 @@ class BotApp:
         async def on_error(event, *args, **kwargs):
             logger.exception(f"❌ Error en evento '{event}'")
 
+    # ------------------------------------------------------------------
+    # Trabajos del líder
+    # ------------------------------------------------------------------
+    async def _start_leader_jobs(self) -> None:
+        """Arranca recuperación, publicación, recordatorios y purga al ganar el lease."""
+        # Lo vencido mientras no había líder (parada o relevo): solo lo busca y
+        # descarta el líder, antes de que los servicios carguen sus plazos
+        try:
+            await self.recovery.scan()
+        except Exception as e:
+            logger.error(f"❌ Error en la recuperación de plazos vencidos: {e}")
+        self.recovery.attach(self.publisher, self.reminders)
+
+        try:
+            await self.publisher.start()
+        except Exception as e:
+            logger.error(f"❌ Error al iniciar la publicación automática: {e}")
+
+        try:
+            await self.reminders.start()
+        except Exception as e:
+            logger.error(f"❌ Error al iniciar los recordatorios: {e}")
+
+        try:
+            await self.retention.start()
+        except Exception as e:
+            logger.error(f"❌ Error al iniciar la purga de archivados: {e}")
+
+        # Reproducción de lo vencido durante la parada, en segundo plano
+        self.recovery.start({
+            PUBLICATION: self.publisher.publish_now,
+            REMINDER: self.reminders.fire_now,
+        })
+
+    async def _stop_leader_jobs(self) -> None:
+        """Detiene los trabajos del líder al perder o liberar el lease."""
+        await self.recovery.stop()
+        await self.publisher.stop()
+        await self.reminders.stop()
+        await self.retention.stop()
+
     # ------------------------------------------------------------------
     # Ciclo de vida
     # ------------------------------------------------------------------
@@ -101,5 +196,11 @@ class BotApp:
 
     async def close(self) -> None:
         """Cierra el bot sin tocar la base de datos (la maneja shutdown)."""
+        await self.leader.stop()
+        if self.db.changes is not None:
+            await self.db.changes.stop()
+        await self.registration.stop()
+        await self.outbound.stop()
+        await close_session_stores()
         await self.bot.close()
         logger.info("✅ Cliente de Discord cerrado desde BotApp.")
@@ -0,0 +1,243 @@
+"""
+Archivo: catchup.py
+Ubicación: src/bot_core/
+
+Descripción:
+Recuperación de plazos vencidos mientras no había ningún proceso líder
+(bot detenido o relevo entre procesos): publicaciones programadas y
+recordatorios.
+
+Flujo (desde `BotApp._start_leader_jobs`, solo en el proceso que gana el lease):
+1) `scan()`: una consulta de rango indexada por tipo
+   (`EventDB.missed_publications`, `ReminderDB.missed`) con todo lo vencido
+   hasta `cutoff` (= ahora).
+2) Se aplica la política de cada tipo (`CatchUpPolicy`):
+     - mode "fire":       se ejecuta tarde, sin importar la antigüedad.
+     - mode "skip_stale": se descarta si el retraso supera `max_age` segundos.
+     - mode "skip":       se descarta todo.
+     - collapse:          de varios plazos vencidos del mismo evento solo se
+                          ejecuta el más reciente.
+   Los recordatorios descartados pasan a `status='skipped'` con el `fence`
+   del lease (si otro proceso ya es el líder, no se toca nada); las
+   publicaciones descartadas siguen `scheduled` para publicarlas a mano.
+3) `attach()` fija `catchup_cutoff` en los servicios en vivo, que ya no cargan
+   esos plazos; así nada se ejecuta dos veces. Si otro proceso cambia después
+   un plazo a una fecha anterior a `cutoff`, el servicio lo pasa a `offer()`,
+   que le aplica la misma política en lugar de ejecutarlo directamente.
+4) `start()` reproduce el plan en una tarea aparte a un ritmo máximo de
+   `rate` ejecuciones por segundo: una parada larga no inunda Discord ni
+   retrasa el arranque del resto de trabajos.
+
+Configuración (`.env`):
+- CATCHUP_RATE: ejecuciones por segundo (1.0 por defecto).
+- CATCHUP_<TIPO>_MODE / _MAX_AGE / _COLLAPSE, con TIPO = PUBLICATION | REMINDER.
+
+Métricas: catchup.<tipo>.fired, catchup.<tipo>.skipped (contadores) y
+catchup.pending (medidor).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.utils.metrics import metrics
+
+logger = logging.getLogger("CatchUp")
+
+PUBLICATION = "publication"
+REMINDER = "reminder"
+CATCHUP_RATE = 1.0
+
+# (tipo, clave, evento, plazo)
+MissedItem = Tuple[str, int, int, int]
+ReplayHandler = Callable[[int], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class CatchUpPolicy:
+    """Qué hacer con los plazos vencidos de un tipo."""
+
+    mode: str = "fire"               # fire | skip_stale | skip
+    max_age: Optional[int] = None    # segundos (solo skip_stale)
+    collapse: bool = True
+
+    @classmethod
+    def from_config(cls, config: dict, kind: str, default: "CatchUpPolicy") -> "CatchUpPolicy":
+        prefix = f"CATCHUP_{kind.upper()}_"
+        mode = (config.get(prefix + "MODE") or default.mode).lower()
+        if mode not in ("fire", "skip_stale", "skip"):
+            logger.warning(f"⚠️ {prefix}MODE desconocido ({mode}); se usa '{default.mode}'.")
+            mode = default.mode
+        max_age = config.get(prefix + "MAX_AGE")
+        collapse = config.get(prefix + "COLLAPSE")
+        return cls(
+            mode=mode,
+            max_age=int(max_age) if max_age not in (None, "") else default.max_age,
+            collapse=default.collapse if collapse in (None, "") else str(collapse).lower() in ("1", "true", "yes"),
+        )
+
+    def keep(self, deadline: int, now: int) -> bool:
+        if self.mode == "skip":
+            return False
+        if self.mode == "skip_stale" and self.max_age is not None:
+            return now - deadline <= self.max_age
+        return True
+
+
+# Publicar tarde sigue siendo útil; un recordatorio de hace horas no
+DEFAULT_POLICIES: Dict[str, CatchUpPolicy] = {
+    PUBLICATION: CatchUpPolicy(mode="fire", collapse=True),
+    REMINDER: CatchUpPolicy(mode="skip_stale", max_age=3600, collapse=True),
+}
+
+
+class DowntimeRecovery:
+    """Plan de plazos vencidos durante la parada y su reproducción acotada."""
+
+    def __init__(self, db, config: Optional[dict] = None, clock=time.time):
+        config = config or {}
+        self.db = db
+        self.clock = clock
+        self.rate = float(config.get("CATCHUP_RATE") or CATCHUP_RATE)
+        self.policies = {
+            kind: CatchUpPolicy.from_config(config, kind, default)
+            for kind, default in DEFAULT_POLICIES.items()
+        }
+        self.cutoff: Optional[int] = None
+        self.plan: Deque[MissedItem] = deque()
+        self.skipped: Dict[str, List[int]] = {PUBLICATION: [], REMINDER: []}
+        # Cercado de las escrituras (`LeaseFence` del líder, lo asigna BotApp)
+        self.fence = None
+        self._handlers: Optional[Dict[str, ReplayHandler]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # ---------------------------------------------------------
+    # 🔍 Detección
+    # ---------------------------------------------------------
+    async def scan(self) -> Deque[MissedItem]:
+        """Busca lo vencido hasta ahora y aplica las políticas (en cada elección)."""
+        cutoff = int(self.clock())
+
+        missed: Dict[str, List[Tuple[int, int, int]]] = {
+            PUBLICATION: [(eid, eid, ts) for eid, ts in await self.db.events.missed_publications(cutoff)],
+            REMINDER: await self.db.reminders.missed(cutoff),
+        }
+
+        plan: List[MissedItem] = []
+        skipped: Dict[str, List[int]] = {PUBLICATION: [], REMINDER: []}
+        for kind, rows in missed.items():
+            policy = self.policies[kind]
+            kept: Dict[object, Tuple[int, int, int]] = {}
+            for key, event_id, deadline in rows:
+                if not policy.keep(deadline, cutoff):
+                    skipped[kind].append(key)
+                    continue
+                # Filas ordenadas por plazo: la última de cada evento es la más reciente
+                group = event_id if policy.collapse else key
+                previous = kept.get(group)
+                if previous is not None:
+                    skipped[kind].append(previous[0])
+                kept[group] = (key, event_id, deadline)
+            plan.extend((kind, key, event_id, deadline) for key, event_id, deadline in kept.values())
+
+        plan.sort(key=lambda item: item[3])
+        self.cutoff = cutoff
+        self.plan = deque(plan)
+        self.skipped = {PUBLICATION: [], REMINDER: []}
+        for kind, keys in skipped.items():
+            await self._skip(kind, keys)
+        metrics.gauge("catchup.pending", len(self.plan))
+
+        if self.plan or any(self.skipped.values()):
+            logger.info(
+                f"🩹 Recuperación tras parada: {len(self.plan)} plazos a reproducir, "
+                f"{sum(len(k) for k in self.skipped.values())} descartados."
+            )
+        return self.plan
+
+    async def _skip(self, kind: str, keys: List[int]) -> None:
+        if not keys:
+            return
+        if kind == REMINDER:
+            await self.db.reminders.mark_skipped(keys, fence=self.fence)
+        else:
+            for event_id in keys:
+                logger.warning(f"⚠️ Publicación vencida del evento {event_id} descartada por la política.")
+        self.skipped[kind].extend(keys)
+        metrics.incr(f"catchup.{kind}.skipped", len(keys))
+
+    async def offer(self, kind: str, key: int, event_id: int, deadline: int) -> None:
+        """
+        Plazo anterior a `cutoff` que llega después del escaneo (cambio hecho por
+        otro proceso): se le aplica la política y, si se conserva, entra en el plan.
+        """
+        policy = self.policies[kind]
+        if not policy.keep(deadline, int(self.clock())):
+            await self._skip(kind, [key])
+            return
+
+        item: MissedItem = (kind, key, event_id, deadline)
+        slot = 2 if policy.collapse else 1   # mismo evento (collapse) o mismo plazo
+        replaced = [old for old in self.plan if old[0] == kind and old[slot] == item[slot]]
+        if any(old[1] != key and old[3] > deadline for old in replaced):
+            await self._skip(kind, [key])   # ya hay uno más reciente del mismo evento
+            return
+        await self._skip(kind, [old[1] for old in replaced if old[1] != key])
+        plan = [old for old in self.plan if old not in replaced]
+        plan.append(item)
+        plan.sort(key=lambda entry: entry[3])
+        self.plan = deque(plan)
+        metrics.gauge("catchup.pending", len(self.plan))
+        if self._handlers is not None:
+            self.start(self._handlers)
+
+    def attach(self, publisher, reminders) -> None:
+        """
+        Evita que los servicios en vivo vuelvan a cargar los plazos ya escaneados
+        y les da acceso a `offer()` para los que lleguen después.
+        """
+        for service in (publisher, reminders):
+            service.catchup_cutoff = self.cutoff
+            service.recovery = self
+
+    # ---------------------------------------------------------
+    # ▶️ Reproducción a ritmo acotado
+    # ---------------------------------------------------------
+    def start(self, handlers: Dict[str, ReplayHandler]) -> None:
+        """
+        Lanza la reproducción en segundo plano (no bloquea a quien llama). Tras
+        `stop()` se reanuda con lo que quedara del plan.
+        """
+        self._handlers = handlers
+        if (self._task is not None and not self._task.done()) or not self.plan:
+            return
+        self._task = asyncio.create_task(self._replay(handlers), name="catchup-replay")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _replay(self, handlers: Dict[str, ReplayHandler]) -> None:
+        interval = 1.0 / self.rate if self.rate > 0 else 0.0
+        while self.plan:
+            kind, key, _event_id, deadline = self.plan.popleft()
+            try:
+                await handlers[kind](key)
+                metrics.incr(f"catchup.{kind}.fired")
+            except Exception as e:
+                logger.error(f"❌ Error al recuperar {kind} {key} (plazo {deadline}): {e}")
+            metrics.gauge("catchup.pending", len(self.plan))
+            if self.plan and interval:
+                await asyncio.sleep(interval)
+        logger.info("🩹 Recuperación tras parada completada.")
@@ -0,0 +1,172 @@
+"""
+Archivo: deadline_scheduler.py
+Ubicación: src/bot_core/
+
+Descripción:
+Planificador genérico por plazos (deadline) basado en un min-heap.
+En lugar de sondear la base de datos periódicamente, duerme exactamente hasta
+el siguiente vencimiento y se despierta antes si se programa algo más urgente.
+
+- `schedule(key, when)`: programa o reprograma una clave (O(log n)).
+- `cancel(key)`: cancela una clave (O(1), invalidación perezosa en el heap).
+- `trim(limit)`: conserva solo los `limit` plazos más próximos (para ventanas
+  acotadas) y reconstruye el heap sin entradas obsoletas.
+- `run()`: bucle que llama a `dispatch(key, when)` cuando vence cada plazo.
+
+El reloj es inyectable (`clock`) para poder simular el tiempo en benchmarks.
+Los plazos son segundos epoch UTC (`float` o `int`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger("DeadlineScheduler")
+
+Dispatch = Callable[[Hashable, float], Awaitable[None]]
+
+
+class SystemClock:
+    """Reloj real: `time.time()` y espera interrumpible con `asyncio.wait_for`."""
+
+    def now(self) -> float:
+        return time.time()
+
+    async def wait(self, wake: asyncio.Event, timeout: Optional[float]) -> None:
+        try:
+            await asyncio.wait_for(wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class DeadlineScheduler:
+    """Min-heap de plazos con despertador para cambios de agenda."""
+
+    def __init__(self, dispatch: Dispatch, name: str = "deadlines", clock=None):
+        self._dispatch = dispatch
+        self.name = name
+        self.clock = clock or SystemClock()
+
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._deadlines: Dict[Hashable, float] = {}
+        self._seq = 0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # Retraso observado entre el plazo y el despacho (segundos)
+        self.dispatched = 0
+        self.max_lag = 0.0
+
+    # ---------------------------------------------------------
+    # 🔹 Agenda
+    # ---------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        return self._deadlines.get(key)
+
+    def schedule(self, key: Hashable, when: float) -> None:
+        """Programa `key` para `when`; si ya existía, sustituye el plazo anterior."""
+        if self._deadlines.get(key) == when:
+            return
+        self._deadlines[key] = when
+        self._seq += 1
+        heapq.heappush(self._heap, (when, self._seq, key))
+        if self._heap[0][2] == key and self._heap[0][0] == when:
+            self._wake.set()
+
+    def cancel(self, key: Hashable) -> None:
+        """Cancela `key`. La entrada del heap se descarta al llegar a la cima."""
+        self._deadlines.pop(key, None)
+
+    def trim(self, limit: int) -> Optional[Tuple[float, Hashable]]:
+        """
+        Cancela los plazos más lejanos hasta dejar `limit` (las claves deben ser
+        comparables para desempatar). Devuelve el último conservado como
+        (when, key), o None si no queda ninguno.
+        """
+        if len(self._deadlines) > limit:
+            kept = heapq.nsmallest(limit, ((when, key) for key, when in self._deadlines.items()))
+            self._deadlines = {key: when for when, key in kept}
+            # Una lista ordenada ya es un heap válido
+            self._heap = [(when, seq, key) for seq, (when, key) in enumerate(kept)]
+        if not self._deadlines:
+            return None
+        return max((when, key) for key, when in self._deadlines.items())
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._deadlines.clear()
+        self._wake.set()
+
+    def _peek(self) -> Optional[Tuple[float, Hashable]]:
+        """Primer plazo vigente, descartando entradas obsoletas."""
+        heap = self._heap
+        while heap:
+            when, _, key = heap[0]
+            if self._deadlines.get(key) == when:
+                return when, key
+            heapq.heappop(heap)
+        return None
+
+    def pop_due(self, now: float) -> List[Tuple[Hashable, float]]:
+        """Extrae todas las claves vencidas a `now`, en orden de plazo."""
+        due = []
+        while True:
+            head = self._peek()
+            if head is None or head[0] > now:
+                return due
+            when, key = head
+            heapq.heappop(self._heap)
+            del self._deadlines[key]
+            due.append((key, when))
+
+    # ---------------------------------------------------------
+    # 🔁 Bucle
+    # ---------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self.run(), name=f"scheduler-{self.name}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self) -> None:
+        while True:
+            self._wake.clear()
+            now = self.clock.now()
+            for key, when in self.pop_due(now):
+                await self._fire(key, when)
+
+            head = self._peek()
+            timeout = None if head is None else max(0.0, head[0] - self.clock.now())
+            if timeout is None or timeout > 0:
+                await self.clock.wait(self._wake, timeout)
+
+    async def _fire(self, key: Hashable, when: float) -> None:
+        lag = self.clock.now() - when
+        self.dispatched += 1
+        self.max_lag = max(self.max_lag, lag)
+        try:
+            await self._dispatch(key, when)
+        except Exception:
+            logger.exception(f"❌ [{self.name}] Error al despachar {key!r}")
@@ -0,0 +1,412 @@
+"""
+Archivo: outbound.py
+Ubicación: src/bot_core/
+
+Descripción:
+Cola central de salida hacia Discord (mensajes a canales, MD, follow-ups de
+interacciones y ediciones de mensajes).
+
+- Carriles de prioridad (`Lane`): las respuestas interactivas de los wizards
+  salen antes que publicaciones, avisos a inscritos y recordatorios.
+- Un token bucket por ruta (canal, MD, webhook de la interacción) con los
+  límites documentados por Discord, para no llegar a ellos. Los buckets sin
+  reservas pendientes se descartan periódicamente.
+- Las ediciones pendientes del mismo mensaje se fusionan: solo se envía la
+  última versión. Si la nueva pide un carril más prioritario, la edición se
+  mueve a ese carril.
+- Un número fijo de `workers` (al menos dos) limita los envíos simultáneos.
+  Los carriles no interactivos tienen un tope propio (`LANE_WORKER_LIMITS`)
+  y entre todos ocupan como mucho `workers - 1`: siempre queda un worker
+  para las respuestas interactivas aunque haya recordatorios o avisos
+  masivos esperando a discord.py.
+
+Límites de Discord y discord.py:
+discord.py (2.3) ya gestiona los 429 dentro de cada llamada: su `HTTPClient`
+lee las cabeceras, duerme `retry_after` (o se adelanta si el bucket está
+agotado) y reintenta. Mientras duerme, el worker que hizo la llamada queda
+ocupado; de ahí los topes por carril. A este módulo solo llega un 429 cuando
+discord.py agota sus reintentos (`HTTPException` con status 429) o cuando la
+espera supera `max_ratelimit_timeout` (`RateLimited`). Entonces el bucket de
+la ruta adopta las cabeceras `X-RateLimit-*` si vienen y se reintenta tras
+`retry_after`. Es una ruta poco frecuente; lo habitual es que los buckets de
+aquí eviten el 429 y que discord.py absorba el resto.
+
+Uso:
+    dispatcher = get_dispatcher(bot)
+    await dispatcher.send_channel(channel, lane=Lane.REMINDER, content="...")
+    await send_followup(interaction, "texto", ephemeral=True)
+
+Métricas (`src.utils.metrics`):
+- outbound.backlog / outbound.backlog.<carril>: envíos en cola (medidores).
+- outbound.sent.<carril>, outbound.wait_ms.<carril>: envíos y espera
+  acumulada en cola (la media es wait_ms / sent).
+- outbound.max_wait_ms.<carril>: mayor espera observada (medidor).
+- outbound.retries, outbound.coalesced: reintentos por 429 y ediciones fusionadas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+import discord
+
+from src.utils.metrics import metrics
+
+logger = logging.getLogger("Outbound")
+
+OUTBOUND_WORKERS = 4
+MAX_RETRIES = 3
+# Cada cuánto se descartan los buckets sin reservas pendientes (segundos)
+BUCKET_SWEEP_INTERVAL = 60.0
+
+# Límites por defecto por tipo de ruta: (peticiones, segundos)
+ROUTE_LIMITS: Dict[str, Tuple[int, float]] = {
+    "channel": (5, 5.0),
+    "dm": (5, 5.0),
+    "webhook": (5, 2.0),
+}
+
+
+class Lane(IntEnum):
+    """Carriles de prioridad (menor valor = sale antes)."""
+
+    INTERACTIVE = 0
+    PUBLICATION = 1
+    PARTICIPANTS = 2
+    REMINDER = 3
+
+
+# Máximo de workers ocupados a la vez por carril no interactivo; entre todos
+# nunca pasan de `workers - 1` (el que queda es para INTERACTIVE)
+LANE_WORKER_LIMITS: Dict[Lane, int] = {
+    Lane.PUBLICATION: 2,
+    Lane.PARTICIPANTS: 2,
+    Lane.REMINDER: 2,
+}
+
+
+class TokenBucket:
+    """Token bucket en forma GCRA: reserva un hueco y devuelve la espera necesaria."""
+
+    __slots__ = ("limit", "interval", "tat")
+
+    def __init__(self, limit: int, per: float):
+        self.limit = 1
+        self.interval = 0.0
+        self.tat = 0.0  # instante teórico del siguiente hueco libre
+        self.configure(limit, per)
+
+    def configure(self, limit: int, per: float) -> None:
+        self.limit = max(1, int(limit))
+        self.interval = per / self.limit
+
+    def reserve(self, now: float) -> float:
+        burst = (self.limit - 1) * self.interval
+        wait = max(0.0, self.tat - burst - now)
+        self.tat = max(self.tat, now) + self.interval
+        return wait
+
+    def penalize(self, now: float, retry_after: float) -> None:
+        """Tras un 429: nada sale por esta ruta hasta `now + retry_after` (lo dice Discord)."""
+        self.tat = now + retry_after + (self.limit - 1) * self.interval
+
+
+# Dónde está un envío: en la cola, esperando su hueco en la ruta, aparcado
+# hasta que su carril libere un worker, o ejecutándose
+QUEUED, WAITING, PARKED, RUNNING = "queued", "waiting", "parked", "running"
+
+
+class _Outgoing:
+    __slots__ = ("lane", "route", "call", "future", "enqueued", "ready_at", "retries",
+                 "edit_key", "seq", "state")
+
+    def __init__(self, lane: Lane, route: str, call, future, enqueued: float, edit_key=None):
+        self.lane = lane
+        self.route = route
+        self.call = call
+        self.future = future
+        self.enqueued = enqueued
+        self.ready_at: Optional[float] = None
+        self.retries = 0
+        self.edit_key = edit_key
+        self.seq = -1          # entrada vigente en la cola (las anteriores se ignoran)
+        self.state = QUEUED
+
+
+def _silence(future: asyncio.Future) -> None:
+    # Envíos "disparar y olvidar": el error ya se registró en el log
+    if not future.cancelled():
+        future.exception()
+
+
+class OutboundDispatcher:
+    """Despacha los envíos a Discord por prioridad y respetando los límites por ruta."""
+
+    def __init__(self, workers: int = OUTBOUND_WORKERS, clock: Callable[[], float] = time.monotonic):
+        # Uno de los workers queda siempre libre para el carril interactivo
+        self.workers = max(2, workers)
+        self.background_limit = self.workers - 1
+        self.clock = clock
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._seq = itertools.count()
+        self._tasks: list = []
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._pending_edits: Dict[Any, _Outgoing] = {}
+        self._backlog: Dict[Lane, int] = {lane: 0 for lane in Lane}
+        self.lane_limits: Dict[Lane, int] = {
+            lane: max(1, min(self.background_limit, LANE_WORKER_LIMITS.get(lane, self.background_limit)))
+            for lane in Lane
+        }
+        self.lane_limits[Lane.INTERACTIVE] = self.workers
+        self._running: Dict[Lane, int] = {lane: 0 for lane in Lane}
+        self._background = 0   # workers ocupados por carriles no interactivos
+        self._parked: Dict[Lane, Deque[_Outgoing]] = {lane: deque() for lane in Lane}
+        self._next_sweep = 0.0
+
+    # ---------------------------------------------------------
+    # 🔹 Ciclo de vida
+    # ---------------------------------------------------------
+    def start(self) -> None:
+        if self._tasks:
+            return
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"outbound-{i}") for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    @property
+    def backlog(self) -> int:
+        return sum(self._backlog.values())
+
+    # ---------------------------------------------------------
+    # 📤 API de envío
+    # ---------------------------------------------------------
+    def submit(self, route: str, call: Callable[[], Awaitable[Any]],
+               lane: Lane = Lane.REMINDER, edit_key=None) -> asyncio.Future:
+        """Encola `call` (sin argumentos) por `route`. Devuelve un future con su resultado."""
+        self.start()
+
+        if edit_key is not None:
+            pending = self._pending_edits.get(edit_key)
+            if pending is not None:
+                # Ya hay una edición en cola para ese mensaje: solo cuenta la última
+                pending.call = call
+                if lane < pending.lane:
+                    # Sube de carril: el contador pasa al nuevo y se reencola con su prioridad
+                    if pending.state == PARKED:
+                        self._parked[pending.lane].remove(pending)
+                    self._backlog[pending.lane] -= 1
+                    self._backlog[lane] += 1
+                    pending.lane = lane
+                    self._publish_backlog()
+                    if pending.state in (QUEUED, PARKED):
+                        self._put(pending)
+                metrics.incr("outbound.coalesced")
+                return pending.future
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_silence)
+        item = _Outgoing(lane, route, call, future, self.clock(), edit_key)
+        if edit_key is not None:
+            self._pending_edits[edit_key] = item
+        self._backlog[lane] += 1
+        self._publish_backlog()
+        self._put(item)
+        return future
+
+    def send_channel(self, channel, *args, lane: Lane = Lane.PUBLICATION, **kwargs) -> asyncio.Future:
+        return self.submit(f"channel:{channel.id}", lambda: channel.send(*args, **kwargs), lane)
+
+    def send_dm(self, user, *args, lane: Lane = Lane.REMINDER, **kwargs) -> asyncio.Future:
+        return self.submit(f"dm:{user.id}", lambda: user.send(*args, **kwargs), lane)
+
+    def followup(self, interaction: discord.Interaction, *args, **kwargs) -> asyncio.Future:
+        return self.submit(
+            f"webhook:{interaction.application_id}:{interaction.token}",
+            lambda: interaction.followup.send(*args, **kwargs),
+            Lane.INTERACTIVE,
+        )
+
+    def edit_message(self, message, lane: Lane = Lane.PARTICIPANTS, **kwargs) -> asyncio.Future:
+        """Edita `message`; las ediciones aún en cola del mismo mensaje se fusionan."""
+        return self.submit(
+            f"channel:{message.channel.id}", lambda: message.edit(**kwargs), lane,
+            edit_key=("message", message.id),
+        )
+
+    # ---------------------------------------------------------
+    # ⚙️ Despacho
+    # ---------------------------------------------------------
+    def _put(self, item: _Outgoing) -> None:
+        item.seq = next(self._seq)
+        item.state = QUEUED
+        self._queue.put_nowait((item.lane, item.seq, item))
+
+    def _bucket(self, route: str) -> TokenBucket:
+        bucket = self._buckets.get(route)
+        if bucket is None:
+            bucket = self._buckets[route] = TokenBucket(*ROUTE_LIMITS[route.split(":", 1)[0]])
+        return bucket
+
+    def _has_slot(self, lane: Lane) -> bool:
+        if self._running[lane] >= self.lane_limits[lane]:
+            return False
+        return lane == Lane.INTERACTIVE or self._background < self.background_limit
+
+    def _unpark(self) -> None:
+        """Devuelve a la cola el primer envío aparcado (por prioridad) que ya cabe."""
+        for lane in Lane:
+            if self._parked[lane] and self._has_slot(lane):
+                self._put(self._parked[lane].popleft())
+                return
+
+    def _sweep_buckets(self, now: float) -> None:
+        """
+        Descarta los buckets sin reservas pendientes (`tat` ya pasado): uno
+        nuevo se comporta igual. Los límites adoptados de un 429 se pierden y
+        se vuelven a adoptar si hace falta.
+        """
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + BUCKET_SWEEP_INTERVAL
+        idle = [route for route, bucket in self._buckets.items() if bucket.tat < now]
+        for route in idle:
+            del self._buckets[route]
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            _, seq, item = await self._queue.get()
+            if seq != item.seq:
+                continue  # entrada sustituida (la edición cambió de carril)
+            now = self.clock()
+            self._sweep_buckets(now)
+
+            # Reservar hueco en la ruta; si hay que esperar, vuelve a la cola a su hora
+            if item.ready_at is None or item.ready_at > now:
+                if item.ready_at is None:
+                    wait = self._bucket(item.route).reserve(now)
+                    item.ready_at = now + wait
+                if item.ready_at > now:
+                    item.state = WAITING
+                    loop.call_later(item.ready_at - now, self._put, item)
+                    continue
+
+            # Carril (o cupo no interactivo) sin workers libres: se aparca hasta
+            # que termine otro envío
+            lane = item.lane
+            background = lane != Lane.INTERACTIVE
+            if not self._has_slot(lane):
+                item.state = PARKED
+                self._parked[lane].append(item)
+                continue
+
+            item.state = RUNNING
+            self._running[lane] += 1
+            self._background += background
+            try:
+                await self._execute(item)
+            finally:
+                self._running[lane] -= 1
+                self._background -= background
+                self._unpark()
+
+    async def _execute(self, item: _Outgoing) -> None:
+        if item.edit_key is not None and self._pending_edits.get(item.edit_key) is item:
+            del self._pending_edits[item.edit_key]
+
+        started = self.clock()
+        try:
+            result = await item.call()
+        except discord.RateLimited as e:
+            # discord.py no espera más de `max_ratelimit_timeout`: reintentar desde la cola
+            if item.retries < MAX_RETRIES:
+                self._on_rate_limited(item, e)
+                return
+            self._finish(item, started, error=e)
+        except discord.HTTPException as e:
+            if getattr(e, "status", None) == 429 and item.retries < MAX_RETRIES:
+                self._on_rate_limited(item, e)
+                return
+            self._finish(item, started, error=e)
+        except Exception as e:
+            self._finish(item, started, error=e)
+        else:
+            self._finish(item, started, result=result)
+
+    def _on_rate_limited(self, item: _Outgoing, error: discord.DiscordException) -> None:
+        """
+        429 que discord.py no absorbió (reintentos agotados o `RateLimited`):
+        el bucket adopta las cabeceras si vienen y el envío vuelve a la cola.
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None:
+            retry_after = float(headers.get("Retry-After") or headers.get("X-RateLimit-Reset-After") or 1.0)
+
+        bucket = self._bucket(item.route)
+        limit = headers.get("X-RateLimit-Limit")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if limit and reset_after:
+            bucket.configure(int(limit), float(reset_after))
+        bucket.penalize(self.clock(), float(retry_after))
+
+        item.retries += 1
+        item.ready_at = None
+        metrics.incr("outbound.retries")
+        logger.warning(f"⏳ 429 en {item.route}: reintento {item.retries} en {float(retry_after):.2f}s")
+        if item.edit_key is not None:
+            self._pending_edits.setdefault(item.edit_key, item)
+        self._put(item)
+
+    def _finish(self, item: _Outgoing, started: float, result=None, error: Optional[Exception] = None) -> None:
+        lane = item.lane
+        self._backlog[lane] -= 1
+        self._publish_backlog()
+
+        wait_ms = (started - item.enqueued) * 1000
+        metrics.incr(f"outbound.sent.{lane.name.lower()}")
+        metrics.incr(f"outbound.wait_ms.{lane.name.lower()}", wait_ms)
+        max_key = f"outbound.max_wait_ms.{lane.name.lower()}"
+        if wait_ms > metrics.get(max_key):
+            metrics.gauge(max_key, wait_ms)
+
+        if item.future.done():
+            return
+        if error is not None:
+            logger.warning(f"⚠️ Envío fallido en {item.route}: {error}")
+            item.future.set_exception(error)
+        else:
+            item.future.set_result(result)
+
+    def _publish_backlog(self) -> None:
+        metrics.gauge("outbound.backlog", self.backlog)
+        for lane, n in self._backlog.items():
+            metrics.gauge(f"outbound.backlog.{lane.name.lower()}", n)
+
+
+def get_dispatcher(client) -> OutboundDispatcher:
+    """Dispatcher asociado al cliente de Discord (se crea la primera vez)."""
+    dispatcher = getattr(client, "outbound", None)
+    if dispatcher is None:
+        dispatcher = OutboundDispatcher()
+        setattr(client, "outbound", dispatcher)
+    return dispatcher
+
+
+async def send_followup(interaction: discord.Interaction, *args, **kwargs):
+    """`interaction.followup.send` a través de la cola (carril interactivo)."""
+    return await get_dispatcher(interaction.client).followup(interaction, *args, **kwargs)
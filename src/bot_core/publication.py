@@ -0,0 +1,215 @@
+"""
+Archivo: publication.py
+Ubicación: src/bot_core/
+
+Descripción:
+Motor de publicación automática de eventos programados (`status='scheduled'`).
+Arranca desde `BotApp` y mantiene en memoria un min-heap de plazos
+(`DeadlineScheduler`) con el `publish_ts` de cada evento programado:
+
+- Al arrancar carga los plazos pendientes con una sola consulta sobre el
+  índice `idx_events_status_publish_ts`.
+- Escucha los cambios confirmados de `EventDB` (`schedule_event`,
+  `update_event`, inserciones y borrados) y actualiza el heap sin recargar.
+- Los cambios hechos por otros procesos le llegan por `ChangeFeed`
+  (`db.changes`): relee solo los eventos afectados.
+- Cuando vence un plazo llama a `EventDB.publish_event` y envía el anuncio al
+  canal `publish_channel_id` del evento. La escritura lleva el `fence` del
+  lease: si este proceso ya no es el líder, se descarta y no se anuncia.
+  Solo publica si el evento sigue programado dentro de la misma escritura;
+  si otro comando o proceso cambió su estado antes, no se anuncia.
+- Si la publicación falla (BD bloqueada u ocupada), el plazo se reprograma con
+  espera exponencial (`PUBLISH_RETRY_BASE` … `PUBLISH_RETRY_MAX` segundos).
+- Si `catchup_cutoff` está fijado, los plazos vencidos durante la parada del
+  bot (`publish_ts <= catchup_cutoff`) no se cargan: los reproduce
+  `DowntimeRecovery` mediante `publish_now`. Los que otro proceso mueve
+  después a una fecha anterior a `catchup_cutoff` se pasan a
+  `DowntimeRecovery.offer`, que aplica la misma política.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional, Set
+
+import discord
+
+from src.bot_core.catchup import PUBLICATION
+from src.bot_core.deadline_scheduler import DeadlineScheduler
+from src.bot_core.outbound import Lane, get_dispatcher
+from src.bot_core.registration import signup_view
+from src.database.leases import LeaseLost
+
+logger = logging.getLogger("Publication")
+
+# Espera antes de reintentar una publicación fallida (se duplica hasta el máximo)
+PUBLISH_RETRY_BASE = 5.0
+PUBLISH_RETRY_MAX = 600.0
+
+
+class PublicationScheduler:
+    """Publica los eventos programados cuando llega su `publish_datetime_utc`."""
+
+    def __init__(self, bot, db, clock=None):
+        self.bot = bot
+        self.db = db
+        self.scheduler = DeadlineScheduler(self._publish, name="publication", clock=clock)
+        self._listening = False
+        self._failures: Dict[int, int] = {}   # fallos seguidos por evento (espera exponencial)
+        # Plazos hasta este epoch los gestiona la recuperación de arranque
+        self.catchup_cutoff: Optional[int] = None
+        self.recovery = None   # DowntimeRecovery (lo asigna `attach`)
+        # Cercado de las escrituras (`LeaseFence` del líder, lo asigna BotApp)
+        self.fence = None
+
+    # ---------------------------------------------------------
+    # 🔹 Ciclo de vida
+    # ---------------------------------------------------------
+    async def start(self) -> None:
+        """Carga los plazos pendientes y arranca el bucle (idempotente)."""
+        if self.scheduler.running:
+            return
+        if not self._listening:
+            self.db.events.add_listener(self.on_event_changed)
+            changes = getattr(self.db, "changes", None)
+            if changes is not None:
+                changes.subscribe("event", self.on_changes)
+            self._listening = True
+        await self.load()
+        self.scheduler.start()
+        logger.info(f"🗓️ Publicación automática activa ({len(self.scheduler)} eventos programados).")
+
+    async def stop(self) -> None:
+        await self.scheduler.stop()
+
+    async def load(self) -> None:
+        """Carga los plazos de publicación pendientes (posteriores a `catchup_cutoff`)."""
+        floor = self.catchup_cutoff if self.catchup_cutoff is not None else -1
+        async with self.db.reader() as conn:
+            async with conn.execute("""
+                SELECT event_id, publish_ts FROM events
+                WHERE status = 'scheduled' AND publish_ts > ?;
+            """, (floor,)) as cur:
+                rows = await cur.fetchall()
+
+        self.scheduler.clear()
+        for event_id, publish_ts in rows:
+            self.scheduler.schedule(event_id, publish_ts)
+
+    # ---------------------------------------------------------
+    # 🔄 Cambios de agenda
+    # ---------------------------------------------------------
+    def on_event_changed(self, event_id: int, fields: Optional[Dict[str, Any]]) -> None:
+        """Observador de `EventDB`: mantiene el heap al día sin recargar."""
+        if fields is None:
+            self.scheduler.cancel(event_id)
+            return
+
+        status = fields.get("status")
+        if status is not None and status != "scheduled":
+            self.scheduler.cancel(event_id)
+            return
+
+        if "publish_ts" not in fields:
+            return
+        if status == "scheduled" or event_id in self.scheduler:
+            publish_ts = fields["publish_ts"]
+            if publish_ts is None:
+                self.scheduler.cancel(event_id)
+            else:
+                self.scheduler.schedule(event_id, publish_ts)
+
+    async def on_changes(self, event_ids: Optional[Set[int]]) -> None:
+        """Suscriptor de `ChangeFeed`: relee los eventos cambiados (None = recarga completa)."""
+        if not self.scheduler.running:
+            return
+        if event_ids is None:
+            await self.load()
+            return
+
+        ids = list(event_ids)
+        async with self.db.reader() as conn:
+            async with conn.execute(f"""
+                SELECT event_id, status, publish_ts FROM events
+                WHERE event_id IN ({",".join("?" * len(ids))});
+            """, ids) as cur:
+                rows = {event_id: (status, ts) for event_id, status, ts in await cur.fetchall()}
+
+        for event_id in ids:
+            status, publish_ts = rows.get(event_id, (None, None))
+            if status != "scheduled" or publish_ts is None:
+                self.scheduler.cancel(event_id)
+            elif self._is_catchup(event_id, publish_ts):
+                await self.recovery.offer(PUBLICATION, event_id, event_id, publish_ts)
+            else:
+                self.scheduler.schedule(event_id, publish_ts)
+
+    def _is_catchup(self, event_id: int, publish_ts: int) -> bool:
+        """Plazo de la ventana de recuperación que no está ya en el heap."""
+        return (self.recovery is not None and self.catchup_cutoff is not None
+                and publish_ts <= self.catchup_cutoff and event_id not in self.scheduler)
+
+    # ---------------------------------------------------------
+    # 📣 Publicación
+    # ---------------------------------------------------------
+    async def _publish(self, event_id: int, when: float) -> None:
+        try:
+            event = await self.db.events.get_event(event_id)
+            if not event or event["status"] != "scheduled":
+                self._failures.pop(event_id, None)
+                return
+
+            # El plazo pudo cambiar por otra vía (p. ej. SQL directo): reprogramar
+            publish_ts = event["publish_ts"]
+            if publish_ts is not None and publish_ts > self.scheduler.clock.now():
+                self.scheduler.schedule(event_id, publish_ts)
+                return
+
+            user_id = event["last_edited_by"] or event["created_by"]
+            published = await self.db.events.publish_event(event_id, user_id, fence=self.fence)
+        except LeaseLost as e:
+            logger.warning(f"⚠️ Publicación del evento {event_id} descartada: {e}")
+            return
+        except Exception as e:
+            # El plazo ya salió del heap: sin reprogramar, el evento no se publicaría
+            failures = self._failures[event_id] = self._failures.get(event_id, 0) + 1
+            delay = min(PUBLISH_RETRY_MAX, PUBLISH_RETRY_BASE * 2 ** (failures - 1))
+            logger.warning(f"⚠️ Publicación del evento {event_id} fallida ({e}); reintento en {delay:.0f}s.")
+            self.scheduler.schedule(event_id, self.scheduler.clock.now() + delay)
+            return
+
+        self._failures.pop(event_id, None)
+        if not published:
+            return   # otro comando o proceso cambió su estado antes
+        logger.info(f"📣 Evento {event_id} publicado automáticamente.")
+        await self._announce(event)
+
+    async def publish_now(self, event_id: int) -> None:
+        """Publica ya un evento con el plazo vencido (recuperación tras parada)."""
+        await self._publish(event_id, self.scheduler.clock.now())
+
+    async def _announce(self, event) -> None:
+        channel_id = event["publish_channel_id"]
+        if not channel_id:
+            return
+
+        channel = self.bot.get_channel(channel_id)
+        try:
+            if channel is None:
+                channel = await self.bot.fetch_channel(channel_id)
+
+            embed = discord.Embed(
+                title=f"📣 {event['title']}",
+                description=event["description"] or "",
+                color=discord.Color.green(),
+            )
+            if event["event_datetime_utc"]:
+                embed.add_field(
+                    name="🗓️ Fecha",
+                    value=f"<t:{event['event_ts']}:F>" if event["event_ts"] else event["event_datetime_utc"],
+                    inline=False,
+                )
+            await get_dispatcher(self.bot).send_channel(
+                channel, embed=embed, view=signup_view(event["event_id"]), lane=Lane.PUBLICATION)
+        except discord.DiscordException as e:
+            logger.warning(f"⚠️ No se pudo anunciar el evento {event['event_id']} en {channel_id}: {e}")
@@ -0,0 +1,339 @@
+"""
+Archivo: registration.py
+Ubicación: src/bot_core/
+
+Descripción:
+Motor del ciclo de vida de las inscripciones de cada evento:
+
+    closed → open → full → closed
+
+- Las transiciones por tiempo (`registration_open_utc` / `registration_close_utc`)
+  las disparan temporizadores de un `DeadlineScheduler` (un plazo por evento:
+  la siguiente transición), sin sondeo.
+- La transición a `full` (y de vuelta a `open` si alguien se da de baja) la
+  marca el número de inscritos frente a `max_drivers`.
+- Solo los eventos publicados (`status='active'`) pueden abrir inscripciones;
+  si no hay fecha de apertura, se abren al publicarse.
+- `open_events` es el conjunto en memoria de eventos con inscripción abierta:
+  al llegar un clic de inscripción la comprobación es O(1) y no relee el evento.
+- El estado se persiste en `events.registration_state` al cambiar. Al
+  arrancar (`load`) las transiciones pendientes de todos los eventos se
+  escriben juntas en una sola operación.
+- Los cambios de eventos e inscripciones hechos por otros procesos llegan por
+  `ChangeFeed` (`db.changes`) y recargan solo los eventos afectados, de modo
+  que `open_events` no se queda desfasado entre procesos.
+- Las altas de un mismo evento se serializan con `REGISTRATION_LOCK_STRIPES`
+  candados elegidos por `event_id`: la memoria de candados no crece con el
+  número de eventos.
+
+El botón de inscripción (`signup_view`) usa un `custom_id` estable
+(`crm:signup:<event_id>`) que se atiende desde `on_interaction`, por lo que
+sigue funcionando tras un reinicio del bot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import discord
+from discord import ui, ButtonStyle
+
+from src.bot_core.deadline_scheduler import DeadlineScheduler
+
+logger = logging.getLogger("Registration")
+
+OPEN, FULL, CLOSED = "open", "full", "closed"
+SIGNUP_PREFIX = "crm:signup:"
+
+# Campos de `events` que afectan a la ventana de inscripción
+_WATCHED_FIELDS = ("status", "reg_open_ts", "reg_close_ts", "max_drivers")
+REGISTRATION_LOCK_STRIPES = 64
+
+
+class RegistrationWindow:
+    """Datos mínimos de un evento para decidir su estado de inscripción."""
+
+    __slots__ = ("status", "open_ts", "close_ts", "max_drivers", "count", "state")
+
+    def __init__(self, status, open_ts, close_ts, max_drivers, count, state=CLOSED):
+        self.status = status
+        self.open_ts = open_ts
+        self.close_ts = close_ts
+        self.max_drivers = max_drivers
+        self.count = count
+        self.state = state or CLOSED
+
+    def desired_state(self, now: float) -> str:
+        if self.status != "active":
+            return CLOSED
+        if self.open_ts is not None and now < self.open_ts:
+            return CLOSED
+        if self.close_ts is not None and now >= self.close_ts:
+            return CLOSED
+        if self.max_drivers and self.count >= self.max_drivers:
+            return FULL
+        return OPEN
+
+    def next_transition(self, now: float) -> Optional[float]:
+        if self.status != "active":
+            return None
+        if self.open_ts is not None and now < self.open_ts:
+            return self.open_ts
+        if self.close_ts is not None and now < self.close_ts:
+            return self.close_ts
+        return None
+
+
+def signup_view(event_id: int) -> ui.View:
+    """Vista con el botón de inscripción de un evento (atendido por RegistrationEngine)."""
+    view = ui.View(timeout=None)
+    view.add_item(ui.Button(
+        label="📝 Inscribirse",
+        style=ButtonStyle.success,
+        custom_id=f"{SIGNUP_PREFIX}{event_id}",
+    ))
+    return view
+
+
+class RegistrationEngine:
+    """Gestiona las ventanas de inscripción y las altas de pilotos."""
+
+    def __init__(self, bot, db, clock=None, lock_stripes: int = REGISTRATION_LOCK_STRIPES):
+        self.bot = bot
+        self.db = db
+        self.scheduler = DeadlineScheduler(self._on_timer, name="registration", clock=clock)
+        self.open_events: Set[int] = set()
+        self._windows: Dict[int, RegistrationWindow] = {}
+        self._locks = [asyncio.Lock() for _ in range(max(1, lock_stripes))]
+        self._reloads: Set[asyncio.Task] = set()
+        self._listening = False
+
+    # ---------------------------------------------------------
+    # 🔹 Ciclo de vida
+    # ---------------------------------------------------------
+    async def start(self) -> None:
+        if self.scheduler.running:
+            return
+        if not self._listening:
+            self.db.events.add_listener(self.on_event_changed)
+            changes = getattr(self.db, "changes", None)
+            if changes is not None:
+                changes.subscribe("event", self.on_changes)
+                changes.subscribe("participants", self.on_changes)
+            self.bot.add_listener(self.on_interaction, "on_interaction")
+            self._listening = True
+        await self.load()
+        self.scheduler.start()
+        logger.info(f"📝 Inscripciones: {len(self.open_events)} eventos abiertos.")
+
+    async def stop(self) -> None:
+        await self.scheduler.stop()
+        if self._reloads:
+            await asyncio.gather(*self._reloads, return_exceptions=True)
+
+    async def load(self) -> None:
+        """Carga los eventos cuya inscripción está o puede llegar a estar abierta."""
+        now = self.scheduler.clock.now()
+        async with self.db.reader() as conn:
+            async with conn.execute("""
+                SELECT e.event_id, e.status, e.reg_open_ts, e.reg_close_ts, e.max_drivers,
+                       (SELECT COUNT(*) FROM participants p WHERE p.event_id = e.event_id),
+                       e.registration_state
+                FROM events e
+                WHERE (e.status = 'active' AND (e.reg_close_ts IS NULL OR e.reg_close_ts > ?))
+                   OR e.registration_state IN ('open', 'full');
+            """, (int(now),)) as cur:
+                rows = await cur.fetchall()
+
+        self._windows.clear()
+        self.open_events.clear()
+        self.scheduler.clear()
+        changes = []
+        for event_id, *window in rows:
+            self._windows[event_id] = RegistrationWindow(*window)
+            state = self._evaluate(event_id)
+            if state is not None:
+                changes.append((state, event_id))
+        await self._persist(changes)
+
+    async def _reload(self, event_id: int) -> None:
+        async with self.db.reader() as conn:
+            async with conn.execute("""
+                SELECT status, reg_open_ts, reg_close_ts, max_drivers,
+                       (SELECT COUNT(*) FROM participants WHERE event_id = ?),
+                       registration_state
+                FROM events WHERE event_id = ?;
+            """, (event_id, event_id)) as cur:
+                row = await cur.fetchone()
+
+        if row is None:
+            self._forget(event_id)
+            return
+        self._windows[event_id] = RegistrationWindow(*row)
+        await self._apply(event_id)
+
+    def _forget(self, event_id: int) -> None:
+        self._windows.pop(event_id, None)
+        self.open_events.discard(event_id)
+        self.scheduler.cancel(event_id)
+
+    # ---------------------------------------------------------
+    # 🔄 Transiciones
+    # ---------------------------------------------------------
+    async def _apply(self, event_id: int) -> None:
+        """Recalcula el estado del evento, lo persiste si cambia y programa el siguiente plazo."""
+        state = self._evaluate(event_id)
+        if state is not None:
+            await self._persist([(state, event_id)])
+
+    def _evaluate(self, event_id: int) -> Optional[str]:
+        """
+        Recalcula en memoria el estado del evento y programa el siguiente plazo.
+        Devuelve el nuevo estado si cambió (pendiente de persistir) o None.
+        """
+        window = self._windows.get(event_id)
+        if window is None:
+            return None
+        now = self.scheduler.clock.now()
+        state = window.desired_state(now)
+
+        if state == OPEN:
+            self.open_events.add(event_id)
+        else:
+            self.open_events.discard(event_id)
+
+        changed = state != window.state
+        if changed:
+            logger.info(f"📝 Evento {event_id}: inscripción {window.state} → {state}")
+            window.state = state
+
+        next_ts = window.next_transition(now)
+        if next_ts is None:
+            self.scheduler.cancel(event_id)
+            if state == CLOSED:
+                # Sin plazos pendientes: solo otro cambio del evento puede reabrirla
+                self._windows.pop(event_id, None)
+        else:
+            self.scheduler.schedule(event_id, next_ts)
+        return state if changed else None
+
+    async def _persist(self, changes: List[Tuple[str, int]]) -> None:
+        """Guarda los pares (estado, event_id) en `events.registration_state` en una escritura."""
+        if changes:
+            await self.db.submit_write(lambda conn: conn.executemany(
+                "UPDATE events SET registration_state = ? WHERE event_id = ?", changes))
+
+    async def _on_timer(self, event_id: int, when: float) -> None:
+        await self._apply(event_id)
+
+    def on_event_changed(self, event_id: int, fields: Optional[Dict[str, Any]]) -> None:
+        """Observador de `EventDB`: recarga solo el evento afectado."""
+        if fields is None:
+            self._forget(event_id)
+            return
+        if any(name in fields for name in _WATCHED_FIELDS):
+            task = asyncio.create_task(self._reload(event_id))
+            self._reloads.add(task)
+            task.add_done_callback(self._reloads.discard)
+
+    async def on_changes(self, event_ids: Optional[Set[int]]) -> None:
+        """Suscriptor de `ChangeFeed`: eventos o inscripciones cambiados en otros procesos."""
+        if not self.scheduler.running:
+            return
+        if event_ids is None:
+            await self.load()
+            return
+        for event_id in event_ids:
+            await self._reload(event_id)
+
+    # ---------------------------------------------------------
+    # 🙋 Altas y bajas
+    # ---------------------------------------------------------
+    def is_open(self, event_id: int) -> bool:
+        return event_id in self.open_events
+
+    async def register(self, event_id: int, user_id: int, name: Optional[str] = None) -> str:
+        """
+        Inscribe a `user_id`. Devuelve "ok", "already", "full" o "closed".
+        La comprobación de ventana abierta es en memoria; el cupo se vuelve a
+        verificar dentro de la transacción.
+        """
+        if event_id not in self.open_events:
+            window = self._windows.get(event_id)
+            return FULL if window is not None and window.state == FULL else CLOSED
+
+        async with self._locks[hash(event_id) % len(self._locks)]:
+            async def _op(conn):
+                async with conn.execute(
+                    "SELECT 1 FROM participants WHERE user_id = ? AND event_id = ?",
+                    (user_id, event_id),
+                ) as cur:
+                    if await cur.fetchone():
+                        return "already", None
+                cur = await conn.execute("""
+                    INSERT INTO participants (user_id, event_id, name, status)
+                    SELECT ?, ?, ?, 'confirmed'
+                    WHERE (SELECT COUNT(*) FROM participants WHERE event_id = ?)
+                          < COALESCE((SELECT NULLIF(max_drivers, 0) FROM events WHERE event_id = ?), 1 << 62)
+                """, (user_id, event_id, name, event_id, event_id))
+                async with conn.execute(
+                    "SELECT COUNT(*) FROM participants WHERE event_id = ?", (event_id,)
+                ) as c:
+                    count = (await c.fetchone())[0]
+                return ("ok" if cur.rowcount > 0 else FULL), count
+
+            result, count = await self.db.submit_write(_op)
+
+        window = self._windows.get(event_id)
+        if window is not None and count is not None:
+            window.count = count
+            await self._apply(event_id)
+        return result
+
+    async def unregister(self, event_id: int, user_id: int) -> bool:
+        async def _op(conn):
+            cur = await conn.execute(
+                "DELETE FROM participants WHERE user_id = ? AND event_id = ?", (user_id, event_id))
+            async with conn.execute(
+                "SELECT COUNT(*) FROM participants WHERE event_id = ?", (event_id,)
+            ) as c:
+                return cur.rowcount > 0, (await c.fetchone())[0]
+
+        removed, count = await self.db.submit_write(_op)
+        window = self._windows.get(event_id)
+        if window is not None:
+            window.count = count
+            await self._apply(event_id)
+        return removed
+
+    # ---------------------------------------------------------
+    # 🖱️ Botón de inscripción
+    # ---------------------------------------------------------
+    async def on_interaction(self, interaction: discord.Interaction) -> None:
+        if interaction.type != discord.InteractionType.component:
+            return
+        custom_id = (interaction.data or {}).get("custom_id", "")
+        if not custom_id.startswith(SIGNUP_PREFIX):
+            return
+
+        try:
+            event_id = int(custom_id[len(SIGNUP_PREFIX):])
+        except ValueError:
+            return
+
+        try:
+            result = await self.register(event_id, interaction.user.id, interaction.user.display_name)
+        except Exception as e:
+            # Sin respuesta, Discord mostraría "La interacción ha fallado"
+            logger.warning(f"⚠️ Error al inscribir a {interaction.user.id} en el evento {event_id}: {e}")
+            result = "error"
+        messages = {
+            "ok": "✅ Inscripción completada.",
+            "already": "ℹ️ Ya estabas inscrito en este evento.",
+            FULL: "⚠️ No quedan plazas disponibles.",
+            CLOSED: "🚫 Las inscripciones de este evento no están abiertas.",
+            "error": "❌ No se pudo completar la inscripción. Inténtalo de nuevo en unos segundos.",
+        }
+        await interaction.response.send_message(messages[result], ephemeral=True)
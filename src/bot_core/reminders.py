@@ -0,0 +1,228 @@
+"""
+Archivo: reminders.py
+Ubicación: src/bot_core/
+
+Descripción:
+Despachador de recordatorios persistidos en la tabla `reminders`.
+
+- Mantiene en un min-heap (`DeadlineScheduler`) solo los próximos `window`
+  recordatorios pendientes, leídos por (`fire_ts`, `reminder_id`) sobre el
+  índice `idx_reminders_status_fire`; nunca recorre la tabla `events`.
+- Cuando la ventana se vacía por debajo de un cuarto, carga la siguiente
+  página a partir de la última clave leída.
+- Los recordatorios nuevos con plazo dentro de la ventana se añaden al heap
+  al confirmarse (observador de `ReminderDB`); los creados por otros procesos
+  llegan por `ChangeFeed` (`db.changes`). Si las altas desbordan la ventana,
+  se descartan del heap los más lejanos (siguen pendientes en la BD).
+- Al vencer, el recordatorio se marca `sent` de forma condicional (solo si
+  seguía `pending` y el lease del líder sigue siendo nuestro, `fence`) y
+  después se envía al canal del evento y por MD a los inscritos, con un
+  máximo de `concurrency` envíos simultáneos, a través de la cola de salida
+  (`outbound`, carril de menor prioridad). Un recordatorio nunca se envía
+  dos veces.
+- Si `catchup_cutoff` está fijado, la ventana empieza después de ese epoch: los
+  vencidos durante la parada los reproduce `DowntimeRecovery` con `fire_now`.
+  Los que otro proceso crea después con fecha anterior a `catchup_cutoff` se
+  pasan a `DowntimeRecovery.offer`, que aplica la misma política.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List, Optional, Set, Tuple
+
+import discord
+
+from src.bot_core.catchup import REMINDER
+from src.bot_core.deadline_scheduler import DeadlineScheduler
+from src.bot_core.outbound import Lane, get_dispatcher
+from src.database.leases import LeaseLost
+
+logger = logging.getLogger("Reminders")
+
+REMINDER_WINDOW = 500
+REMINDER_CONCURRENCY = 10
+_MAX_ID = 2 ** 63 - 1
+
+
+class ReminderDispatcher:
+    """Envía los recordatorios pendientes cuando llega su `fire_ts`."""
+
+    def __init__(self, bot, db, window: int = REMINDER_WINDOW,
+                 concurrency: int = REMINDER_CONCURRENCY, clock=None):
+        self.bot = bot
+        self.db = db
+        self.window = max(1, window)
+        self.scheduler = DeadlineScheduler(self._on_due, name="reminders", clock=clock)
+        self._send_slots = asyncio.Semaphore(concurrency)
+        self._inflight: Set[asyncio.Task] = set()
+        self._listening = False
+
+        # Última clave cargada; None = aún no hay ventana. `_exhausted`: no quedan más en BD
+        self._last_key: Optional[Tuple[int, int]] = None
+        self._exhausted = False
+        self._refilling = False
+        # Plazos hasta este epoch los gestiona la recuperación de arranque
+        self.catchup_cutoff: Optional[int] = None
+        self.recovery = None   # DowntimeRecovery (lo asigna `attach`)
+        # Cercado de las escrituras (`LeaseFence` del líder, lo asigna BotApp)
+        self.fence = None
+
+        self.sent = 0
+        self.failed_sends = 0
+
+    # ---------------------------------------------------------
+    # 🔹 Ciclo de vida
+    # ---------------------------------------------------------
+    async def start(self) -> None:
+        if self.scheduler.running:
+            return
+        if not self._listening:
+            self.db.reminders.add_listener(self.on_reminders_added)
+            changes = getattr(self.db, "changes", None)
+            if changes is not None:
+                changes.subscribe("reminder", self.on_changes)
+            self._listening = True
+        await self.load()
+        self.scheduler.start()
+        logger.info(f"⏰ Recordatorios activos ({len(self.scheduler)} en ventana).")
+
+    async def stop(self) -> None:
+        await self.scheduler.stop()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    # ---------------------------------------------------------
+    # 🪟 Ventana de próximos recordatorios
+    # ---------------------------------------------------------
+    async def load(self) -> None:
+        """Vacía el heap y vuelve a cargar la primera página de pendientes."""
+        self.scheduler.clear()
+        self._exhausted = False
+        self._last_key = None if self.catchup_cutoff is None else (self.catchup_cutoff, _MAX_ID)
+        await self._refill()
+
+    async def _refill(self) -> None:
+        if self._exhausted or self._refilling:
+            return
+        self._refilling = True
+        try:
+            free = self.window - len(self.scheduler)
+            if free <= 0:
+                return
+            rows = await self.db.reminders.next_pending(self._last_key, limit=free)
+            for reminder_id, fire_ts in rows:
+                self.scheduler.schedule(reminder_id, fire_ts)
+            if rows:
+                self._last_key = (rows[-1][1], rows[-1][0])
+            self._exhausted = len(rows) < free
+        finally:
+            self._refilling = False
+
+    def _in_window(self, reminder_id: int, fire_ts: int) -> bool:
+        return self._exhausted or self._last_key is None or (fire_ts, reminder_id) <= self._last_key
+
+    def on_reminders_added(self, added: List[Tuple[int, int]]) -> None:
+        """Observador de `ReminderDB`: añade al heap los que caen dentro de la ventana."""
+        for reminder_id, fire_ts in added:
+            if self._in_window(reminder_id, fire_ts):
+                self.scheduler.schedule(reminder_id, fire_ts)
+                if self._last_key is None or (fire_ts, reminder_id) > self._last_key:
+                    self._last_key = (fire_ts, reminder_id)
+
+        if len(self.scheduler) > self.window:
+            # Ventana desbordada por altas (sin tope si la BD estaba agotada): se
+            # descartan los más lejanos, que siguen pendientes y vuelven con `_refill`
+            when, reminder_id = self.scheduler.trim(self.window)
+            self._last_key = (when, reminder_id)
+            self._exhausted = False
+
+    async def on_changes(self, reminder_ids: Optional[Set[int]]) -> None:
+        """Suscriptor de `ChangeFeed`: recordatorios creados por otros procesos."""
+        if not self.scheduler.running:
+            return
+        if reminder_ids is None:
+            await self.load()
+            return
+        pending = await self.db.reminders.pending(reminder_ids)
+        cutoff = self.catchup_cutoff
+        if self.recovery is not None and cutoff is not None:
+            overdue = [(rid, ts) for rid, ts in pending if ts <= cutoff and rid not in self.scheduler]
+            for reminder_id, fire_ts in overdue:
+                reminder = await self.db.reminders.get_reminder(reminder_id)
+                if reminder is not None:
+                    await self.recovery.offer(REMINDER, reminder_id, reminder["event_id"], fire_ts)
+            pending = [row for row in pending if row not in overdue]
+        self.on_reminders_added(pending)
+
+    # ---------------------------------------------------------
+    # 📣 Envío
+    # ---------------------------------------------------------
+    async def _on_due(self, reminder_id: int, when: float) -> None:
+        task = asyncio.create_task(self._fire(reminder_id))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+        if len(self.scheduler) < self.window // 4:
+            await self._refill()
+
+    async def fire_now(self, reminder_id: int) -> None:
+        """Envía ya un recordatorio vencido (recuperación tras parada)."""
+        await self._fire(reminder_id)
+
+    async def _fire(self, reminder_id: int) -> None:
+        try:
+            if not await self.db.reminders.mark_sent(reminder_id, fence=self.fence):
+                return  # ya enviado o eliminado junto con su evento
+            reminder = await self.db.reminders.get_reminder(reminder_id)
+            event = await self.db.events.get_event(reminder["event_id"]) if reminder else None
+            if not event:
+                return
+
+            text = self._format(reminder, event)
+            targets = []
+            channel_id = reminder["channel_id"] or event["participants_channel_id"] or event["publish_channel_id"]
+            if channel_id:
+                targets.append(self._send_channel(channel_id, text))
+            if reminder["notify_participants"]:
+                for user_id in await self._participants(event["event_id"]):
+                    targets.append(self._send_dm(user_id, text))
+
+            await asyncio.gather(*targets)
+            self.sent += 1
+        except LeaseLost as e:
+            logger.warning(f"⚠️ Recordatorio {reminder_id} no enviado: {e}")
+        except Exception as e:
+            logger.error(f"❌ Error al enviar el recordatorio {reminder_id}: {e}")
+
+    @staticmethod
+    def _format(reminder, event) -> str:
+        when = f"<t:{event['event_ts']}:R>" if event["event_ts"] else (event["event_datetime_utc"] or "")
+        label = f" ({reminder['label']})" if reminder["label"] else ""
+        return f"⏰ Recordatorio{label}: **{event['title']}** comienza {when}."
+
+    async def _participants(self, event_id: int) -> List[int]:
+        async with self.db.reader() as conn:
+            async with conn.execute(
+                "SELECT user_id FROM participants WHERE event_id = ?", (event_id,)
+            ) as cur:
+                return [r[0] for r in await cur.fetchall()]
+
+    async def _send_channel(self, channel_id: int, text: str) -> None:
+        async with self._send_slots:
+            try:
+                channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+                await get_dispatcher(self.bot).send_channel(channel, text, lane=Lane.REMINDER)
+            except discord.DiscordException as e:
+                self.failed_sends += 1
+                logger.warning(f"⚠️ No se pudo enviar el recordatorio al canal {channel_id}: {e}")
+
+    async def _send_dm(self, user_id: int, text: str) -> None:
+        async with self._send_slots:
+            try:
+                user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+                await get_dispatcher(self.bot).send_dm(user, text, lane=Lane.REMINDER)
+            except discord.DiscordException as e:
+                self.failed_sends += 1
+                logger.warning(f"⚠️ No se pudo enviar el recordatorio por MD a {user_id}: {e}")
@@ -0,0 +1,156 @@
+"""
+Archivo: retention.py
+Ubicación: src/bot_core/
+
+Descripción:
+Purga en segundo plano de eventos archivados caducados (`archive_expires_at`).
+
+- Duerme hasta la próxima caducidad (`MIN(archive_expires_ts)` sobre el índice
+  `idx_events_status_archive_ts`) en lugar de ejecutarse "bajo demanda".
+- Al despertar borra por bloques pequeños (`Database.purge_archived_chunk`),
+  cediendo el bucle entre bloques para que los comandos interactivos sigan
+  usando el escritor sin esperas largas.
+- Los borrados se propagan a `participants` y `reminders`.
+- Cuando `archive_event` / `update_event` fijan una caducidad más próxima, el
+  observador de `EventDB` adelanta el despertador; los cambios de otros
+  procesos (`ChangeFeed`) hacen releer la próxima caducidad.
+- Cada bloque lleva el `fence` del lease: si este proceso ya no es el líder,
+  la purga se detiene sin borrar nada.
+
+Métricas (`src.utils.metrics`):
+- retention.events_purged / retention.participants_purged /
+  retention.reminders_purged: contadores acumulados.
+- retention.runs: ejecuciones de la purga.
+- retention.failures: purgas fallidas; se reintentan con espera exponencial
+  (`PURGE_RETRY_BASE` … `PURGE_RETRY_MAX` segundos).
+- retention.next_expiry_ts: medidor con la próxima caducidad programada.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+from src.bot_core.deadline_scheduler import DeadlineScheduler
+from src.database.db import PURGE_CHUNK_SIZE
+from src.database.leases import LeaseLost
+from src.utils.metrics import metrics
+
+logger = logging.getLogger("Retention")
+
+PURGE_KEY = "archived_events"
+# Pausa entre bloques para dejar paso a otras escrituras (segundos)
+PURGE_CHUNK_PAUSE = 0.05
+# Espera antes de reintentar una purga fallida (se duplica hasta el máximo)
+PURGE_RETRY_BASE = 5.0
+PURGE_RETRY_MAX = 600.0
+
+
+class RetentionJob:
+    """Purga incremental de eventos archivados caducados."""
+
+    def __init__(self, db, chunk_size: Optional[int] = None,
+                 chunk_pause: float = PURGE_CHUNK_PAUSE, clock=None):
+        self.db = db
+        self.chunk_size = chunk_size or PURGE_CHUNK_SIZE
+        self.chunk_pause = chunk_pause
+        self.scheduler = DeadlineScheduler(self._purge, name="retention", clock=clock)
+        self._listening = False
+        self._failures = 0   # fallos seguidos (espera exponencial)
+        # Cercado de las escrituras (`LeaseFence` del líder, lo asigna BotApp)
+        self.fence = None
+
+    async def start(self) -> None:
+        if self.scheduler.running:
+            return
+        if not self._listening:
+            self.db.events.add_listener(self.on_event_changed)
+            changes = getattr(self.db, "changes", None)
+            if changes is not None:
+                changes.subscribe("event", self.on_changes)
+            self._listening = True
+        await self._schedule_next()
+        self.scheduler.start()
+
+    async def stop(self) -> None:
+        await self.scheduler.stop()
+
+    # ---------------------------------------------------------
+    # ⏰ Agenda
+    # ---------------------------------------------------------
+    async def _schedule_next(self) -> None:
+        next_ts = await self.db.next_archive_expiry()
+        if next_ts is None:
+            self.scheduler.cancel(PURGE_KEY)
+        else:
+            self.scheduler.schedule(PURGE_KEY, next_ts)
+        metrics.gauge("retention.next_expiry_ts", next_ts or 0)
+
+    def on_event_changed(self, event_id: int, fields: Optional[Dict[str, Any]]) -> None:
+        """Adelanta la purga si un evento archivado caduca antes de lo previsto."""
+        expires_ts = (fields or {}).get("archive_expires_ts")
+        if expires_ts is None:
+            return
+        current = self.scheduler.deadline(PURGE_KEY)
+        if current is None or expires_ts < current:
+            self.scheduler.schedule(PURGE_KEY, expires_ts)
+            metrics.gauge("retention.next_expiry_ts", expires_ts)
+
+    async def on_changes(self, event_ids: Optional[Set[int]]) -> None:
+        """Suscriptor de `ChangeFeed`: relee la próxima caducidad (salvo en espera de reintento)."""
+        if self.scheduler.running and not self._failures:
+            await self._schedule_next()
+
+    # ---------------------------------------------------------
+    # 🧹 Purga por bloques
+    # ---------------------------------------------------------
+    async def _purge(self, key, when: float) -> None:
+        now_ts = int(self.scheduler.clock.now())
+        totals = {"events": 0, "participants": 0, "reminders": 0}
+        started = time.perf_counter()
+
+        try:
+            while True:
+                counts = await self.db.purge_archived_chunk(now_ts, self.chunk_size, fence=self.fence)
+                for table, n in counts.items():
+                    totals[table] += n
+                    metrics.incr(f"retention.{table}_purged", n)
+                if counts["events"] < self.chunk_size:
+                    break
+                # Ceder el escritor a los comandos interactivos entre bloques
+                await asyncio.sleep(self.chunk_pause)
+        except LeaseLost as e:
+            # Ya no somos el líder: el nuevo retoma la purga
+            logger.warning(f"⚠️ Purga de archivados detenida: {e}")
+            return
+        except Exception as e:
+            # BD bloqueada u ocupada: reintentar más tarde en lugar de parar la purga
+            self._failures += 1
+            delay = min(PURGE_RETRY_MAX, PURGE_RETRY_BASE * 2 ** (self._failures - 1))
+            metrics.incr("retention.failures")
+            logger.warning(f"⚠️ Purga de archivados fallida ({e}); reintento en {delay:.0f}s.")
+            self.scheduler.schedule(PURGE_KEY, self.scheduler.clock.now() + delay)
+            return
+        finally:
+            metrics.incr("retention.runs")
+            if totals["events"]:
+                logger.info(
+                    f"🧹 Purgados {totals['events']} eventos archivados "
+                    f"({totals['participants']} inscripciones, {totals['reminders']} recordatorios) "
+                    f"en {time.perf_counter() - started:.2f}s."
+                )
+
+        self._failures = 0
+        await self._reschedule()
+
+    async def _reschedule(self) -> None:
+        """Programa la siguiente purga; si ni eso se puede leer, reintenta con espera."""
+        try:
+            await self._schedule_next()
+        except Exception as e:
+            self._failures += 1
+            delay = min(PURGE_RETRY_MAX, PURGE_RETRY_BASE * 2 ** (self._failures - 1))
+            logger.warning(f"⚠️ No se pudo leer la próxima caducidad ({e}); reintento en {delay:.0f}s.")
+            self.scheduler.schedule(PURGE_KEY, self.scheduler.clock.now() + delay)
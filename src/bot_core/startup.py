@@ -7,7 +7,8 @@ Funciones de arranque de la aplicación:
   - carga configuración
   - arranca logging
   - prepara base de datos
-  - crea instancia de BotApp
+  - crea instancia de BotApp (los plazos vencidos durante la parada los busca
+    el proceso líder al ganar el lease, ver `catchup.py`)
 """
 
 from __future__ import annotations
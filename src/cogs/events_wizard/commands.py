@@ -7,20 +7,26 @@ Define los comandos principales relacionados con creación y gestión de eventos
 
 Incluye:
 1️⃣ /create_event → inicia el Events Wizard (flujo modular actual)
-2️⃣ /list_events → consulta eventos (activos, borradores, archivados)
+2️⃣ /list_events → consulta paginada de eventos (activos, borradores, archivados)
 3️⃣ /delete_event → elimina un evento
 4️⃣ /archive_event → archiva un evento
 5️⃣ /restore_event → restaura un evento
+6️⃣ /create_series → genera las rondas de una liga/campeonato desde un evento plantilla
 
 Toda la edición avanzada y programación se gestiona ahora mediante:
 - Scheduler Wizard
-- EventWizardSession (sesiones en memoria)
+- EventWizardSession (sesiones en memoria, persistidas en diferido)
 """
 
+import time
+from zoneinfo import ZoneInfoNotFoundError
+
 import discord
 from discord.ext import commands
 from discord import app_commands
+from src.utils.event_series import RecurrenceRule, create_series
 from src.cogs.wizards_shared.handlers.event_creation_handler import EventCreationHandler
+from src.cogs.wizards_shared.views.event_list_view import EventListView
 
 
 # ========================================================================
@@ -68,31 +74,19 @@ class EventManagementCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    # 🔹 /list_events — Listado sencillo por estado
+    # 🔹 /list_events — Listado paginado por estado
     @app_commands.command(name="list_events", description="Muestra eventos por estado.")
     async def list_events(self, interaction: discord.Interaction, status: str):
-        db = self.bot.db.events
-        events = await db.list_events(interaction.guild_id, status=status)
+        view = EventListView(self.bot.db.events, interaction.guild_id, status, interaction.user.id)
+        page = await view.load()
 
-        if not events:
+        if not page.items:
             return await interaction.response.send_message(
                 f"⚠️ No hay eventos con estado **{status}**.",
                 ephemeral=True,
             )
 
-        embed = discord.Embed(
-            title=f"Eventos — {status.upper()}",
-            color=discord.Color.blurple(),
-        )
-
-        for ev in events:
-            embed.add_field(
-                name=f"📝 {ev['title']}",
-                value=f"ID: `{ev['event_id']}`\nCreado: {ev['created_at'][:16]}",
-                inline=False
-            )
-
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=view.build_embed(), view=view, ephemeral=True)
 
     # 🔹 /delete_event
     @app_commands.command(name="delete_event", description="Elimina un evento.")
@@ -151,9 +145,83 @@ class EventManagementCog(commands.Cog):
         )
 
 
+# ========================================================================
+# 🌟 3 — SERIES (LIGAS Y CAMPEONATOS)
+# ========================================================================
+class EventSeriesCog(commands.Cog):
+    """Comando `/create_series`: todas las rondas en una sola operación."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="create_series",
+        description="Genera las rondas de una liga o campeonato a partir de un evento plantilla."
+    )
+    @app_commands.describe(
+        template_id="ID del evento que sirve de plantilla",
+        recurrence="Periodicidad de las rondas",
+        rounds="Número de rondas (semanal / quincenal)",
+        start="Hora local de la primera ronda (AAAA-MM-DD HH:MM); por defecto, la de la plantilla",
+        dates="Fechas concretas separadas por comas (AAAA-MM-DD HH:MM, ...)",
+    )
+    @app_commands.choices(recurrence=[
+        app_commands.Choice(name="Semanal", value="weekly"),
+        app_commands.Choice(name="Quincenal", value="biweekly"),
+        app_commands.Choice(name="Fechas concretas", value="dates"),
+    ])
+    async def create_series(
+        self,
+        interaction: discord.Interaction,
+        template_id: int,
+        recurrence: app_commands.Choice[str],
+        rounds: int = 0,
+        start: str = None,
+        dates: str = None,
+    ):
+        db = getattr(self.bot, "db", None)
+        if db is None:
+            return await interaction.response.send_message(
+                "⚠️ La base de datos no está disponible.",
+                ephemeral=True
+            )
+        if interaction.user.id != interaction.guild.owner_id and not (
+            await db.is_authorized(interaction.guild.id, "events", interaction.user)
+        ):
+            return await interaction.response.send_message(
+                "🚫 No tienes permisos para crear eventos.",
+                ephemeral=True
+            )
+
+        template = await db.events.get_event(template_id)
+        if not template or template["guild_id"] != interaction.guild.id:
+            return await interaction.response.send_message(
+                "❌ No existe ningún evento con ese ID en este servidor.",
+                ephemeral=True
+            )
+
+        started = time.perf_counter()
+        try:
+            rule = RecurrenceRule(
+                kind=recurrence.value,
+                count=rounds,
+                dates=tuple(d.strip() for d in (dates or "").split(",") if d.strip()),
+            )
+            ids = await create_series(db, template_id, rule, interaction.user.id, start=start)
+        except (ValueError, ZoneInfoNotFoundError) as e:
+            return await interaction.response.send_message(f"⚠️ {e}", ephemeral=True)
+
+        await interaction.response.send_message(
+            f"🏁 Serie **{template['title']}** creada: {len(ids)} rondas "
+            f"(IDs {ids[0]}–{ids[-1]}) en {time.perf_counter() - started:.2f}s.",
+            ephemeral=True
+        )
+
+
 # ========================================================================
 # 🔹 REGISTRO
 # ========================================================================
 async def setup(bot: commands.Bot):
     await bot.add_cog(EventCreationCog(bot))
     await bot.add_cog(EventManagementCog(bot))
+    await bot.add_cog(EventSeriesCog(bot))
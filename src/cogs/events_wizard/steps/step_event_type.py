@@ -22,6 +22,7 @@ from discord import ui, Interaction, SelectOption
 from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -48,9 +49,9 @@ class EventTypeSelect(ui.Select):
         event_type = self.values[0]
 
         # Guardar tipo de evento en la sesión
-        EventWizardSession.update(
+        await EventWizardSession.update(
             interaction.user.id, "event_type", event_type)
-        EventWizardSession.update(interaction.user.id, "championship_id", None)
+        await EventWizardSession.update(interaction.user.id, "championship_id", None)
 
         await interaction.response.send_message(
             f"✅ Tipo de evento seleccionado: **{event_type.capitalize()}**",
@@ -87,7 +88,8 @@ async def show_event_type_step(interaction: Interaction):
 
     view = StepEventTypeView(user_id)
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{header}\n"
         "Selecciona el tipo de evento antes de continuar con la configuración.",
         view=view,
@@ -96,7 +98,8 @@ async def show_event_type_step(interaction: Interaction):
 
     # Navegación estándar
     nav = WizardNavigationView(user_id, current_step=2)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones para navegar entre pasos.",
         view=nav,
         ephemeral=True,
@@ -25,6 +25,7 @@ from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.database.db import Database
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -69,7 +70,9 @@ class PublishButton(ui.Button):
         now = datetime.now(timezone.utc)
 
         try:
-            data.update({
+            # Vista de solo lectura: una única copia con los campos finales
+            event = {
+                **data,
                 "guild_id": interaction.guild_id,
                 "created_by": interaction.user.id,
                 "is_published": 1,
@@ -77,10 +80,10 @@ class PublishButton(ui.Button):
                 "published_at": now.isoformat(),
                 "last_edited_by": interaction.user.id,
                 "last_edited_date": now.isoformat(),
-            })
+            }
 
-            await db.events.insert_event(data)
-            EventWizardSession.end(user_id)
+            await db.events.insert_event(event)
+            await EventWizardSession.end(user_id)
 
             print(
                 f"[EVENT] Evento publicado: {data.get('title', 'Sin título')}")
@@ -116,17 +119,19 @@ class SaveDraftButton(ui.Button):
         now = datetime.now(timezone.utc)
 
         try:
-            data.update({
+            # Vista de solo lectura: una única copia con los campos finales
+            event = {
+                **data,
                 "guild_id": interaction.guild_id,
                 "created_by": interaction.user.id,
                 "is_published": 0,
                 "status": "draft",
                 "last_edited_by": interaction.user.id,
                 "last_edited_date": now.isoformat(),
-            })
+            }
 
-            await db.events.insert_event(data)
-            EventWizardSession.end(user_id)
+            await db.events.insert_event(event)
+            await EventWizardSession.end(user_id)
 
             print(
                 f"[EVENT] Borrador guardado: {data.get('title', 'Sin título')}")
@@ -168,7 +173,7 @@ class ScheduleButton(ui.Button):
             await start_scheduler_for_current_event(interaction)
         except Exception as e:
             # Fallback seguro en caso de error durante la importación
-            EventWizardSession.update(user_id, "intent_to_schedule", True)
+            await EventWizardSession.update(user_id, "intent_to_schedule", True)
             await interaction.response.send_message(
                 f"⚠️ No se pudo iniciar el planificador automáticamente.\n"
                 f"Error: `{e}`\n"
@@ -198,7 +203,9 @@ class ArchiveButton(ui.Button):
         expiry = now + timedelta(days=30)
 
         try:
-            data.update({
+            # Vista de solo lectura: una única copia con los campos finales
+            event = {
+                **data,
                 "guild_id": interaction.guild_id,
                 "created_by": interaction.user.id,
                 "is_published": 0,
@@ -207,10 +214,10 @@ class ArchiveButton(ui.Button):
                 "archive_expires_at": expiry.isoformat(),
                 "last_edited_by": interaction.user.id,
                 "last_edited_date": now.isoformat(),
-            })
+            }
 
-            await db.events.insert_event(data)
-            EventWizardSession.end(user_id)
+            await db.events.insert_event(event)
+            await EventWizardSession.end(user_id)
 
             print(
                 f"[EVENT] Evento archivado: {data.get('title', 'Sin título')}")
@@ -236,7 +243,7 @@ class CancelButton(ui.Button):
         super().__init__(label="❌ Cancelar", style=ButtonStyle.danger)
 
     async def callback(self, interaction: Interaction):
-        EventWizardSession.end(interaction.user.id)
+        await EventWizardSession.end(interaction.user.id)
         print(f"[SESSION] Wizard cancelado por {interaction.user.name}")
         await interaction.response.send_message("🛑 Creación de evento cancelada.", ephemeral=True)
 
@@ -247,7 +254,7 @@ class CancelButton(ui.Button):
 async def show_finalize_step(interaction: Interaction):
     """Muestra el resumen del evento y las opciones finales."""
     user_id = interaction.user.id
-    data = EventWizardSession.get(user_id)
+    data = await EventWizardSession.load(user_id)
     if not data:
         return await interaction.response.send_message(
             "⚠️ No se encontró información del evento actual.", ephemeral=True
@@ -276,7 +283,8 @@ async def show_finalize_step(interaction: Interaction):
     embed.set_footer(
         text="Revisa toda la información antes de publicar o guardar el evento.")
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"🧾 {event_step_header(6, 'Revisión y publicación del evento')}\n"
         "Verifica que todos los datos sean correctos antes de continuar:",
         embed=embed,
@@ -284,7 +292,8 @@ async def show_finalize_step(interaction: Interaction):
         ephemeral=True,
     )
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Fin del asistente — revisa o retrocede si necesitas cambios.",
         view=WizardNavigationView(interaction.user.id, current_step=6),
         ephemeral=True,
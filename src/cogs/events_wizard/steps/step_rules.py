@@ -25,6 +25,7 @@ from discord import ui, Interaction, SelectOption
 from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -74,7 +75,7 @@ class RulesModal(ui.Modal, title="📜 Normas del evento"):
         rules = [r.value.strip() for r in [self.rule_1, self.rule_2,
                                            self.rule_3, self.rule_4, self.rule_5] if r.value.strip()]
         formatted = "\n".join([f"• {r}" for r in rules])
-        EventWizardSession.update(self.user_id, "rules_text", formatted)
+        await EventWizardSession.update(self.user_id, "rules_text", formatted)
         await interaction.response.send_message("✅ Reglas guardadas correctamente.", ephemeral=True)
 
 
@@ -139,8 +140,8 @@ class RegulationExternalModal(ui.Modal, title="🌐 Enlace al reglamento (HTTPS)
         if not url.startswith("https://"):
             await interaction.response.send_message("⚠️ Solo se permiten enlaces HTTPS.", ephemeral=True)
             return
-        EventWizardSession.update(self.user_id, "rules_attachment_url", url)
-        EventWizardSession.update(self.user_id, "rules_discord_channel", None)
+        await EventWizardSession.update(self.user_id, "rules_attachment_url", url)
+        await EventWizardSession.update(self.user_id, "rules_discord_channel", None)
         await interaction.response.send_message(f"✅ Enlace guardado correctamente: {url}", ephemeral=True)
 
 
@@ -169,9 +170,9 @@ class ChannelSelectDropdown(ui.Select):
                 if ch.type in (discord.ChannelType.text, discord.ChannelType.voice)
             ])
         channel = interaction.guild.get_channel(int(self.values[0]))
-        EventWizardSession.update(
+        await EventWizardSession.update(
             self.user_id, "rules_discord_channel", channel.id)
-        EventWizardSession.update(self.user_id, "rules_attachment_url", None)
+        await EventWizardSession.update(self.user_id, "rules_attachment_url", None)
         await interaction.response.send_message(f"✅ Canal seleccionado: {channel.mention}", ephemeral=True)
 
 
@@ -217,8 +218,8 @@ class BriefingSelect(ui.Select):
                 ephemeral=True
             )
         else:
-            EventWizardSession.update(self.user_id, "has_briefing", False)
-            EventWizardSession.update(
+            await EventWizardSession.update(self.user_id, "has_briefing", False)
+            await EventWizardSession.update(
                 self.user_id,
                 "briefing_notice",
                 "✅ No está estipulada una sesión de briefing previa al evento. "
@@ -251,8 +252,8 @@ class BriefingOffsetSelect(ui.Select):
 
     async def callback(self, interaction: Interaction):
         offset = int(self.values[0])
-        EventWizardSession.update(self.user_id, "has_briefing", True)
-        EventWizardSession.update(
+        await EventWizardSession.update(self.user_id, "has_briefing", True)
+        await EventWizardSession.update(
             self.user_id, "briefing_offset_minutes", offset)
         await interaction.response.send_message(f"✅ El briefing se realizará {offset} minutos antes del evento.", ephemeral=True)
 
@@ -267,7 +268,7 @@ class BriefingTypeSelect(ui.Select):
         super().__init__(placeholder="Selecciona el tipo de briefing", options=options)
 
     async def callback(self, interaction: Interaction):
-        EventWizardSession.update(
+        await EventWizardSession.update(
             self.user_id, "briefing_type", self.values[0])
         await interaction.response.send_message(f"✅ Tipo de briefing: {self.values[0]}", ephemeral=True)
 
@@ -288,7 +289,7 @@ class BriefingChannelSelect(ui.Select):
                 if ch.type in (discord.ChannelType.text, discord.ChannelType.voice)
             ])
         channel = interaction.guild.get_channel(int(self.values[0]))
-        EventWizardSession.update(
+        await EventWizardSession.update(
             self.user_id, "briefing_channel_id", channel.id)
         await interaction.response.send_message(f"✅ Canal de briefing seleccionado: {channel.mention}", ephemeral=True)
 
@@ -329,10 +330,10 @@ class SkinsSelect(ui.Select):
 
     async def callback(self, interaction: Interaction):
         if self.values[0] == "yes":
-            EventWizardSession.update(self.user_id, "allow_custom_skins", True)
+            await EventWizardSession.update(self.user_id, "allow_custom_skins", True)
             await interaction.response.send_modal(SkinsModal(self.user_id))
         else:
-            EventWizardSession.update(
+            await EventWizardSession.update(
                 self.user_id, "allow_custom_skins", False)
             await interaction.response.send_message("✅ Skins personalizadas deshabilitadas.", ephemeral=True)
 
@@ -354,9 +355,9 @@ class SkinsModal(ui.Modal, title="🎨 Información de skins personalizadas"):
         self.user_id = user_id
 
     async def on_submit(self, interaction: Interaction):
-        EventWizardSession.update(
+        await EventWizardSession.update(
             self.user_id, "skins_url", self.skins_url.value.strip())
-        EventWizardSession.update(
+        await EventWizardSession.update(
             self.user_id, "skins_filename", self.skins_filename.value.strip())
         await interaction.response.send_message("✅ Información de skins guardada correctamente.", ephemeral=True)
 
@@ -367,7 +368,8 @@ class SkinsModal(ui.Modal, title="🎨 Información de skins personalizadas"):
 async def show_rules_step(interaction: Interaction):
     """Lanza el paso 5 — Reglas, reglamento, briefing y skins."""
     view = StepRulesView(interaction.user.id)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(5, 'Normas, reglamento y configuraciones especiales')}\n"
         "Configura las normas, reglamento, briefing y skins personalizadas del evento.",
         view=view,
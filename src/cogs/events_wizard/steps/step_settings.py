@@ -13,6 +13,7 @@ from discord import ui, Interaction
 from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -97,7 +98,7 @@ class StepSettingsModal(ui.Modal, title="⚙️ Configuración técnica del even
         }
 
         for key, value in data.items():
-            EventWizardSession.update(user_id, key, value)
+            await EventWizardSession.update(user_id, key, value)
 
         print(
             f"[STEP 4] Configuración técnica guardada para user_id={user_id}")
@@ -122,7 +123,8 @@ async def show_settings_step(interaction: Interaction):
     print(
         f"[STEP 4] Usuario {interaction.user.name} accedió a la configuración técnica del evento.")
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(4, 'Configuración técnica del evento')}\n"
         "Define los parámetros técnicos del evento antes de continuar:",
         ephemeral=True
@@ -132,7 +134,8 @@ async def show_settings_step(interaction: Interaction):
     await interaction.response.send_modal(modal)
 
     view_nav = WizardNavigationView(interaction.user.id, current_step=4)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para revisar o continuar.",
         view=view_nav,
         ephemeral=True
@@ -41,7 +41,7 @@ class StepTitleModal(discord.ui.Modal, title="📝 Título del evento"):
 
         # Guardar título en la sesión del wizard
         user_id = interaction.user.id
-        EventWizardSession.update(user_id, "title", title)
+        await EventWizardSession.update(user_id, "title", title)
 
         await interaction.response.send_message(
             f"{event_step_header(1, 'Título del evento')}\n"
@@ -20,6 +20,7 @@ from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
 from src.cogs.tracks_wizard import handlers as track_handlers
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -48,13 +49,13 @@ class TrackManualModal(ui.Modal, title="🏁 Registrar circuito manual"):
         self.user_id = user_id
 
     async def on_submit(self, interaction: Interaction):
-        EventWizardSession.update(
+        await EventWizardSession.update(
             self.user_id, "track_name", self.track_name.value.strip())
-        EventWizardSession.update(
+        await EventWizardSession.update(
             self.user_id, "track_variant", self.track_variant.value.strip() or "N/A")
-        EventWizardSession.update(self.user_id, "track_description",
+        await EventWizardSession.update(self.user_id, "track_description",
                                   self.track_description.value.strip() or "Sin descripción.")
-        EventWizardSession.update(self.user_id, "track_list_id", None)
+        await EventWizardSession.update(self.user_id, "track_list_id", None)
 
         await interaction.response.send_message(
             f"{event_step_header(3, 'Selección de circuito')}\n"
@@ -89,12 +90,12 @@ class TrackListSelect(ui.Select):
         list_name = next(
             o.label for o in self.options if o.value == str(list_id))
 
-        EventWizardSession.update(
+        await EventWizardSession.update(
             interaction.user.id, "track_list_id", list_id)
-        EventWizardSession.update(
+        await EventWizardSession.update(
             interaction.user.id, "track_list_name", list_name)
-        EventWizardSession.update(interaction.user.id, "track_name", None)
-        EventWizardSession.update(interaction.user.id, "track_variant", None)
+        await EventWizardSession.update(interaction.user.id, "track_name", None)
+        await EventWizardSession.update(interaction.user.id, "track_variant", None)
 
         tracks = await track_handlers.get_tracks_in_list(list_id)
         if not tracks:
@@ -127,7 +128,7 @@ class TrackIndividualSelect(ui.Select):
         self.view_ref = parent_view
 
     async def callback(self, interaction: Interaction):
-        EventWizardSession.update(
+        await EventWizardSession.update(
             interaction.user.id, "track_selected_items", self.values)
         await interaction.response.send_message(
             f"✅ Seleccionados: {', '.join(self.values)}",
@@ -203,7 +204,8 @@ async def show_track_step(interaction: Interaction):
 
     view = StepTrackView(user_id, lists, text_filled)
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(3, 'Selección de circuito')}\n"
         "Puedes escribir el circuito manualmente o seleccionar desde una lista guardada.",
         view=view,
@@ -212,7 +214,8 @@ async def show_track_step(interaction: Interaction):
 
     # Navegación estándar
     nav = WizardNavigationView(user_id, current_step=3)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para avanzar o retroceder.",
         view=nav,
         ephemeral=True
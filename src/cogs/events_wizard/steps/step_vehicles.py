@@ -14,6 +14,7 @@ from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
 from src.cogs.vehicles_wizard import handlers as vehicle_handlers
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -36,9 +37,9 @@ class VehicleTextModal(ui.Modal, title="🚗 Añadir coches manualmente"):
     async def on_submit(self, interaction: Interaction):
         """Guarda la lista de vehículos escrita manualmente."""
         text = self.vehicle_text.value.strip()
-        EventWizardSession.update(self.user_id, "vehicle_text", text)
-        EventWizardSession.update(self.user_id, "vehicle_list_id", None)
-        EventWizardSession.update(
+        await EventWizardSession.update(self.user_id, "vehicle_text", text)
+        await EventWizardSession.update(self.user_id, "vehicle_list_id", None)
+        await EventWizardSession.update(
             self.user_id, "vehicle_selected_models", None)
 
         await interaction.response.send_message(
@@ -74,11 +75,11 @@ class VehicleListSelect(ui.Select):
         list_name = next(
             o.label for o in self.options if o.value == str(list_id))
 
-        EventWizardSession.update(
+        await EventWizardSession.update(
             interaction.user.id, "vehicle_list_id", list_id)
-        EventWizardSession.update(
+        await EventWizardSession.update(
             interaction.user.id, "vehicle_list_name", list_name)
-        EventWizardSession.update(interaction.user.id, "vehicle_text", "")
+        await EventWizardSession.update(interaction.user.id, "vehicle_text", "")
 
         await interaction.response.send_message(
             f"✅ Lista seleccionada: **{list_name}**",
@@ -88,7 +89,8 @@ class VehicleListSelect(ui.Select):
         cars = await vehicle_handlers.get_vehicles_in_list(list_id)
 
         if not cars:
-            await interaction.followup.send(
+            await send_followup(
+                interaction,
                 "⚠️ Esta lista no tiene coches registrados.",
                 ephemeral=True
             )
@@ -98,7 +100,8 @@ class VehicleListSelect(ui.Select):
         self.view_ref.add_item(VehicleIndividualSelect(self.view_ref, cars))
         self.view_ref.add_item(ConfirmVehicleButton(self.view_ref))
 
-        await interaction.followup.send(
+        await send_followup(
+            interaction,
             "🚘 Puedes seleccionar coches individuales o confirmar todos los de la lista:",
             view=self.view_ref,
             ephemeral=True
@@ -123,7 +126,7 @@ class VehicleIndividualSelect(ui.Select):
 
     async def callback(self, interaction: Interaction):
         """Guarda los coches seleccionados manualmente."""
-        EventWizardSession.update(
+        await EventWizardSession.update(
             interaction.user.id, "vehicle_selected_models", self.values)
         await interaction.response.send_message(
             f"✅ Coches seleccionados: {', '.join(self.values)}",
@@ -153,7 +156,8 @@ class ConfirmVehicleButton(ui.Button):
         )
 
         view_nav = WizardNavigationView(user_id, current_step=3)
-        await interaction.followup.send(
+        await send_followup(
+            interaction,
             "🧭 Control del asistente — puedes volver o avanzar según sea necesario.",
             view=view_nav,
             ephemeral=True
@@ -228,7 +232,8 @@ async def show_vehicles_step(interaction: Interaction):
 
     view = StepVehiclesView(user_id, lists, text_filled)
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(3, 'Selección de vehículos')}\n"
         "Puedes **escribir los coches manualmente** o **seleccionarlos desde una lista existente**.\n\n"
         "➡️ Si escribes coches manualmente, el selector de lista quedará deshabilitado.",
@@ -237,7 +242,8 @@ async def show_vehicles_step(interaction: Interaction):
     )
 
     view_nav = WizardNavigationView(user_id, current_step=3)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para avanzar o retroceder en el asistente.",
         view=view_nav,
         ephemeral=True
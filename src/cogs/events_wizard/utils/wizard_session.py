@@ -11,36 +11,25 @@ Su API es coherente con SchedulerWizardSession, con métodos:
   - start(user_id, data=None)
   - update(user_id, key, value)
   - bulk_update(user_id, payload)
-  - get(user_id)
+  - get(user_id) / load(user_id)   → vista de solo lectura
+  - edit(user_id)                   → `async with` para modificar
   - next_step(user_id)
   - exists(user_id)
   - delete(user_id) / end(user_id)
   - to_dict(user_id)
 
-Esta sesión se mantiene in-memory y se destruye cuando el wizard finaliza.
+Las sesiones viven en memoria y se persisten en diferido en `wizard_sessions`
+(ver `wizards_shared/session_store.py`); tras un reinicio se recuperan en la
+siguiente operación asíncrona del usuario. Se destruyen cuando el wizard finaliza.
+El Scheduler Wizard comparte esta misma sesión (espacio `scheduler`).
 """
 
 from __future__ import annotations
 
-import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
 
-
-# --------------------------------------------------------
-# 🔹 Estructura interna
-# --------------------------------------------------------
-@dataclass
-class _EventWizardSessionData:
-    data: Dict[str, Any] = field(default_factory=dict)
-    step: int = 1
-    created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
-    updated_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+from src.cogs.wizards_shared.session_store import get_store
 
 
 # --------------------------------------------------------
@@ -50,79 +39,76 @@ class EventWizardSession:
     """
     Sistema estático de manejo de sesiones del Events Wizard.
     Coherente con SchedulerWizardSession, pero con soporte adicional para `step`.
+    Sus datos son el espacio `events` de la sesión única del usuario.
     """
 
-    _sessions: Dict[int, _EventWizardSessionData] = {}
-    _lock = asyncio.Lock()
-
-    @staticmethod
-    def _now_iso() -> str:
-        return datetime.now(timezone.utc).isoformat()
-
-    @classmethod
-    async def _touch(cls, user_id: int) -> None:
-        """Actualiza updated_at."""
-        sess = cls._sessions.get(user_id)
-        if sess:
-            sess.updated_at = cls._now_iso()
+    _sessions = get_store()
+    _NS = "events"
 
     # ---------- API pública ----------
 
     @classmethod
     async def start(cls, user_id: int, initial: Optional[Dict[str, Any]] = None) -> None:
         """Crea o reinicia una sesión del wizard."""
-        async with cls._lock:
-            cls._sessions[user_id] = _EventWizardSessionData(
-                data=initial or {},
+        async with cls._sessions.lock(user_id):
+            cls._sessions.start(
+                user_id, cls._NS, initial,
                 step=initial.get("step", 1) if initial else 1
             )
 
     @classmethod
     def exists(cls, user_id: int) -> bool:
-        return user_id in cls._sessions
+        return cls._sessions.has(user_id, cls._NS)
 
     @classmethod
-    def get(cls, user_id: int) -> Optional[Dict[str, Any]]:
-        """Devuelve solo los datos almacenados del wizard."""
-        sess = cls._sessions.get(user_id)
-        return dict(sess.data) if sess else None
+    def get(cls, user_id: int) -> Optional[Mapping[str, Any]]:
+        """Devuelve una vista de solo lectura de los datos del wizard (sin copia)."""
+        return cls._sessions.view(user_id, cls._NS)
+
+    @classmethod
+    async def load(cls, user_id: int) -> Optional[Mapping[str, Any]]:
+        """Como `get`, recuperando antes la sesión persistida si el bot se reinició."""
+        await cls._sessions.hydrate(user_id)
+        return cls.get(user_id)
+
+    @classmethod
+    @asynccontextmanager
+    async def edit(cls, user_id: int, create: bool = True) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Datos de la sesión para modificarlos en exclusiva. Las vistas devueltas
+        antes por `get` no ven los cambios: si alguna sigue viva, los datos se
+        copian antes de modificarlos (copy-on-write).
+        """
+        async with cls._sessions.locked(user_id, create) as sess:
+            if sess is None or not (create or cls._NS in sess.namespaces):
+                yield None
+            else:
+                yield sess.writable(cls._NS)
 
     @classmethod
     async def update(cls, user_id: int, key: str, value: Any) -> None:
         """Actualiza un valor dentro de la sesión."""
-        async with cls._lock:
-            sess = cls._sessions.get(user_id)
-            if not sess:
-                sess = _EventWizardSessionData()
-                cls._sessions[user_id] = sess
-            sess.data[key] = value
-            await cls._touch(user_id)
+        await cls._sessions.assign(user_id, cls._NS, {key: value})
 
     @classmethod
     async def bulk_update(cls, user_id: int, payload: Dict[str, Any]) -> None:
         """Actualiza múltiples valores simultáneamente."""
-        async with cls._lock:
-            sess = cls._sessions.get(user_id)
-            if not sess:
-                sess = _EventWizardSessionData()
-                cls._sessions[user_id] = sess
-            sess.data.update(payload or {})
-            await cls._touch(user_id)
+        await cls._sessions.assign(user_id, cls._NS, payload or {})
 
     @classmethod
     async def next_step(cls, user_id: int) -> None:
         """Incrementa el número de paso del wizard."""
-        async with cls._lock:
-            sess = cls._sessions.get(user_id)
-            if sess:
+        async with cls._sessions.lock(user_id):
+            sess = await cls._sessions.hydrate(user_id)
+            if sess and cls._NS in sess.namespaces:
                 sess.step += 1
-                await cls._touch(user_id)
+                cls._sessions.note(user_id, cls._NS)
 
     @classmethod
     async def delete(cls, user_id: int) -> None:
         """Elimina por completo la sesión."""
-        async with cls._lock:
-            cls._sessions.pop(user_id, None)
+        async with cls._sessions.locked(user_id, create=False):
+            cls._sessions.end(user_id, cls._NS)
 
     # alias semántico
     end = delete
@@ -131,10 +117,11 @@ class EventWizardSession:
     def to_dict(cls, user_id: int) -> Optional[Dict[str, Any]]:
         """Devuelve la sesión con metadatos completos."""
         sess = cls._sessions.get(user_id)
-        if not sess:
+        data = cls.get(user_id)
+        if data is None:
             return None
         return {
-            "data": dict(sess.data),
+            "data": dict(data),
             "step": sess.step,
             "created_at": sess.created_at,
             "updated_at": sess.updated_at,
@@ -19,7 +19,7 @@ con el flujo de creación de eventos.
 import discord
 from discord import app_commands, ui, Interaction
 from discord.ext import commands
-from database.db import Database
+from src.database.db import Database
 from src.cogs.scheduler_wizard.utils.scheduler_session import SchedulerWizardSession
 
 
@@ -39,18 +39,18 @@ class ScheduleSavedEvent(commands.Cog):
     async def schedule_saved_event(self, interaction: Interaction):
         """Comando principal: inicia el flujo de selección de evento a programar."""
         db = await Database.get_instance()
-        conn = await db.get_connection()
 
         # Recuperar eventos en borrador
-        cur = await conn.execute("""
-            SELECT event_id, title, description, event_type, status, created_by, created_at,
-                   last_edited_by, last_edited_date
-            FROM events
-            WHERE status = 'draft'
-            ORDER BY created_at DESC
-        """)
-        rows = await cur.fetchall()
-        await cur.close()
+        async with db.reader() as conn:
+            cur = await conn.execute("""
+                SELECT event_id, title, description, event_type, status, created_by, created_at,
+                       last_edited_by, last_edited_date
+                FROM events
+                WHERE status = 'draft'
+                ORDER BY created_at DESC
+            """)
+            rows = await cur.fetchall()
+            await cur.close()
 
         if not rows:
             await interaction.response.send_message(
@@ -113,8 +113,8 @@ class EventSelect(ui.Select):
         db = await Database.get_instance()
         event = await db.events.get_event(selected_id)
 
-        # Iniciar sesión temporal del Scheduler Wizard
-        SchedulerWizardSession.start(interaction.user.id, event)
+        # Iniciar sesión temporal del Scheduler Wizard (copia mutable del registro)
+        await SchedulerWizardSession.start(interaction.user.id, event.to_dict())
 
         # Embed con metadatos del evento
         embed = discord.Embed(
@@ -174,7 +174,7 @@ class CancelButton(ui.Button):
         super().__init__(label="❌ Cancelar", style=discord.ButtonStyle.danger)
 
     async def callback(self, interaction: Interaction):
-        SchedulerWizardSession.end(interaction.user.id)
+        await SchedulerWizardSession.end(interaction.user.id)
         await interaction.response.send_message("❌ Operación cancelada.", ephemeral=True)
 
 
@@ -10,13 +10,13 @@ comando `/schedule_saved_event`.
 
 Flujo general:
 1️⃣ Recuperar datos del evento desde `EventWizardSession` o base de datos.
-2️⃣ Crear una sesión temporal (`SchedulerWizardSession`).
+2️⃣ Continuar la sesión en el espacio del scheduler (`SchedulerWizardSession.handoff`,
+   sin copiar el evento).
 3️⃣ Determinar el punto de inicio (nombre, zona horaria o fecha de publicación).
 4️⃣ Cargar el primer paso correspondiente.
 """
 
 import discord
-from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.scheduler_wizard.utils.scheduler_session import SchedulerWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 
@@ -32,17 +32,15 @@ async def start_scheduler_for_current_event(interaction: discord.Interaction):
       - Comando `/schedule_saved_event`
     """
     user_id = interaction.user.id
-    event_data = EventWizardSession.get(user_id)
 
-    if not event_data:
+    # 🧠 El scheduler continúa la sesión del evento (sin copiarla)
+    if not await SchedulerWizardSession.handoff(user_id):
         await interaction.response.send_message(
             "⚠️ No se encontró un evento activo para programar.",
             ephemeral=True,
         )
         return
-
-    # 🧠 Crear o reiniciar la sesión del scheduler
-    SchedulerWizardSession.start(user_id, event_data)
+    event_data = SchedulerWizardSession.get(user_id)
     print(f"[SCHEDULER] Sesión iniciada para user_id={user_id}")
 
     # --------------------------------------------------------
@@ -15,9 +15,9 @@ Incluye:
 """
 
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
 from typing import Any, Dict, List, Tuple
-from database.db import Database
+from src.database.db import Database
+from src.utils.manager_timezones import is_valid_zone
 
 
 class SchedulerValidation:
@@ -36,13 +36,13 @@ class SchedulerValidation:
             return False, "❌ El título del evento es demasiado corto o está vacío."
 
         db = await Database.get_instance()
-        conn = await db.get_connection()
-        cur = await conn.execute(
-            "SELECT COUNT(*) FROM events WHERE LOWER(title) = LOWER(?) AND guild_id = ?",
-            (title.strip(), guild_id)
-        )
-        count = (await cur.fetchone())[0]
-        await cur.close()
+        async with db.reader() as conn:
+            cur = await conn.execute(
+                "SELECT COUNT(*) FROM events WHERE LOWER(title) = LOWER(?) AND guild_id = ?",
+                (title.strip(), guild_id)
+            )
+            count = (await cur.fetchone())[0]
+            await cur.close()
 
         if count > 0:
             return False, f"⚠️ Ya existe un evento con el nombre **{title.strip()}** en este servidor."
@@ -55,11 +55,9 @@ class SchedulerValidation:
     @staticmethod
     def validate_timezone(tz_str: str) -> Tuple[bool, str]:
         """Comprueba que el identificador de zona horaria sea válido."""
-        try:
-            ZoneInfo(tz_str)
+        if is_valid_zone(tz_str):
             return True, ""
-        except Exception:
-            return False, f"❌ Zona horaria inválida: `{tz_str}`"
+        return False, f"❌ Zona horaria inválida: `{tz_str}`"
 
     # --------------------------------------------------------
     # 🕓 Validación de fechas y horas
@@ -16,7 +16,8 @@ from datetime import datetime, timezone
 from src.cogs.scheduler_wizard.handlers.scheduler_handler import SchedulerWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
-from database.db import Database
+from src.bot_core.outbound import send_followup
+from src.database.db import Database
 
 
 # --------------------------------------------------------
@@ -70,10 +71,11 @@ class ConfirmScheduleButton(ui.Button):
 
             # 2️⃣ Si todo es válido, proceder al guardado
             db = await Database.get_instance()
-            conn = await db.get_connection()
             now = datetime.now(timezone.utc)
 
-            session_data.update({
+            # Vista de solo lectura: una única copia con los campos finales
+            event = {
+                **session_data,
                 "status": "scheduled",
                 "is_published": 0,
                 "scheduled_at": now.isoformat(),
@@ -81,10 +83,10 @@ class ConfirmScheduleButton(ui.Button):
                 "last_edited_date": now.isoformat(),
                 "guild_id": interaction.guild_id,
                 "created_by": interaction.user.id,
-            })
+            }
 
-            await db.events.insert_event(session_data)
-            SchedulerWizardSession.end(user_id)
+            await db.events.insert_event(event)
+            await SchedulerWizardSession.end(user_id)
 
             await interaction.response.send_message(
                 "✅ El evento ha sido programado correctamente y quedará pendiente de publicación automática.",
@@ -119,7 +121,7 @@ class CancelScheduleButton(ui.Button):
         super().__init__(label="❌ Cancelar programación", style=ButtonStyle.danger)
 
     async def callback(self, interaction: Interaction):
-        SchedulerWizardSession.end(interaction.user.id)
+        await SchedulerWizardSession.end(interaction.user.id)
         await interaction.response.send_message(
             "🛑 Se canceló la programación del evento. No se guardaron cambios.",
             ephemeral=True
@@ -174,7 +176,8 @@ async def show_step(interaction: Interaction):
     embed.set_footer(
         text="Confirma la programación o cancela para revisar los pasos anteriores.")
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(5, 'Confirmación final de programación')}\n"
         "Verifica toda la información antes de guardar.",
         embed=embed,
@@ -184,7 +187,8 @@ async def show_step(interaction: Interaction):
 
     # Controles universales
     nav = WizardNavigationView(user_id, current_step=5, total_steps=5)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación si deseas revisar los pasos anteriores.",
         view=nav,
         ephemeral=True
@@ -11,9 +11,10 @@ duplicado dentro del mismo servidor.
 
 import discord
 from discord import ui, Interaction
-from database.db import Database
+from src.database.db import Database
 from src.cogs.scheduler_wizard.handlers.scheduler_handler import SchedulerWizardSession, go_to_step
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -46,12 +47,13 @@ class SchedulerNameModal(ui.Modal, title="📝 Nombre del evento"):
 
         # Validar duplicado (case-insensitive por guild)
         db = await Database.get_instance()
-        conn = await db.get_connection()
-        cur = await conn.execute(
-            "SELECT COUNT(*) FROM events WHERE LOWER(title) = LOWER(?) AND guild_id = ?",
-            (name, self.guild_id or interaction.guild_id)
-        )
-        count = (await cur.fetchone())[0]
+        async with db.reader() as conn:
+            cur = await conn.execute(
+                "SELECT COUNT(*) FROM events WHERE LOWER(title) = LOWER(?) AND guild_id = ?",
+                (name, self.guild_id or interaction.guild_id)
+            )
+            count = (await cur.fetchone())[0]
+            await cur.close()
         if count > 0:
             await interaction.response.send_message(
                 f"⚠️ Ya existe un evento con el nombre **{name}** en este servidor. Usa otro nombre.",
@@ -60,8 +62,8 @@ class SchedulerNameModal(ui.Modal, title="📝 Nombre del evento"):
             return
 
         # Guardar en sesión
-        SchedulerWizardSession.update(self.user_id, "title", name)
-        SchedulerWizardSession.update(
+        await SchedulerWizardSession.update(self.user_id, "title", name)
+        await SchedulerWizardSession.update(
             self.user_id, "guild_id", interaction.guild_id)
 
         await interaction.response.send_message(
@@ -113,7 +115,8 @@ async def show_step(interaction: Interaction):
     guild_id = session.get("guild_id") or interaction.guild_id
 
     # Encabezado informativo
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "📝 **Paso 1/5 — Definir nombre del evento**\n"
         "Cada evento debe tener un nombre único dentro del servidor. "
         "Puedes mantener el actual o asignar uno nuevo.",
@@ -123,7 +126,8 @@ async def show_step(interaction: Interaction):
 
     # Controles de navegación universales
     nav = WizardNavigationView(user_id, current_step=1, total_steps=5)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para continuar o cancelar.",
         view=nav,
         ephemeral=True
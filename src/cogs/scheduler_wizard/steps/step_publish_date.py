@@ -11,10 +11,11 @@ fecha y hora específicas. Gestiona validaciones básicas y la conversión horar
 import discord
 from discord import ui, Interaction, SelectOption
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from src.utils import manager_timezones as tz
 from src.cogs.scheduler_wizard.utils.scheduler_session import SchedulerWizardSession
 from src.cogs.events_wizard.utils.helpers import event_step_header
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -45,9 +46,9 @@ class PublishModeSelect(ui.Select):
 
         if mode == "instant":
             now_utc = datetime.utcnow().isoformat()
-            SchedulerWizardSession.update(
+            await SchedulerWizardSession.update(
                 self.user_id, "publish_mode", "instant")
-            SchedulerWizardSession.update(
+            await SchedulerWizardSession.update(
                 self.user_id, "publish_datetime_utc", now_utc)
 
             await interaction.response.send_message(
@@ -83,25 +84,22 @@ class PublishDatetimeModal(ui.Modal, title="🗓️ Programar fecha y hora de pu
             # Obtener zona horaria del usuario desde la sesión o usar UTC
             user_data = SchedulerWizardSession.get(self.user_id)
             tz_name = user_data.get("timezone", "UTC")
-            local_zone = ZoneInfo(tz_name)
 
             # Convertir fecha local a UTC
-            local_dt = datetime.strptime(
-                dt_str, "%Y-%m-%d %H:%M").replace(tzinfo=local_zone)
-            utc_dt = local_dt.astimezone(ZoneInfo("UTC"))
+            local_dt = tz.parse_local(dt_str)
+            utc_dt = tz.local_to_utc(local_dt, tz_name)
 
             # Validaciones
-            now_utc = datetime.now(ZoneInfo("UTC"))
-            if utc_dt < now_utc + timedelta(minutes=10):
+            if utc_dt < tz.now_utc() + timedelta(minutes=10):
                 await interaction.response.send_message(
                     "⚠️ La fecha de publicación debe ser al menos **10 minutos posterior** a la hora actual.",
                     ephemeral=True
                 )
                 return
 
-            SchedulerWizardSession.update(
+            await SchedulerWizardSession.update(
                 self.user_id, "publish_mode", "scheduled")
-            SchedulerWizardSession.update(
+            await SchedulerWizardSession.update(
                 self.user_id, "publish_datetime_utc", utc_dt.isoformat())
 
             await interaction.response.send_message(
@@ -126,7 +124,8 @@ async def show_step(interaction: Interaction):
     user_id = interaction.user.id
 
     view = SchedulerPublishDateView(user_id)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(2, 'Modo de publicación del evento')}\n"
         "Decide si deseas **publicar ahora** o **programar el evento** para una fecha específica.",
         view=view,
@@ -135,7 +134,8 @@ async def show_step(interaction: Interaction):
 
     # Controles universales del wizard
     view_nav = WizardNavigationView(user_id, current_step=2)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para avanzar o retroceder.",
         view=view_nav,
         ephemeral=True
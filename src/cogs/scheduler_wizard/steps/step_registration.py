@@ -11,13 +11,13 @@ en la sesión temporal del usuario.
 
 import discord
 from discord import ui, Interaction, SelectOption
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import timedelta
 
-from src.cogs.scheduler_wizard.handlers.validation_handler import SchedulerValidation
+from src.utils import manager_timezones as tz
 from src.cogs.scheduler_wizard.handlers.scheduler_handler import SchedulerWizardSession, go_to_step
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
 from src.cogs.events_wizard.utils.helpers import event_step_header
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -48,10 +48,10 @@ class RegistrationModeSelect(ui.Select):
     async def callback(self, interaction: Interaction):
         mode = self.values[0]
         if mode == "instant":
-            now_utc = datetime.now(ZoneInfo("UTC"))
-            SchedulerWizardSession.update(
+            now_utc = tz.now_utc()
+            await SchedulerWizardSession.update(
                 self.user_id, "registration_open_mode", "instant")
-            SchedulerWizardSession.update(
+            await SchedulerWizardSession.update(
                 self.user_id, "registration_open_datetime_utc", now_utc.isoformat())
 
             await interaction.response.send_message(
@@ -93,16 +93,20 @@ class RegistrationDatetimeModal(ui.Modal, title="🗓️ Programar apertura de i
         tz_name = data.get("timezone", "UTC")
 
         try:
-            if not SchedulerValidation.validate_timezone(tz_name):
+            if not tz.is_valid_zone(tz_name):
                 tz_name = "UTC"
-            tz = ZoneInfo(tz_name)
 
-            open_dt_local = datetime.strptime(
-                self.open_datetime.value.strip(), "%Y-%m-%d %H:%M").replace(tzinfo=tz)
-            open_dt_utc = open_dt_local.astimezone(ZoneInfo("UTC"))
+            # Apertura y cierre en un solo lote
+            close_value = self.close_datetime.value.strip()
+            local_values = [tz.parse_local(self.open_datetime.value)]
+            if close_value:
+                local_values.append(tz.parse_local(close_value))
+            utc_values = tz.localize_many(local_values, tz_name)
+
+            open_dt_local, open_dt_utc = local_values[0], utc_values[0]
 
             # Validación: no en el pasado
-            if open_dt_utc < datetime.now(ZoneInfo("UTC")):
+            if open_dt_utc < tz.now_utc():
                 await interaction.response.send_message(
                     "⚠️ No puedes establecer una fecha de apertura en el pasado.",
                     ephemeral=True
@@ -110,12 +114,9 @@ class RegistrationDatetimeModal(ui.Modal, title="🗓️ Programar apertura de i
                 return
 
             # Validación: cierre posterior a apertura (si aplica)
-            close_value = self.close_datetime.value.strip()
             close_dt_utc = None
             if close_value:
-                close_dt_local = datetime.strptime(
-                    close_value, "%Y-%m-%d %H:%M").replace(tzinfo=tz)
-                close_dt_utc = close_dt_local.astimezone(ZoneInfo("UTC"))
+                close_dt_local, close_dt_utc = local_values[1], utc_values[1]
 
                 if close_dt_utc <= open_dt_utc + timedelta(minutes=10):
                     await interaction.response.send_message(
@@ -125,12 +126,12 @@ class RegistrationDatetimeModal(ui.Modal, title="🗓️ Programar apertura de i
                     return
 
             # Guardar datos en sesión
-            SchedulerWizardSession.update(
+            await SchedulerWizardSession.update(
                 self.user_id, "registration_open_mode", "scheduled")
-            SchedulerWizardSession.update(
+            await SchedulerWizardSession.update(
                 self.user_id, "registration_open_datetime_utc", open_dt_utc.isoformat())
             if close_dt_utc:
-                SchedulerWizardSession.update(
+                await SchedulerWizardSession.update(
                     self.user_id, "registration_close_datetime_utc", close_dt_utc.isoformat())
 
             # Mensaje de confirmación
@@ -162,7 +163,8 @@ async def show_step(interaction: Interaction):
     user_id = interaction.user.id
     view = RegistrationModeView(user_id)
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(3, 'Apertura de inscripciones')}\n"
         "Define cuándo se abrirán las inscripciones al público. "
         "Puedes abrirlas inmediatamente o programar una fecha específica.",
@@ -172,7 +174,8 @@ async def show_step(interaction: Interaction):
 
     # Controles universales del wizard
     nav = WizardNavigationView(user_id, current_step=3, total_steps=5)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para avanzar o retroceder.",
         view=nav,
         ephemeral=True
@@ -11,11 +11,11 @@ serán enviadas automáticamente antes del inicio del evento o su publicación.
 import discord
 from discord import ui, Interaction, SelectOption
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-from src.cogs.scheduler_wizard.handlers.validation_handler import SchedulerValidation
+from src.utils import manager_timezones as tz
 from src.cogs.scheduler_wizard.handlers.scheduler_handler import SchedulerWizardSession, go_to_step
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
 from src.cogs.events_wizard.utils.helpers import event_step_header
+from src.bot_core.outbound import send_followup
 
 
 # --------------------------------------------------------
@@ -71,8 +71,9 @@ class ReminderPresetSelect(ui.Select):
                 "utc": reminder_utc.isoformat()
             })
 
-        SchedulerWizardSession.update(user_id, "reminders_list", reminders)
-        SchedulerWizardSession.update(user_id, "reminders_enabled", True)
+        async with SchedulerWizardSession.edit(user_id) as data:
+            data["reminders_list"] = reminders
+            data["reminders_enabled"] = True
 
         await interaction.response.send_message(
             f"✅ Se configuraron recordatorios automáticos: {', '.join([r['label'] for r in reminders])}",
@@ -121,13 +122,11 @@ class CustomReminderModal(ui.Modal, title="🕓 Crear recordatorio manual"):
         tz_name = session.get("timezone", "UTC")
 
         try:
-            if not SchedulerValidation.validate_timezone(tz_name):
+            if not tz.is_valid_zone(tz_name):
                 tz_name = "UTC"
 
-            tz = ZoneInfo(tz_name)
-            reminder_local = datetime.strptime(
-                self.reminder_datetime.value.strip(), "%Y-%m-%d %H:%M").replace(tzinfo=tz)
-            reminder_utc = reminder_local.astimezone(ZoneInfo("UTC"))
+            reminder_local = tz.parse_local(self.reminder_datetime.value)
+            reminder_utc = tz.local_to_utc(reminder_local, tz_name)
 
             event_time_str = session.get("event_datetime_utc")
             if not event_time_str:
@@ -147,32 +146,31 @@ class CustomReminderModal(ui.Modal, title="🕓 Crear recordatorio manual"):
                 )
                 return
 
-            # Obtener lista existente y evitar duplicados
-            reminders = session.get("reminders_list", [])
-            if len(reminders) >= 3:
-                await interaction.response.send_message(
-                    "⚠️ Solo puedes configurar hasta 3 recordatorios por evento.",
-                    ephemeral=True
-                )
+            # Leer, validar y añadir en exclusiva; la lista de la vista es de
+            # solo lectura (y puede venir del espacio `events`): se copia
+            error = None
+            async with SchedulerWizardSession.edit(user_id) as data:
+                reminders = list(SchedulerWizardSession.get(user_id).get("reminders_list", []))
+                if len(reminders) >= 3:
+                    error = "⚠️ Solo puedes configurar hasta 3 recordatorios por evento."
+                elif any(
+                    abs((datetime.fromisoformat(r["utc"]) - reminder_utc).total_seconds()) < 60
+                    for r in reminders
+                ):
+                    error = "⚠️ Ya existe un recordatorio en un horario muy cercano."
+                else:
+                    reminders.append({
+                        "label": f"Personalizado ({reminder_local.strftime('%Y-%m-%d %H:%M')})",
+                        "utc": reminder_utc.isoformat(),
+                        "local": reminder_local.strftime('%Y-%m-%d %H:%M'),
+                    })
+                    data["reminders_list"] = reminders
+                    data["reminders_enabled"] = True
+
+            if error:
+                await interaction.response.send_message(error, ephemeral=True)
                 return
 
-            for r in reminders:
-                if abs((datetime.fromisoformat(r["utc"]) - reminder_utc).total_seconds()) < 60:
-                    await interaction.response.send_message(
-                        "⚠️ Ya existe un recordatorio en un horario muy cercano.",
-                        ephemeral=True
-                    )
-                    return
-
-            reminders.append({
-                "label": f"Personalizado ({reminder_local.strftime('%Y-%m-%d %H:%M')})",
-                "utc": reminder_utc.isoformat(),
-                "local": reminder_local.strftime('%Y-%m-%d %H:%M'),
-            })
-
-            SchedulerWizardSession.update(user_id, "reminders_list", reminders)
-            SchedulerWizardSession.update(user_id, "reminders_enabled", True)
-
             await interaction.response.send_message(
                 f"✅ Recordatorio agregado para {reminder_local.strftime('%Y-%m-%d %H:%M')} ({tz_name})",
                 ephemeral=True
@@ -196,7 +194,8 @@ async def show_step(interaction: Interaction):
     user_id = interaction.user.id
     view = StepRemindersView(user_id)
 
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         f"{event_step_header(4, 'Recordatorios automáticos')}\n"
         "Configura recordatorios que se enviarán antes del evento.\n"
         "Puedes seleccionar intervalos predefinidos o agregar uno manual.",
@@ -205,7 +204,8 @@ async def show_step(interaction: Interaction):
     )
 
     nav = WizardNavigationView(user_id, current_step=4, total_steps=5)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para avanzar o retroceder.",
         view=nav,
         ephemeral=True
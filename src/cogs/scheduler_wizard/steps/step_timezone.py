@@ -11,11 +11,10 @@ su uso en los módulos de programación y publicación de eventos.
 
 import discord
 from discord import ui, Interaction, SelectOption
-from datetime import datetime
-from zoneinfo import ZoneInfo
 from src.utils import manager_timezones as tz
-from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
+from src.cogs.scheduler_wizard.utils.scheduler_session import SchedulerWizardSession
 from src.cogs.wizards_shared.views.navigation_view import WizardNavigationView
+from src.bot_core.outbound import send_followup
 
 # --------------------------------------------------------
 # 🔹 Vista principal de selección de zona y fecha
@@ -68,7 +67,7 @@ class TimezoneSelect(ui.Select):
 
     async def callback(self, interaction: Interaction):
         tz_name = self.values[0]
-        EventWizardSession.update(interaction.user.id, "timezone", tz_name)
+        await SchedulerWizardSession.update(interaction.user.id, "timezone", tz_name)
         await interaction.response.send_modal(EventDateTimeModal(interaction.user.id, tz_name))
 
 
@@ -91,10 +90,12 @@ class EventDateTimeModal(ui.Modal, title="🗓️ Fecha y hora del evento"):
         dt_str = self.event_datetime.value.strip()
         try:
             # Conversión a UTC
-            utc_iso = tz.convert_to_utc(dt_str, self.timezone_str)
+            local_dt = tz.parse_local(dt_str)
+            utc_dt = tz.local_to_utc(local_dt, self.timezone_str)
+            utc_iso = utc_dt.isoformat()
 
             # Validación de futuro
-            if not tz.validate_future_datetime(utc_iso):
+            if not tz.validate_future_datetime(utc_dt):
                 await interaction.response.send_message(
                     "⚠️ No puedes establecer una fecha en el pasado. Intenta nuevamente.",
                     ephemeral=True,
@@ -102,19 +103,16 @@ class EventDateTimeModal(ui.Modal, title="🗓️ Fecha y hora del evento"):
                 return
 
             # Guardar sesión
-            EventWizardSession.update(
-                self.user_id, "event_datetime_utc", utc_iso)
-            EventWizardSession.update(
-                self.user_id, "timezone", self.timezone_str)
+            await SchedulerWizardSession.bulk_update(self.user_id, {
+                "event_datetime_utc": utc_iso,
+                "timezone": self.timezone_str,
+            })
 
             # Confirmar visualmente
-            local_zone = ZoneInfo(self.timezone_str)
-            local_dt = datetime.strptime(
-                dt_str, "%Y-%m-%d %H:%M").replace(tzinfo=local_zone)
             await interaction.response.send_message(
                 f"✅ Fecha configurada correctamente.\n"
                 f"🕒 Hora local: **{local_dt.strftime('%Y-%m-%d %H:%M')} ({self.timezone_str})**\n"
-                f"🌐 Equivalente UTC: **{datetime.fromisoformat(utc_iso).strftime('%Y-%m-%d %H:%M')} UTC**",
+                f"🌐 Equivalente UTC: **{utc_dt.strftime('%Y-%m-%d %H:%M')} UTC**",
                 ephemeral=True,
             )
 
@@ -135,14 +133,16 @@ class EventDateTimeModal(ui.Modal, title="🗓️ Fecha y hora del evento"):
 async def show_timezone_step(interaction: Interaction):
     """Lanza el paso de selección de zona horaria."""
     view = StepTimezoneView(interaction.user.id)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🕓 Define la **fecha, hora y zona horaria** para el evento.",
         view=view,
         ephemeral=True,
     )
 
     nav = WizardNavigationView(interaction.user.id, current_step=2)
-    await interaction.followup.send(
+    await send_followup(
+        interaction,
         "🧭 Usa los botones de navegación para avanzar o retroceder.",
         view=nav,
         ephemeral=True,
@@ -4,31 +4,20 @@ Ubicación: src/cogs/scheduler_wizard/utils/
 
 Descripción:
 Gestor de sesiones temporales del Scheduler Wizard.
-Mantiene datos efímeros por usuario mientras el asistente
-de programación está activo. Su estructura y API son
-coherentes con EventWizardSession.
+Mantiene datos por usuario mientras el asistente
+de programación está activo (persistidos en diferido en
+`wizard_sessions`). Su estructura y API son
+coherentes con EventWizardSession: ambos son espacios de la
+misma sesión del usuario, y `handoff` continúa aquí el evento
+del Events Wizard sin copiarlo.
 """
 
 from __future__ import annotations
 
-import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
 
-
-# --------------------------------------------------------
-# 🔹 Estructura interna de una sesión
-# --------------------------------------------------------
-@dataclass
-class _SchedulerSessionData:
-    data: Dict[str, Any] = field(default_factory=dict)
-    created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
-    updated_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+from src.cogs.wizards_shared.session_store import get_store
 
 
 # --------------------------------------------------------
@@ -40,71 +29,88 @@ class SchedulerWizardSession:
 
     Métodos equivalentes a EventWizardSession:
       - start(user_id, data=None)
+      - handoff(user_id)                → continúa la sesión del Events Wizard
       - update(user_id, key, value)
-      - get(user_id)
+      - get(user_id) / load(user_id)   → vista de solo lectura
+      - edit(user_id)                   → `async with` para modificar
       - delete(user_id) / end(user_id)
       - exists(user_id)
       - bulk_update(user_id, payload)
     """
 
-    _sessions: Dict[int, _SchedulerSessionData] = {}
-    _lock = asyncio.Lock()
-
-    # -------- Helpers internos --------
-
-    @staticmethod
-    def _now_iso() -> str:
-        return datetime.now(timezone.utc).isoformat()
-
-    @classmethod
-    async def _touch(cls, user_id: int) -> None:
-        """Actualiza updated_at en la sesión del usuario."""
-        sess = cls._sessions.get(user_id)
-        if sess:
-            sess.updated_at = cls._now_iso()
+    _sessions = get_store()
+    _NS = "scheduler"
+    _EVENTS_NS = "events"
 
     # -------- API coherente con EventWizardSession --------
 
     @classmethod
     async def start(cls, user_id: int, data: Optional[Dict[str, Any]] = None) -> None:
         """Crea o reinicia la sesión con datos opcionales iniciales."""
-        async with cls._lock:
-            cls._sessions[user_id] = _SchedulerSessionData(data or {})
+        async with cls._sessions.lock(user_id):
+            cls._sessions.start(user_id, cls._NS, data)
+
+    @classmethod
+    async def handoff(cls, user_id: int) -> bool:
+        """
+        Continúa en el scheduler la sesión del Events Wizard sin copiar datos:
+        las lecturas ven el evento por debajo y las escrituras quedan en el
+        espacio del scheduler. Devuelve False si no hay evento en curso.
+        """
+        async with cls._sessions.locked(user_id, create=False):
+            return cls._sessions.handoff(user_id, cls._EVENTS_NS, cls._NS) is not None
+
+    @classmethod
+    @asynccontextmanager
+    async def edit(cls, user_id: int, create: bool = True) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Datos propios del scheduler para modificarlos en exclusiva. Las vistas
+        devueltas antes por `get` no ven los cambios: si alguna sigue viva, los
+        datos se copian antes de modificarlos (copy-on-write).
+        """
+        async with cls._sessions.locked(user_id, create) as sess:
+            if sess is None or not (create or cls._NS in sess.namespaces):
+                yield None
+            else:
+                yield sess.writable(cls._NS)
 
     @classmethod
     async def update(cls, user_id: int, key: str, value: Any) -> None:
         """Actualiza un campo dentro de los datos de sesión."""
-        async with cls._lock:
-            if user_id not in cls._sessions:
-                cls._sessions[user_id] = _SchedulerSessionData({})
-            cls._sessions[user_id].data[key] = value
-            await cls._touch(user_id)
+        await cls._sessions.assign(user_id, cls._NS, {key: value})
 
     @classmethod
     async def bulk_update(cls, user_id: int, payload: Dict[str, Any]) -> None:
         """Actualiza múltiples datos de sesión en bloque."""
-        async with cls._lock:
-            if user_id not in cls._sessions:
-                cls._sessions[user_id] = _SchedulerSessionData({})
-            cls._sessions[user_id].data.update(payload or {})
-            await cls._touch(user_id)
+        await cls._sessions.assign(user_id, cls._NS, payload or {})
 
     @classmethod
     def exists(cls, user_id: int) -> bool:
         """Indica si existe una sesión activa para el usuario."""
-        return user_id in cls._sessions
+        return cls._sessions.has(user_id, cls._NS)
 
     @classmethod
-    def get(cls, user_id: int) -> Optional[Dict[str, Any]]:
-        """Devuelve solo los datos de la sesión."""
-        sess = cls._sessions.get(user_id)
-        return dict(sess.data) if sess else None
+    def get(cls, user_id: int) -> Optional[Mapping[str, Any]]:
+        """Devuelve una vista de solo lectura de los datos de la sesión (sin copia)."""
+        return cls._sessions.view(user_id, cls._NS)
+
+    @classmethod
+    async def load(cls, user_id: int) -> Optional[Mapping[str, Any]]:
+        """Como `get`, recuperando antes la sesión persistida si el bot se reinició."""
+        await cls._sessions.hydrate(user_id)
+        return cls.get(user_id)
 
     @classmethod
     async def delete(cls, user_id: int) -> None:
-        """Elimina por completo la sesión."""
-        async with cls._lock:
-            cls._sessions.pop(user_id, None)
+        """
+        Elimina por completo la sesión. Si venía de un handoff, el borrador del
+        Events Wizard pasó al scheduler y se elimina también.
+        """
+        async with cls._sessions.locked(user_id, create=False) as sess:
+            ns = sess.namespaces.get(cls._NS) if sess else None
+            cls._sessions.end(user_id, cls._NS)
+            if ns is not None and ns.base:
+                cls._sessions.end(user_id, ns.base)
 
     # Alias semántico
     end = delete
@@ -113,10 +119,11 @@ class SchedulerWizardSession:
     def to_dict(cls, user_id: int) -> Optional[Dict[str, Any]]:
         """Devuelve datos + metadatos completos."""
         sess = cls._sessions.get(user_id)
-        if not sess:
+        data = cls.get(user_id)
+        if data is None:
             return None
         return {
-            "data": dict(sess.data),
+            "data": dict(data),
             "created_at": sess.created_at,
             "updated_at": sess.updated_at,
         }
@@ -10,6 +10,7 @@ de base de datos definida en `database/db.py`.
 """
 
 from src.database.db import Database
+from src.database.bulk_import import TRACK_LIST_ITEM_SPEC, insert_rows
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -24,20 +25,20 @@ async def get_track_lists(guild_id: Optional[int] = None) -> List[Dict]:
     Si guild_id es None, devuelve todas las listas globales (modo compatibilidad).
     """
     db = await Database.get_instance()
-    conn = await db.get_connection()
 
-    if guild_id:
-        cursor = await conn.execute(
-            "SELECT id, name, description FROM track_lists WHERE guild_id = ? ORDER BY name ASC",
-            (guild_id,)
-        )
-    else:
-        cursor = await conn.execute(
-            "SELECT id, name, description FROM track_lists ORDER BY name ASC"
-        )
+    async with db.reader() as conn:
+        if guild_id:
+            cursor = await conn.execute(
+                "SELECT id, name, description FROM track_lists WHERE guild_id = ? ORDER BY name ASC",
+                (guild_id,)
+            )
+        else:
+            cursor = await conn.execute(
+                "SELECT id, name, description FROM track_lists ORDER BY name ASC"
+            )
 
-    rows = await cursor.fetchall()
-    await cursor.close()
+        rows = await cursor.fetchall()
+        await cursor.close()
 
     return [{"id": r[0], "name": r[1], "description": r[2] or ""} for r in rows]
 
@@ -47,14 +48,14 @@ async def get_tracks_in_list(list_id: int) -> List[str]:
     Obtiene todos los circuitos (track_name) pertenecientes a una lista específica.
     """
     db = await Database.get_instance()
-    conn = await db.get_connection()
 
-    cursor = await conn.execute(
-        "SELECT track_name FROM track_list_items WHERE list_id = ? ORDER BY id ASC",
-        (list_id,)
-    )
-    rows = await cursor.fetchall()
-    await cursor.close()
+    async with db.reader() as conn:
+        cursor = await conn.execute(
+            "SELECT track_name FROM track_list_items WHERE list_id = ? ORDER BY id ASC",
+            (list_id,)
+        )
+        rows = await cursor.fetchall()
+        await cursor.close()
 
     return [r[0] for r in rows]
 
@@ -63,31 +64,33 @@ async def get_tracks_in_list(list_id: int) -> List[str]:
 # CREACIÓN / ACTUALIZACIÓN / ELIMINACIÓN
 # ────────────────────────────────────────────────────────────────────────
 
+async def _insert_items(conn, list_id: int, items: List[str]):
+    """Inserta los ítems de una lista en bloque (executemany) dentro de la operación actual."""
+    report = await insert_rows(
+        conn, TRACK_LIST_ITEM_SPEC, ({"list_id": list_id, "track_name": t} for t in items))
+    for err in report.errors:
+        print(f"[DB] Circuito omitido en lista {list_id} (fila {err.index}): {err.message}")
+
+
 async def create_track_list(guild_id: int, name: str, description: str, created_by: int, items: Optional[List[str]] = None) -> int:
     """
     Crea una nueva lista de circuitos y opcionalmente añade ítems asociados.
     Retorna el ID de la nueva lista.
     """
     db = await Database.get_instance()
-    conn = await db.get_connection()
-
-    await conn.execute(
-        "INSERT INTO track_lists (guild_id, name, description, created_by, created_at) VALUES (?, ?, ?, ?, ?)",
-        (guild_id, name, description, created_by, datetime.utcnow().isoformat())
-    )
-    cursor = await conn.execute("SELECT last_insert_rowid()")
-    list_id = (await cursor.fetchone())[0]
-    await cursor.close()
-
-    if items:
-        for t in items:
-            await conn.execute(
-                "INSERT INTO track_list_items (list_id, track_name) VALUES (?, ?)",
-                (list_id, t.strip())
-            )
 
-    await conn.commit()
-    return list_id
+    async def _op(conn) -> int:
+        cursor = await conn.execute(
+            "INSERT INTO track_lists (guild_id, name, description, created_by, created_at) VALUES (?, ?, ?, ?, ?)",
+            (guild_id, name, description, created_by, datetime.utcnow().isoformat())
+        )
+        list_id = cursor.lastrowid
+
+        if items:
+            await _insert_items(conn, list_id, items)
+        return list_id
+
+    return await db.submit_write(_op)
 
 
 async def update_track_list(list_id: int, name: str, description: str, items: Optional[List[str]] = None):
@@ -95,22 +98,18 @@ async def update_track_list(list_id: int, name: str, description: str, items: Op
     Actualiza una lista existente y reemplaza sus ítems si se proporcionan.
     """
     db = await Database.get_instance()
-    conn = await db.get_connection()
 
-    await conn.execute(
-        "UPDATE track_lists SET name = ?, description = ? WHERE id = ?",
-        (name, description, list_id)
-    )
+    async def _op(conn):
+        await conn.execute(
+            "UPDATE track_lists SET name = ?, description = ? WHERE id = ?",
+            (name, description, list_id)
+        )
 
-    if items is not None:
-        await conn.execute("DELETE FROM track_list_items WHERE list_id = ?", (list_id,))
-        for t in items:
-            await conn.execute(
-                "INSERT INTO track_list_items (list_id, track_name) VALUES (?, ?)",
-                (list_id, t.strip())
-            )
+        if items is not None:
+            await conn.execute("DELETE FROM track_list_items WHERE list_id = ?", (list_id,))
+            await _insert_items(conn, list_id, items)
 
-    await conn.commit()
+    await db.submit_write(_op)
 
 
 async def delete_track_list(list_id: int):
@@ -118,8 +117,9 @@ async def delete_track_list(list_id: int):
     Elimina una lista de circuitos y todos sus ítems asociados.
     """
     db = await Database.get_instance()
-    conn = await db.get_connection()
 
-    await conn.execute("DELETE FROM track_list_items WHERE list_id = ?", (list_id,))
-    await conn.execute("DELETE FROM track_lists WHERE id = ?", (list_id,))
-    await conn.commit()
+    async def _op(conn):
+        await conn.execute("DELETE FROM track_list_items WHERE list_id = ?", (list_id,))
+        await conn.execute("DELETE FROM track_lists WHERE id = ?", (list_id,))
+
+    await db.submit_write(_op)
@@ -12,6 +12,7 @@ y centralizar el arranque del proceso.
 
 import discord
 from discord.ext import commands
+from src.cogs.events_wizard.utils.wizard_session import EventWizardSession
 from src.cogs.wizards_shared.views.event_creation_view import EventCreationWizardView
 
 
@@ -29,6 +30,8 @@ class EventCreationHandler(commands.Cog):
         """
         Lanza la vista principal del wizard de creación de eventos.
         """
+        # Crear sesión temporal
+        await EventWizardSession.start(interaction.user.id, {"step": 1, "data": {}})
         view = EventCreationWizardView(interaction.user.id)
         await interaction.response.send_message(
             "🚀 **Asistente de creación de evento iniciado.**\nPor favor, indica el título del evento.",
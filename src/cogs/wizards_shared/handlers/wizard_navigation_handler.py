@@ -77,7 +77,7 @@ class WizardNavigationHandler:
             return
 
         prev_step = self.current_step - 1
-        EventWizardSession.update(self.user_id, "step", prev_step)
+        await EventWizardSession.update(self.user_id, "step", prev_step)
         await self.load_step(interaction, prev_step, step_map or self.STEP_MAP_EVENTS)
 
     # ------------------------------------------------------------
@@ -102,7 +102,7 @@ class WizardNavigationHandler:
             )
             return
 
-        EventWizardSession.update(self.user_id, "step", next_step)
+        await EventWizardSession.update(self.user_id, "step", next_step)
         await self.load_step(interaction, next_step, step_map or self.STEP_MAP_EVENTS)
 
     # ------------------------------------------------------------
@@ -110,7 +110,7 @@ class WizardNavigationHandler:
     # ------------------------------------------------------------
     async def cancel_wizard(self, interaction: Interaction):
         """Cancela el proceso y elimina la sesión activa."""
-        EventWizardSession.end(self.user_id)
+        await EventWizardSession.end(self.user_id)
         await interaction.response.send_message(
             "🛑 Asistente cancelado. Todos los datos han sido eliminados.",
             ephemeral=True
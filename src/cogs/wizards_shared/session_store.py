@@ -0,0 +1,709 @@
+"""
+Archivo: session_store.py
+Ubicación: src/cogs/wizards_shared/
+
+Descripción:
+Almacén compartido de sesiones de los wizards (`EventWizardSession` y
+`SchedulerWizardSession`), con persistencia diferida (write-behind) en la
+tabla `wizard_sessions`.
+
+Cada usuario tiene una única sesión (`SessionRecord`) con un espacio de nombres
+por wizard (`events`, `scheduler`). Al pasar del Events Wizard al Scheduler
+Wizard (`handoff`) no se copia nada: el espacio `scheduler` nace vacío con
+`base="events"` y sus lecturas ven por debajo los datos del evento (ChainMap);
+lo que escribe el scheduler queda en su propio espacio y prevalece.
+
+- Las sesiones viven en memoria; cada cambio solo marca al usuario como
+  "sucio". Un volcado programado escribe, como mucho cada
+  `WIZARD_SESSION_FLUSH_MS` milisegundos, el último estado de todos los
+  usuarios sucios en una única escritura: los cambios de un mismo usuario
+  dentro de la ventana se fusionan y ningún clic paga su propio commit.
+  Lo que cambia mientras un volcado está en curso sale en el siguiente.
+- Tras un reinicio las sesiones se recuperan de forma perezosa: la primera
+  operación asíncrona de un usuario (`hydrate`) carga su sesión de la base
+  de datos. Se pierde como mucho la última ventana de volcado.
+- Sin base de datos asociada (`attach_session_stores`) funciona solo en memoria.
+
+Diario de cambios (`wizard_session_journal`):
+- Las asignaciones sueltas (`assign`, que usan `update`/`bulk_update`) y los
+  avances de paso (`note`) no reescriben la sesión: en el volcado se añade
+  por usuario y espacio un delta con las claves cambiadas y el paso actual
+  (unas decenas de bytes). Los cambios estructurales (`start`, `handoff`,
+  `end`, `edit`) siguen volcando la sesión completa (foto) y vacían su diario.
+- Compactación: en cada barrido, y en cuanto un usuario acumula
+  `WIZARD_SESSION_COMPACT_EVERY` deltas, su sesión en memoria (que ya los
+  incluye) se vuelca como foto y sus deltas se borran en la misma escritura.
+- Al recuperar una sesión tras un reinicio se aplica sobre la foto solo la
+  cola del diario posterior a ella.
+
+Límites de memoria:
+- Caducidad por inactividad: las sesiones sin cambios en `WIZARD_SESSION_TTL`
+  segundos se eliminan (también de la BD). Las sesiones se guardan en orden de
+  última modificación, así que el barrido periódico solo recorre las caducadas.
+- Tope de `WIZARD_SESSION_MAX` usuarios: al superarlo sale de memoria la sesión
+  modificada hace más tiempo (LRU). Su copia en la BD se conserva y se
+  recupera si el usuario vuelve.
+- Bloqueo por usuario: las modificaciones (`locked`) toman uno de
+  `LOCK_STRIPES` candados elegido por `user_id`, de modo que usuarios distintos
+  no compiten entre sí (solo comparten candado por colisión de franja) y la
+  memoria de candados no crece con el número de usuarios.
+- Lecturas sin copia: `SessionRecord.snapshot()` devuelve una vista de solo
+  lectura (`SessionView`) de los datos. Cada espacio lleva la cuenta de sus
+  vistas vivas (referencias débiles): la siguiente modificación (`writable()`)
+  copia el dict solo si alguna sigue viva, de modo que no cambia bajo el
+  lector que la conserva; si ya se descartaron todas se modifica en el sitio.
+- Medidores (`src.utils.metrics`): sessions.wizard.live y
+  sessions.wizard.bytes (tamaño aproximado de los datos); contadores
+  sessions.wizard.expired, sessions.wizard.evicted, sessions.wizard.journaled
+  (deltas escritos) y sessions.wizard.compacted (diarios integrados).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import ChainMap, OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+from weakref import ref
+
+from src.utils.metrics import metrics
+
+FLUSH_INTERVAL = float(os.getenv("WIZARD_SESSION_FLUSH_MS", "250")) / 1000
+SESSION_TTL = float(os.getenv("WIZARD_SESSION_TTL", "1800"))
+MAX_SESSIONS = int(os.getenv("WIZARD_SESSION_MAX", "5000"))
+SWEEP_INTERVAL = 60.0
+LOCK_STRIPES = 64
+COMPACT_EVERY = int(os.getenv("WIZARD_SESSION_COMPACT_EVERY", "64"))
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _approx_size(data: Dict[str, Any]) -> int:
+    """Tamaño aproximado en bytes de los datos de una sesión (dos niveles)."""
+    size = sys.getsizeof(data)
+    for key, value in data.items():
+        size += sys.getsizeof(key) + sys.getsizeof(value)
+        if isinstance(value, dict):
+            value = value.values()
+        if isinstance(value, (list, tuple, set, type({}.values()))):
+            size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+# (user_id, namespace, step, data_json, base, created_at, updated_at)
+SessionRow = Tuple[int, str, Optional[int], str, Optional[str], Optional[str], Optional[str]]
+# (user_id, namespace, step, delta_json, ts)
+JournalRow = Tuple[int, str, Optional[int], Optional[str], int]
+
+
+# --------------------------------------------------------
+# 🔹 Estructura de una sesión
+# --------------------------------------------------------
+class SessionView(Mapping):
+    """Vista de solo lectura de los datos de un espacio (admite referencias débiles)."""
+
+    __slots__ = ("_data", "__weakref__")
+
+    def __init__(self, data: Mapping[str, Any]):
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"SessionView({dict(self._data)!r})"
+
+
+@dataclass
+class Namespace:
+    """Datos de un wizard dentro de la sesión del usuario."""
+
+    data: Dict[str, Any] = field(default_factory=dict)
+    base: Optional[str] = None     # espacio que se ve por debajo (tras un handoff)
+    # Vistas entregadas sobre `data` que siguen vivas: id -> referencia débil
+    # (cada una se borra sola al liberarse la vista; se crea con la primera)
+    views: Optional[Dict[int, ref]] = field(default=None, repr=False, compare=False)
+
+    def share(self, view: SessionView) -> None:
+        views = self.views
+        if views is None:
+            views = self.views = {}
+        key = id(view)
+        views[key] = ref(view, lambda _, views=views, key=key: views.pop(key, None))
+
+    def writable(self) -> Dict[str, Any]:
+        """Dict modificable: copia solo si alguna vista sigue viva (copy-on-write)."""
+        if self.views:
+            self.data = dict(self.data)
+        self.views = None
+        return self.data
+
+
+@dataclass
+class SessionRecord:
+    namespaces: Dict[str, Namespace] = field(default_factory=dict)
+    step: int = 1
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    touched: float = field(default_factory=time.monotonic, repr=False, compare=False)
+    size: int = field(default=0, repr=False, compare=False)
+
+    def snapshot(self, name: str) -> Optional[Mapping[str, Any]]:
+        """Vista de solo lectura del espacio `name` (y de su base), sin copia."""
+        ns = self.namespaces.get(name)
+        if ns is None:
+            return None
+        base = self.namespaces.get(ns.base) if ns.base else None
+        if base is None:
+            view = SessionView(ns.data)
+        else:
+            view = SessionView(ChainMap(ns.data, base.data))
+            base.share(view)
+        ns.share(view)
+        return view
+
+    def writable(self, name: str) -> Dict[str, Any]:
+        """Dict modificable del espacio `name` (se crea si no existe)."""
+        ns = self.namespaces.get(name)
+        if ns is None:
+            ns = self.namespaces[name] = Namespace()
+        return ns.writable()
+
+    def drop(self, name: str) -> None:
+        """Elimina un espacio; los que lo usaban de base se quedan con una copia."""
+        removed = self.namespaces.pop(name, None)
+        if removed is None:
+            return
+        for ns in self.namespaces.values():
+            if ns.base == name:
+                ns.data = {**removed.data, **ns.data}
+                ns.base = None
+                ns.views = None
+
+
+# --------------------------------------------------------
+# 🔹 Almacén con volcado diferido
+# --------------------------------------------------------
+class SessionStore:
+    """Sesiones de los wizards indexadas por usuario."""
+
+    def __init__(self, name: str = "wizard", flush_interval: float = FLUSH_INTERVAL,
+                 ttl: float = SESSION_TTL, max_sessions: int = MAX_SESSIONS,
+                 sweep_interval: float = SWEEP_INTERVAL, lock_stripes: int = LOCK_STRIPES,
+                 compact_every: int = COMPACT_EVERY, clock=time.monotonic):
+        self.name = name
+        self.flush_interval = flush_interval
+        self.ttl = ttl
+        self.max_sessions = max(1, max_sessions)
+        self.sweep_interval = sweep_interval
+        self.compact_every = max(1, compact_every)
+        self.clock = clock
+        # Orden = última modificación (la primera es la más antigua)
+        self._sessions: "OrderedDict[int, SessionRecord]" = OrderedDict()
+        self._bytes = 0
+        self._backend = None          # WizardSessionDB
+        self._dirty: Set[int] = set()                     # se vuelcan completas (foto)
+        self._deltas: Dict[int, Dict[str, Set[str]]] = {}  # claves cambiadas, al diario
+        self._journaled: Dict[int, int] = {}              # deltas en la BD desde la última foto
+        self._deleted: Set[int] = set()
+        self._spilled: Dict[int, List[SessionRow]] = {}   # expulsadas por el tope, sin volcar
+        self._saving: Set[int] = set()    # usuarios del volcado en curso
+        self._checked: Set[int] = set()   # usuarios ya buscados en la BD
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._locks = [asyncio.Lock() for _ in range(max(1, lock_stripes))]
+
+    # ---------- Bloqueo por usuario ----------
+
+    def lock(self, user_id: int) -> asyncio.Lock:
+        """Candado de la franja de `user_id`."""
+        return self._locks[hash(user_id) % len(self._locks)]
+
+    @asynccontextmanager
+    async def locked(self, user_id: int, create: bool = True) -> AsyncIterator[Optional[SessionRecord]]:
+        """
+        Sesión del usuario para modificarla en exclusiva (recuperándola de la BD
+        si hace falta). Al salir sin error se actualiza `updated_at` y se
+        programa el volcado. Con `create=False` devuelve None si no existe.
+        """
+        async with self.lock(user_id):
+            record = await self.hydrate(user_id)
+            if record is None and create:
+                record = self.get_or_create(user_id)
+            yield record
+            if record is not None and self._sessions.get(user_id) is record:
+                self.touch(user_id)
+
+    async def assign(self, user_id: int, name: str, values: Mapping[str, Any]) -> None:
+        """
+        Asigna `values` en el espacio `name` (creándolo si no existe). Si el
+        espacio ya existía, el cambio se vuelca como delta al diario.
+        """
+        async with self.lock(user_id):
+            record = await self.hydrate(user_id) or self.get_or_create(user_id)
+            created = name not in record.namespaces
+            record.writable(name).update(values)
+            if created:
+                self.touch(user_id)
+            else:
+                self.note(user_id, name, values.keys())
+
+    # ---------- Memoria ----------
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, user_id: int) -> Optional[SessionRecord]:
+        return self._sessions.get(user_id)
+
+    def view(self, user_id: int, name: str) -> Optional[Mapping[str, Any]]:
+        """Vista de solo lectura del espacio `name` del usuario (None si no existe)."""
+        record = self._sessions.get(user_id)
+        return record.snapshot(name) if record is not None else None
+
+    def has(self, user_id: int, name: str) -> bool:
+        record = self._sessions.get(user_id)
+        return record is not None and name in record.namespaces
+
+    def start(self, user_id: int, name: str, data: Optional[Mapping[str, Any]] = None,
+              step: Optional[int] = None) -> SessionRecord:
+        """(Re)inicia el espacio `name` del usuario con una copia de `data`."""
+        record = self._sessions.get(user_id)
+        if record is None:
+            record = self.put(user_id, SessionRecord())
+        record.drop(name)
+        record.namespaces[name] = Namespace(dict(data or {}))
+        if step is not None:
+            record.step = step
+        self.touch(user_id)
+        return record
+
+    def handoff(self, user_id: int, source: str, target: str) -> Optional[SessionRecord]:
+        """
+        Pasa la sesión de un wizard a otro en O(1): `target` nace vacío y ve
+        los datos de `source` por debajo. None si no hay datos de `source`.
+        """
+        record = self._sessions.get(user_id)
+        if record is None or source not in record.namespaces:
+            return None
+        record.drop(target)
+        record.namespaces[target] = Namespace(base=source)
+        self.touch(user_id)
+        return record
+
+    def end(self, user_id: int, name: str) -> None:
+        """Elimina el espacio `name`; sin espacios restantes, toda la sesión."""
+        record = self._sessions.get(user_id)
+        if record is None:
+            self.remove(user_id)
+            return
+        record.drop(name)
+        if record.namespaces:
+            self.touch(user_id)
+        else:
+            self.remove(user_id)
+
+    @property
+    def approx_bytes(self) -> int:
+        return self._bytes
+
+    def put(self, user_id: int, record: SessionRecord) -> SessionRecord:
+        old = self._sessions.pop(user_id, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._sessions[user_id] = record
+        self._refresh(record)
+        self._spilled.pop(user_id, None)
+        self.mark_dirty(user_id)
+        while len(self._sessions) > self.max_sessions:
+            self._evict_lru()
+        self._ensure_sweeper()
+        self._publish()
+        return record
+
+    def get_or_create(self, user_id: int) -> SessionRecord:
+        record = self._sessions.get(user_id)
+        if record is None:
+            record = self.put(user_id, SessionRecord())
+        return record
+
+    def touch(self, user_id: int) -> None:
+        """Actualiza `updated_at` y programa el volcado de la sesión completa."""
+        if self._bump(user_id):
+            self.mark_dirty(user_id)
+
+    def note(self, user_id: int, name: str, keys: Iterable[str] = ()) -> None:
+        """
+        Como `touch`, pero el cambio (las claves `keys` del espacio `name` y el
+        paso actual) se vuelca al diario como delta.
+        """
+        if not self._bump(user_id):
+            return
+        self._checked.add(user_id)
+        if self._backend is None or user_id in self._dirty:
+            return   # sin BD, o ya va una foto en el próximo volcado
+        self._deltas.setdefault(user_id, {}).setdefault(name, set()).update(keys)
+        self._schedule_flush()
+
+    def _bump(self, user_id: int) -> bool:
+        record = self._sessions.get(user_id)
+        if record is None:
+            return False
+        record.updated_at = _now_iso()
+        self._sessions.move_to_end(user_id)
+        self._bytes -= record.size
+        self._refresh(record)
+        self._publish()
+        return True
+
+    def remove(self, user_id: int) -> None:
+        record = self._sessions.pop(user_id, None)
+        if record is not None:
+            self._bytes -= record.size
+        self._dirty.discard(user_id)
+        self._deltas.pop(user_id, None)
+        self._journaled.pop(user_id, None)
+        self._spilled.pop(user_id, None)
+        self._checked.add(user_id)
+        if self._backend is not None:
+            self._deleted.add(user_id)
+            self._schedule_flush()
+        self._publish()
+
+    def _refresh(self, record: SessionRecord) -> None:
+        record.touched = self.clock()
+        record.size = sum(_approx_size(ns.data) for ns in record.namespaces.values())
+        self._bytes += record.size
+
+    def _publish(self) -> None:
+        metrics.gauge(f"sessions.{self.name}.live", len(self._sessions))
+        metrics.gauge(f"sessions.{self.name}.bytes", self._bytes)
+
+    # ---------- Límites ----------
+
+    def _evict_lru(self) -> None:
+        """Saca de memoria la sesión modificada hace más tiempo (la BD la conserva)."""
+        user_id, record = self._sessions.popitem(last=False)
+        self._bytes -= record.size
+        # También las del volcado en curso: la BD aún puede tener la versión anterior
+        if user_id in self._dirty or user_id in self._deltas or user_id in self._saving:
+            self._dirty.discard(user_id)
+            self._deltas.pop(user_id, None)
+            self._spilled[user_id] = self._rows(user_id, record)
+        self._journaled.pop(user_id, None)
+        self._checked.discard(user_id)
+        metrics.incr(f"sessions.{self.name}.evicted")
+
+    def sweep(self) -> int:
+        """Elimina las sesiones inactivas más de `ttl` segundos. Coste O(caducadas)."""
+        deadline = self.clock() - self.ttl
+        expired = []
+        for user_id, record in self._sessions.items():
+            if record.touched > deadline:
+                break
+            expired.append(user_id)
+        for user_id in expired:
+            self.remove(user_id)
+        if expired:
+            metrics.incr(f"sessions.{self.name}.expired", len(expired))
+        self._publish()
+        return len(expired)
+
+    def compact(self) -> int:
+        """Programa como foto las sesiones con deltas en el diario (la memoria ya los incluye)."""
+        users = [u for u in self._journaled if u in self._sessions]
+        for user_id in users:
+            self.mark_dirty(user_id)
+        return len(users)
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.get_running_loop().create_task(
+                self._sweep_loop(), name=f"sessions-sweep-{self.name}")
+
+    async def _sweep_loop(self) -> None:
+        # Sesiones abandonadas antes del último reinicio: solo existen en la BD
+        if self._backend is not None:
+            cutoff = (datetime.now(timezone.utc) - timedelta(seconds=self.ttl)).isoformat()
+            try:
+                await self._backend.purge(cutoff)
+            except Exception as e:
+                print(f"⚠️ [Sessions] No se pudieron purgar sesiones caducadas de {self.name}: {e}")
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+            self.compact()
+
+    # ---------- Persistencia ----------
+
+    def attach(self, backend) -> None:
+        self._backend = backend
+        self._checked.clear()
+
+    async def hydrate(self, user_id: int) -> Optional[SessionRecord]:
+        """Sesión del usuario, cargándola de la BD la primera vez tras un reinicio."""
+        record = self._sessions.get(user_id)
+        if record is not None or self._backend is None or user_id in self._checked:
+            return record
+
+        spilled = self._spilled.pop(user_id, None)
+        if spilled is not None:
+            # Expulsada por el tope antes de llegar a volcarse
+            self._checked.add(user_id)
+            record = self._from_rows(spilled)
+            self._restore(user_id, record)
+            self.mark_dirty(user_id)
+            return record
+
+        try:
+            rows, journal = await self._backend.load(user_id)
+        except Exception as e:
+            print(f"⚠️ [Sessions] No se pudo recuperar la sesión {self.name}/{user_id}: {e}")
+            return self._sessions.get(user_id)
+        self._checked.add(user_id)
+
+        # Otra corrutina pudo crear la sesión mientras se leía la BD
+        record = self._sessions.get(user_id)
+        if record is None and rows and user_id not in self._deleted:
+            record = self._from_rows(rows, journal)
+            self._restore(user_id, record)
+            if journal:
+                self._journaled[user_id] = len(journal)
+        return record
+
+    @staticmethod
+    def _from_rows(rows: List[SessionRow], journal: Iterable[JournalRow] = ()) -> SessionRecord:
+        record = SessionRecord()
+        for _, name, step, data, base, created_at, updated_at in rows:
+            try:
+                record.namespaces[name] = Namespace(json.loads(data or "{}"), base)
+            except ValueError as e:
+                print(f"⚠️ [Sessions] Espacio '{name}' corrupto, se descarta: {e}")
+                continue
+            record.step = step or record.step
+            record.created_at = created_at or record.created_at
+            record.updated_at = updated_at or record.updated_at
+
+        # Cola del diario posterior a la foto, en orden
+        for _, name, step, delta, ts in journal:
+            try:
+                values = json.loads(delta) if delta else {}
+            except ValueError as e:
+                print(f"⚠️ [Sessions] Delta corrupto en '{name}', se descarta: {e}")
+                continue
+            ns = record.namespaces.get(name)
+            if ns is None:
+                ns = record.namespaces[name] = Namespace()
+            ns.data.update(values)
+            record.step = step or record.step
+            record.updated_at = datetime.fromtimestamp(ts, timezone.utc).isoformat()
+        return record
+
+    def _restore(self, user_id: int, record: SessionRecord) -> None:
+        """Vuelve a poner en memoria una sesión recuperada (sin marcarla sucia)."""
+        self._sessions[user_id] = record
+        self._refresh(record)
+        while len(self._sessions) > self.max_sessions:
+            self._evict_lru()
+        self._ensure_sweeper()
+        self._publish()
+
+    def mark_dirty(self, user_id: int) -> None:
+        self._checked.add(user_id)
+        if self._backend is None:
+            return
+        self._deleted.discard(user_id)
+        self._deltas.pop(user_id, None)
+        self._dirty.add(user_id)
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush_later(), name=f"sessions-flush-{self.name}")
+
+    @property
+    def pending(self) -> bool:
+        """Hay cambios aún sin volcar."""
+        return bool(self._dirty or self._deltas or self._deleted or self._spilled)
+
+    async def _flush_later(self) -> None:
+        # Los cambios que llegan durante un volcado no programan otro (esta
+        # tarea sigue viva): se repite mientras quede algo pendiente
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if self._closing or self._backend is None or not self.pending:
+                return
+
+    async def flush(self) -> None:
+        """
+        Vuelca a la BD el último estado de los usuarios sucios y los borrados,
+        y los deltas pendientes al diario.
+        """
+        async with self._flush_lock:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if self._backend is None or not self.pending:
+            return
+
+        dirty, self._dirty = self._dirty, set()
+        deltas, self._deltas = self._deltas, {}
+        deleted, self._deleted = self._deleted, set()
+        # Las expulsadas siguen en `_spilled` hasta que se confirme la escritura:
+        # `hydrate` las recupera de ahí y no de la copia antigua de la BD
+        spilled = dict(self._spilled)
+
+        # Diario demasiado largo: se compacta ya en lugar de añadir más deltas
+        for user_id in [u for u, names in deltas.items()
+                        if self._journaled.get(u, 0) + len(names) > self.compact_every]:
+            del deltas[user_id]
+            dirty.add(user_id)
+
+        rows = [row for user_rows in spilled.values() for row in user_rows]
+        for user_id in dirty:
+            record = self._sessions.get(user_id)
+            if record is not None:
+                rows.extend(self._rows(user_id, record))
+        journal = self._journal_rows(deltas)
+        snapshots = dirty | deleted | spilled.keys()
+
+        self._saving = dirty | deltas.keys()
+        try:
+            await self._backend.save(rows, snapshots, journal)
+        except Exception as e:
+            print(f"⚠️ [Sessions] Error al volcar sesiones de {self.name}: {e}")
+            # Reintentar en el siguiente volcado sin pisar cambios más recientes
+            # (los deltas perdidos se vuelcan como foto; las expulsadas siguen en `_spilled`)
+            self._dirty |= {u for u in dirty | deltas.keys()
+                            if u in self._sessions and u not in self._deleted}
+            self._deleted |= deleted - self._dirty
+            self._schedule_flush()
+            return
+        finally:
+            self._saving = set()
+
+        for user_id, user_rows in spilled.items():
+            if self._spilled.get(user_id) is user_rows:
+                del self._spilled[user_id]
+
+        compacted = sum(1 for u in snapshots if self._journaled.pop(u, None))
+        for user_id, *_ in journal:
+            self._journaled[user_id] = self._journaled.get(user_id, 0) + 1
+        if compacted:
+            metrics.incr(f"sessions.{self.name}.compacted", compacted)
+        if journal:
+            metrics.incr(f"sessions.{self.name}.journaled", len(journal))
+
+    def _journal_rows(self, deltas: Dict[int, Dict[str, Set[str]]]) -> List[JournalRow]:
+        """Un delta por usuario y espacio con el valor actual de las claves cambiadas."""
+        ts = int(time.time())
+        journal = []
+        for user_id, names in deltas.items():
+            record = self._sessions.get(user_id)
+            if record is None:
+                continue
+            for name, keys in names.items():
+                ns = record.namespaces.get(name)
+                if ns is None:
+                    continue
+                delta = {key: ns.data[key] for key in keys if key in ns.data}
+                journal.append((
+                    user_id, name, record.step,
+                    json.dumps(delta, default=str, separators=(",", ":")) if delta else None,
+                    ts,
+                ))
+        return journal
+
+    @staticmethod
+    def _rows(user_id: int, record: SessionRecord) -> List[SessionRow]:
+        return [
+            (user_id, name, record.step,
+             json.dumps(ns.data, default=str, separators=(",", ":")),
+             ns.base, record.created_at, record.updated_at)
+            for name, ns in record.namespaces.items()
+        ]
+
+    async def close(self) -> None:
+        """Detiene el barrido, espera al volcado programado y vuelca lo pendiente."""
+        sweeper, self._sweep_task = self._sweep_task, None
+        if sweeper is not None:
+            sweeper.cancel()
+            try:
+                await sweeper
+            except asyncio.CancelledError:
+                pass
+
+        # El volcado programado termina tras su pasada actual; el resto va aquí
+        self._closing = True
+        try:
+            task, self._flush_task = self._flush_task, None
+            if task is not None and not task.done():
+                await task
+            await self.flush()
+        finally:
+            self._closing = False
+
+
+# --------------------------------------------------------
+# 🔹 Registro de almacenes
+# --------------------------------------------------------
+_STORE = SessionStore()
+
+
+def get_store() -> SessionStore:
+    """Almacén único de sesiones de los wizards."""
+    return _STORE
+
+
+def attach_session_stores(db) -> None:
+    """Activa la persistencia de las sesiones sobre `db.wizard_sessions`."""
+    backend = getattr(db, "wizard_sessions", None)
+    if backend is None:
+        print("⚠️ [Sessions] WizardSessionDB no disponible: sesiones solo en memoria.")
+        return
+    _STORE.attach(backend)
+
+
+async def close_session_stores() -> None:
+    """Vuelca las sesiones pendientes (al cerrar el bot)."""
+    await _STORE.close()
+
+
+__all__ = [
+    "COMPACT_EVERY",
+    "FLUSH_INTERVAL",
+    "Namespace",
+    "SessionRecord",
+    "SessionView",
+    "SessionStore",
+    "get_store",
+    "attach_session_stores",
+    "close_session_stores",
+]
@@ -26,9 +26,6 @@ class EventCreationWizardView(discord.ui.View):
         self.user_id = user_id
         self.current_step = 1
 
-        # Crear sesión temporal
-        EventWizardSession.start(user_id, {"step": 1, "data": {}})
-
     async def update_message(self, interaction: discord.Interaction, content: str):
         """Actualiza el mensaje ephemeral con nuevo contenido."""
         await interaction.response.edit_message(content=content, view=self)
@@ -36,7 +33,7 @@ class EventCreationWizardView(discord.ui.View):
     async def next_step(self, interaction: discord.Interaction):
         """Avanza al siguiente paso del wizard."""
         self.current_step += 1
-        EventWizardSession.update(self.user_id, "step", self.current_step)
+        await EventWizardSession.update(self.user_id, "step", self.current_step)
 
         if self.current_step == 2:
             await self.step_2_description(interaction)
@@ -45,7 +42,7 @@ class EventCreationWizardView(discord.ui.View):
 
     async def cancel_wizard(self, interaction: discord.Interaction):
         """Cancela el proceso y elimina la sesión temporal."""
-        EventWizardSession.delete(self.user_id)
+        await EventWizardSession.delete(self.user_id)
         await interaction.response.edit_message(
             content="❌ **Creación de evento cancelada.**",
             view=None
@@ -70,7 +67,7 @@ class EventCreationWizardView(discord.ui.View):
         """Finaliza el proceso y muestra los datos recopilados."""
         session_data = EventWizardSession.get(self.user_id)
         data = session_data.get("data", {})
-        EventWizardSession.delete(self.user_id)
+        await EventWizardSession.delete(self.user_id)
         await interaction.response.edit_message(
             content=f"🎉 **Evento creado parcialmente (pasos iniciales OK)**\nDatos recopilados: `{data}`",
             view=None
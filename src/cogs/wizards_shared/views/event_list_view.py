@@ -0,0 +1,96 @@
+"""
+Archivo: event_list_view.py
+Ubicación: src/cogs/wizards_shared/views/
+
+Descripción:
+Vista paginada para el comando `/list_events`. Cada pulsación de
+"Anterior" / "Siguiente" solicita una única página a
+`EventDB.list_events_page` usando el cursor de la página actual, de modo que
+la latencia no depende del número total de eventos del servidor y el embed
+nunca supera el límite de campos de Discord.
+"""
+
+import discord
+from discord import ui, Interaction, ButtonStyle
+
+# Discord admite hasta 25 campos por embed
+PAGE_SIZE = 10
+
+
+class EventListView(ui.View):
+    """Listado de eventos por estado con navegación por páginas."""
+
+    def __init__(self, event_db, guild_id: int, status: str, user_id: int):
+        super().__init__(timeout=300)
+        self.event_db = event_db
+        self.guild_id = guild_id
+        self.status = status
+        self.user_id = user_id
+        self.page = None
+        self.page_number = 1
+
+        self.prev_button = PreviousPageButton()
+        self.next_button = NextPageButton()
+        self.add_item(self.prev_button)
+        self.add_item(self.next_button)
+
+    async def load(self, cursor=None, backwards: bool = False):
+        """Carga una página y actualiza el estado de los botones."""
+        self.page = await self.event_db.list_events_page(
+            self.guild_id,
+            status=self.status,
+            cursor=cursor,
+            limit=PAGE_SIZE,
+            backwards=backwards,
+        )
+        self.prev_button.disabled = self.page.prev_cursor is None
+        self.next_button.disabled = self.page.next_cursor is None
+        return self.page
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"Eventos — {self.status.upper()}",
+            color=discord.Color.blurple(),
+        )
+        for ev in self.page.items:
+            embed.add_field(
+                name=f"📝 {ev['title']}",
+                value=f"ID: `{ev['event_id']}`\nCreado: {(ev['created_at'] or '')[:16]}",
+                inline=False
+            )
+        embed.set_footer(text=f"Página {self.page_number}")
+        return embed
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                "🚫 Solo quien ejecutó el comando puede cambiar de página.",
+                ephemeral=True
+            )
+            return False
+        return True
+
+
+# --------------------------------------------------------
+# 🔹 Botones de navegación
+# --------------------------------------------------------
+class PreviousPageButton(ui.Button):
+    def __init__(self):
+        super().__init__(label="⬅️ Anterior", style=ButtonStyle.secondary)
+
+    async def callback(self, interaction: Interaction):
+        view: EventListView = self.view
+        await view.load(view.page.prev_cursor, backwards=True)
+        view.page_number = max(1, view.page_number - 1)
+        await interaction.response.edit_message(embed=view.build_embed(), view=view)
+
+
+class NextPageButton(ui.Button):
+    def __init__(self):
+        super().__init__(label="Siguiente ➡️", style=ButtonStyle.secondary)
+
+    async def callback(self, interaction: Interaction):
+        view: EventListView = self.view
+        await view.load(view.page.next_cursor)
+        view.page_number += 1
+        await interaction.response.edit_message(embed=view.build_embed(), view=view)
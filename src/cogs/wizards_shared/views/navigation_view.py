@@ -70,7 +70,7 @@ class PreviousStepButton(ui.Button):
             )
             return
 
-        EventWizardSession.update(user_id, "step", prev_step)
+        await EventWizardSession.update(user_id, "step", prev_step)
         await interaction.response.defer(ephemeral=True)
         await load_step(interaction, prev_step)
 
@@ -95,7 +95,7 @@ class NextStepButton(ui.Button):
             )
             return
 
-        EventWizardSession.update(user_id, "step", next_step)
+        await EventWizardSession.update(user_id, "step", next_step)
         await interaction.response.defer(ephemeral=True)
         await load_step(interaction, next_step)
 
@@ -133,7 +133,7 @@ class ConfirmCancelButton(ui.Button):
         super().__init__(label="✅ Sí, cancelar", style=ButtonStyle.danger)
 
     async def callback(self, interaction: Interaction):
-        EventWizardSession.end(interaction.user.id)
+        await EventWizardSession.end(interaction.user.id)
         await interaction.response.edit_message(
             content="🛑 Has cancelado la creación del evento. Todos los datos han sido eliminados.",
             view=None
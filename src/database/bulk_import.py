@@ -0,0 +1,304 @@
+"""
+Archivo: bulk_import.py
+Ubicación: src/database/
+
+Descripción:
+API de importación masiva para eventos, circuitos e ítems de listas de
+circuitos / vehículos. Acepta iterables o generadores asíncronos de filas,
+las valida con validadores precompilados por tabla (`RowSpec`) y las inserta
+con `executemany` en transacciones por bloques (`chunk_size`) a través de la
+cola de escritura.
+
+Errores por fila:
+- Las filas que no superan la validación se anotan en el informe y no se
+  envían a la base de datos.
+- Si un bloque falla en SQLite (p. ej. título de evento duplicado), ese bloque
+  se reintenta fila a fila con SAVEPOINT para aislar las filas culpables; el
+  resto del bloque y de la importación continúa.
+
+Uso:
+    report = await db.bulk.import_vehicle_list_items(list_id, modelos)
+    print(report.inserted, report.errors)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import (
+    Any, AsyncIterable, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union,
+)
+
+import aiosqlite
+
+from .timestamps import to_epoch
+from .migrations import EPOCH_COLUMNS
+
+Rows = Union[Iterable[Any], AsyncIterable[Any]]
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+# ---------------------------------------------------------
+# 📋 Informe
+# ---------------------------------------------------------
+@dataclass
+class RowError:
+    index: int
+    row: Any
+    message: str
+
+
+@dataclass
+class ImportReport:
+    inserted: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    def merge(self, other: "ImportReport") -> None:
+        self.inserted += other.inserted
+        self.errors.extend(other.errors)
+
+
+# ---------------------------------------------------------
+# ✅ Validadores
+# ---------------------------------------------------------
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _integer(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return int(value)
+    return int(value)
+
+
+def _flag(value: Any) -> int:
+    return 1 if value in (True, 1, "1", "true", "True") else 0
+
+
+def _iso(value: Any) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return str(value)
+
+
+@dataclass(frozen=True)
+class Field:
+    name: str
+    coerce: Callable[[Any], Any] = _text
+    required: bool = False
+    default: Any = None
+    # Columna de origen en la fila (para columnas derivadas como `event_ts`)
+    source: Optional[str] = None
+
+
+class RowSpec:
+    """Validador precompilado: columnas, conversores y sentencia INSERT de una tabla."""
+
+    __slots__ = ("table", "fields", "sql", "_plan")
+
+    def __init__(self, table: str, fields: Sequence[Field]):
+        self.table = table
+        self.fields = tuple(fields)
+        columns = ", ".join(f.name for f in self.fields)
+        placeholders = ", ".join("?" for _ in self.fields)
+        self.sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        self._plan = tuple(
+            (f.source or f.name, f.name, f.coerce, f.required, f.default) for f in self.fields)
+
+    def validate(self, row: Mapping[str, Any]) -> Tuple[Any, ...]:
+        """Devuelve la tupla de parámetros o lanza ValueError con el motivo."""
+        if not isinstance(row, Mapping):
+            raise ValueError(f"fila no válida para '{self.table}': {row!r}")
+        values = []
+        for source, name, coerce, required, default in self._plan:
+            if source in row:
+                raw = row[source]
+            else:
+                # Solo los valores por defecto del spec pueden ser fábricas
+                raw = default() if callable(default) else default
+            try:
+                value = coerce(raw)
+            except (TypeError, ValueError):
+                raise ValueError(f"valor no válido para '{name}': {raw!r}") from None
+            if value is None and required:
+                raise ValueError(f"falta el campo obligatorio '{name}'")
+            values.append(value)
+        return tuple(values)
+
+
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+EVENT_SPEC = RowSpec("events", [
+    Field("guild_id", _integer, required=True),
+    Field("title", _text, required=True),
+    Field("description"),
+    Field("event_type", _text, default="standard"),
+    Field("status", _text, default="draft"),
+    Field("timezone"),
+    Field("event_datetime_utc", _iso),
+    Field("publish_datetime_utc", _iso),
+    Field("registration_open_utc", _iso),
+    Field("registration_close_utc", _iso),
+    *(Field(ts, to_epoch, source=iso) for iso, ts in EPOCH_COLUMNS.items()
+      if iso != "archive_expires_at"),
+    Field("track_name"),
+    Field("max_drivers", _integer),
+    Field("is_championship", _flag, default=0),
+    Field("championship_id", _integer),
+    Field("created_by", _integer, required=True),
+    Field("created_at", _iso, default=_now_iso),
+])
+
+TRACK_SPEC = RowSpec("tracks", [
+    Field("guild_id", _integer, required=True),
+    Field("name", _text, required=True),
+    Field("layout"),
+    Field("pit_slots", _integer, required=True),
+    Field("broadcast_slots", _integer, default=0),
+    Field("details"),
+    Field("image_path"),
+])
+
+TRACK_LIST_ITEM_SPEC = RowSpec("track_list_items", [
+    Field("list_id", _integer, required=True),
+    Field("track_name", _text, required=True),
+])
+
+VEHICLE_LIST_ITEM_SPEC = RowSpec("vehicle_list_items", [
+    Field("list_id", _integer, required=True),
+    Field("model_name", _text, required=True),
+])
+
+
+# ---------------------------------------------------------
+# 🧩 Inserción dentro de una operación de escritura
+# ---------------------------------------------------------
+async def insert_rows(
+    conn: aiosqlite.Connection,
+    spec: RowSpec,
+    rows: Iterable[Mapping[str, Any]],
+    offset: int = 0,
+) -> ImportReport:
+    """
+    Valida e inserta `rows` con `executemany` sobre una conexión de escritura
+    ya dentro de una transacción (p. ej. dentro de un `submit_write`).
+    `offset` ajusta los índices de fila del informe.
+    """
+    report = ImportReport()
+    valid: List[Tuple[int, Any, Tuple[Any, ...]]] = []
+    for i, row in enumerate(rows, start=offset):
+        try:
+            valid.append((i, row, spec.validate(row)))
+        except ValueError as e:
+            report.errors.append(RowError(i, row, str(e)))
+
+    if not valid:
+        return report
+
+    await conn.execute("SAVEPOINT bulk_chunk;")
+    try:
+        await conn.executemany(spec.sql, [params for _, _, params in valid])
+    except aiosqlite.Error:
+        # Aislar las filas que fallan sin descartar el resto del bloque
+        await conn.execute("ROLLBACK TO bulk_chunk;")
+        for i, row, params in valid:
+            await conn.execute("SAVEPOINT bulk_row;")
+            try:
+                await conn.execute(spec.sql, params)
+            except aiosqlite.Error as e:
+                await conn.execute("ROLLBACK TO bulk_row;")
+                report.errors.append(RowError(i, row, str(e)))
+            else:
+                report.inserted += 1
+            await conn.execute("RELEASE bulk_row;")
+    else:
+        report.inserted += len(valid)
+    await conn.execute("RELEASE bulk_chunk;")
+    return report
+
+
+async def _chunks(rows: Rows, size: int):
+    """Agrupa un iterable síncrono o asíncrono en listas de `size` elementos."""
+    chunk: List[Any] = []
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    else:
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+# ---------------------------------------------------------
+# 📦 Importador
+# ---------------------------------------------------------
+class BulkImporter:
+    """Importación masiva por bloques a través de la cola de escritura."""
+
+    def __init__(self, db, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = max(1, chunk_size)
+
+    async def import_rows(self, spec: RowSpec, rows: Rows) -> ImportReport:
+        report = ImportReport()
+        offset = 0
+        async for chunk in _chunks(rows, self.chunk_size):
+            start = offset
+            report.merge(await self.db.submit_write(
+                lambda conn, chunk=chunk, start=start: insert_rows(conn, spec, chunk, start)))
+            offset += len(chunk)
+        report.errors.sort(key=lambda err: err.index)
+        return report
+
+    async def import_events(self, rows: Rows) -> ImportReport:
+        """Eventos (dicts con al menos `guild_id`, `title` y `created_by`)."""
+        return await self.import_rows(EVENT_SPEC, rows)
+
+    async def import_tracks(self, rows: Rows) -> ImportReport:
+        """Circuitos (dicts con al menos `guild_id`, `name` y `pit_slots`)."""
+        return await self.import_rows(TRACK_SPEC, rows)
+
+    async def import_track_list_items(self, list_id: int, names: Rows) -> ImportReport:
+        """Nombres de circuito para la lista `list_id`."""
+        return await self.import_rows(
+            TRACK_LIST_ITEM_SPEC, _as_items(names, list_id, "track_name"))
+
+    async def import_vehicle_list_items(self, list_id: int, models: Rows) -> ImportReport:
+        """Modelos de vehículo para la lista `list_id`."""
+        return await self.import_rows(
+            VEHICLE_LIST_ITEM_SPEC, _as_items(models, list_id, "model_name"))
+
+
+def _as_items(values: Rows, list_id: int, column: str) -> Rows:
+    """Convierte nombres sueltos en filas {list_id, column}."""
+    def wrap(value):
+        return value if isinstance(value, Mapping) else {"list_id": list_id, column: value}
+
+    if hasattr(values, "__aiter__"):
+        async def agen():
+            async for value in values:
+                yield wrap(value)
+        return agen()
+    return (wrap(value) for value in values)
@@ -0,0 +1,173 @@
+"""
+Archivo: change_feed.py
+Ubicación: src/database/
+
+Descripción:
+Canal de cambios entre procesos que comparten la misma base de datos. Los
+observadores de `EventDB` / `ReminderDB` / `PermissionIndex` solo ven las
+escrituras del propio proceso; con varios procesos (blue/green, shards) el
+resto se enteraría únicamente al reiniciar.
+
+- Los disparadores de la migración v13 anotan en `change_log` cada cambio
+  relevante como (`entity`, `entity_id`): `event`, `reminder`,
+  `participants` (id del evento) y `permission` (id del servidor).
+- `ChangeFeed` sondea la tabla cada `interval` segundos con una consulta por
+  clave primaria a partir del último `seq` leído y reparte los ids afectados
+  a los suscriptores de cada entidad (`subscribe`).
+- Si faltan filas entre el cursor y lo leído (poda de `change_log` mientras
+  el proceso estaba retrasado), se llama a los suscriptores con `None`:
+  deben recargar todo su estado.
+- Las filas más antiguas que `retention` segundos se podan periódicamente.
+
+También se reciben los cambios del propio proceso, ya aplicados por los
+observadores locales: los suscriptores releen el estado de la base de datos
+y deben ser idempotentes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+CHANGE_POLL_INTERVAL = float(os.getenv("DB_CHANGE_POLL_INTERVAL", "2"))
+CHANGE_RETENTION = float(os.getenv("DB_CHANGE_RETENTION", "3600"))
+# Cada cuánto se podan las filas caducadas (segundos)
+CHANGE_PRUNE_INTERVAL = 600.0
+# Filas por lectura (también acota el IN (...) de los suscriptores)
+CHANGE_BATCH = 500
+
+ChangeCallback = Callable[[Optional[Set[int]]], Awaitable[None]]
+
+
+class ChangeFeed:
+    """Reparte a los suscriptores los cambios anotados en `change_log`."""
+
+    def __init__(self, db, interval: float = CHANGE_POLL_INTERVAL,
+                 retention: float = CHANGE_RETENTION, batch: int = CHANGE_BATCH,
+                 clock: Callable[[], float] = time.time):
+        self.db = db
+        self.interval = interval
+        self.retention = retention
+        self.batch = max(1, batch)
+        self.clock = clock
+        self.cursor: Optional[int] = None
+        self._subscribers: Dict[str, List[ChangeCallback]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+
+    def subscribe(self, entity: str, callback: ChangeCallback) -> None:
+        """Registra `callback(ids)` para los cambios de `entity` (`None` = recargar todo)."""
+        callbacks = self._subscribers.setdefault(entity, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+
+    # ---------------------------------------------------------
+    # 🔹 Ciclo de vida
+    # ---------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Empieza a leer desde el final actual del registro (idempotente)."""
+        if self.running:
+            return
+        if self.cursor is None:
+            async with self.db.reader() as conn:
+                self.cursor = await self._high_water(conn)
+        self._task = asyncio.create_task(self._run(), name="change-feed")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                while await self.poll() >= self.batch:
+                    pass
+                if self.clock() - self._last_prune >= min(self.retention, CHANGE_PRUNE_INTERVAL):
+                    await self.prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ [DB] Error al leer el registro de cambios: {e}")
+            await asyncio.sleep(self.interval)
+
+    # ---------------------------------------------------------
+    # 📡 Lectura y reparto
+    # ---------------------------------------------------------
+    @staticmethod
+    async def _high_water(conn) -> int:
+        """Último `seq` asignado (aunque su fila ya se haya podado)."""
+        async with conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'change_log';"
+        ) as cur:
+            row = await cur.fetchone()
+        return row[0] if row else 0
+
+    async def poll(self) -> int:
+        """Lee y reparte un lote de cambios. Devuelve cuántas filas se leyeron."""
+        async with self.db.reader() as conn:
+            high = await self._high_water(conn)
+            if self.cursor is None:
+                self.cursor = high
+            cursor = self.cursor
+            async with conn.execute("""
+                SELECT seq, entity, entity_id FROM change_log
+                WHERE seq > ? ORDER BY seq LIMIT ?;
+            """, (cursor, self.batch)) as cur:
+                rows = await cur.fetchall()
+
+        # Hueco entre el cursor y lo leído: hubo poda mientras íbamos retrasados
+        first = rows[0][0] if rows else high + 1
+        if high > cursor and first > cursor + 1:
+            print(f"⚠️ [DB] Registro de cambios podado tras el seq {cursor}: recarga completa.")
+            self.cursor = rows[-1][0] if rows else high
+            await self._dispatch_all()
+            return len(rows)
+        if not rows:
+            return 0
+
+        changed: Dict[str, Set[int]] = {}
+        for _seq, entity, entity_id in rows:
+            changed.setdefault(entity, set()).add(entity_id)
+        self.cursor = rows[-1][0]
+
+        for entity, ids in changed.items():
+            for callback in self._subscribers.get(entity, ()):
+                await self._call(entity, callback, ids)
+        return len(rows)
+
+    async def _dispatch_all(self) -> None:
+        for entity, callbacks in self._subscribers.items():
+            for callback in callbacks:
+                await self._call(entity, callback, None)
+
+    async def _call(self, entity: str, callback: ChangeCallback, ids: Optional[Set[int]]) -> None:
+        try:
+            await callback(ids)
+        except Exception as e:
+            print(f"⚠️ [DB] Error al aplicar cambios de '{entity}': {e}")
+
+    # ---------------------------------------------------------
+    # 🧹 Poda
+    # ---------------------------------------------------------
+    async def prune(self) -> int:
+        """Borra las filas más antiguas que `retention` segundos."""
+        self._last_prune = self.clock()
+        before = int(self._last_prune - self.retention)
+
+        async def _op(conn) -> int:
+            cur = await conn.execute("DELETE FROM change_log WHERE ts < ?;", (before,))
+            return cur.rowcount
+
+        return await self.db.submit_write(_op)
@@ -5,49 +5,201 @@ Ubicación: src/database/
 Descripción:
 Módulo central de gestión de base de datos del bot Community Race Manager.
 Proporciona una interfaz asíncrona basada en SQLite mediante `aiosqlite`, 
-implementando un patrón Singleton para mantener una única conexión activa.
+implementando un patrón Singleton sobre un gestor de conexiones en modo WAL.
 
 Funciones principales:
-- Inicialización y mantenimiento de tablas del sistema (eventos, circuitos, vehículos, participantes, etc.).
+- Gestor de conexiones (`ConnectionManager`): un pool acotado de conexiones de
+  solo lectura (`Database.reader()`) y un único escritor serializado
+  (`Database.writer()`), de modo que las lecturas no esperan a los commits.
+- Cola de escritura con group commit (`Database.submit_write()`): las
+  mutaciones de todos los DAOs se agrupan en una transacción por ventana corta.
+- Importación masiva validada por bloques (`Database.bulk`, `bulk_import.py`).
+- Registro de cambios entre procesos (`Database.changes`, `change_feed.py`).
+- Inicialización del esquema mediante migraciones versionadas (`migrations.py`),
+  aplicadas una sola vez al arrancar.
 - Persistencia general de datos de la aplicación.
 - Sistema de permisos internos (`authorized_entities`) que controla el acceso a los comandos 
-  y módulos del bot según roles y usuarios autorizados.
+  y módulos del bot según roles y usuarios autorizados, con un índice en
+  memoria por servidor (`permission_index.py`).
 
 Este módulo es utilizado por prácticamente todos los componentes del proyecto, 
 sirviendo como capa de persistencia única y centralizada.
 """
 
 
+import asyncio
 import aiosqlite
 import os
-from typing import Optional
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.request import pathname2url
+
+from .migrations import apply_migrations
+from .permission_index import PermissionIndex
+from .write_queue import WriteBatcher, WriteOp
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "..", "data", "bot.db")
 
+# Número máximo de conexiones de solo lectura abiertas simultáneamente
+READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "4"))
+
+# Ventana de agrupación de escrituras (ms) y tamaño máximo de lote
+WRITE_BATCH_WINDOW_MS = float(os.getenv("DB_WRITE_BATCH_WINDOW_MS", "5"))
+WRITE_BATCH_MAX = int(os.getenv("DB_WRITE_BATCH_MAX", "64"))
+
+# Eventos eliminados por bloque en la purga de archivados
+PURGE_CHUNK_SIZE = int(os.getenv("DB_PURGE_CHUNK_SIZE", "100"))
+
 # Asegurarse de que la carpeta existe
 os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 
 
+class ConnectionManager:
+    """
+    Gestor de conexiones SQLite en modo WAL.
+
+    - Un único escritor (`writer()`), serializado mediante un lock para que
+      las transacciones de distintos cogs no se mezclen.
+    - Un pool acotado de conexiones de solo lectura (`reader()`), abiertas
+      bajo demanda hasta `pool_size`. En WAL los lectores no bloquean al
+      escritor ni esperan a sus commits.
+    - Una cola de group commit (`submit_write()`) que usa el escritor para
+      confirmar varias mutaciones con un solo fsync.
+    """
+
+    def __init__(self, db_path: str, pool_size: int = READ_POOL_SIZE):
+        self.db_path = db_path
+        self.pool_size = max(1, pool_size)
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+        self._idle_readers: asyncio.Queue = asyncio.Queue()
+        self._readers: list[aiosqlite.Connection] = []
+        self._reserved = 0
+        self._batcher = WriteBatcher(
+            self, window_ms=WRITE_BATCH_WINDOW_MS, max_batch=WRITE_BATCH_MAX)
+
+    @property
+    def in_memory(self) -> bool:
+        return self.db_path == ":memory:"
+
+    async def get_writer(self) -> aiosqlite.Connection:
+        """Abre (una sola vez) la conexión de escritura y activa WAL."""
+        if self._writer is None:
+            async with self._open_lock:
+                if self._writer is None:
+                    conn = await aiosqlite.connect(self.db_path)
+                    await conn.execute("PRAGMA journal_mode = WAL;")
+                    # FULL: cada COMMIT de lote es durable antes de resolver a los llamadores
+                    await conn.execute("PRAGMA synchronous = FULL;")
+                    await conn.execute("PRAGMA foreign_keys = ON;")
+                    await conn.execute("PRAGMA busy_timeout = 5000;")
+                    self._writer = conn
+        return self._writer
+
+    async def _open_reader(self) -> aiosqlite.Connection:
+        uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+        conn = await aiosqlite.connect(uri, uri=True)
+        await conn.execute("PRAGMA query_only = ON;")
+        await conn.execute("PRAGMA busy_timeout = 5000;")
+        return conn
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Cede la conexión de escritura en exclusiva durante el bloque."""
+        conn = await self.get_writer()
+        async with self._write_lock:
+            yield conn
+
+    async def submit_write(self, op: WriteOp):
+        """Encola una mutación en la cola de group commit y espera su COMMIT."""
+        return await self._batcher.submit(op)
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Cede una conexión de solo lectura del pool.
+        Si el pool está lleno y no hay conexiones libres, espera a que se libere una.
+        """
+        if self.in_memory:
+            # Una base en memoria no se comparte entre conexiones
+            async with self.writer() as conn:
+                yield conn
+            return
+
+        # El escritor crea el archivo y fija WAL antes de abrir lectores
+        await self.get_writer()
+
+        if self._idle_readers.empty() and self._reserved < self.pool_size:
+            # Reservar la plaza antes de abrir para no exceder el límite
+            self._reserved += 1
+            try:
+                conn = await self._open_reader()
+            except Exception:
+                self._reserved -= 1
+                raise
+            self._readers.append(conn)
+        else:
+            conn = await self._idle_readers.get()
+
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Vacía la cola de escritura y cierra lectores y escritor."""
+        await self._batcher.close()
+        for conn in self._readers:
+            await conn.close()
+        self._readers.clear()
+        self._reserved = 0
+        self._idle_readers = asyncio.Queue()
+
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+
+
 class Database:
     _instance = None
-    _conn: aiosqlite.Connection | None = None
+    _pool: ConnectionManager | None = None
 
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.events = None
         self.tracks = None
+        self.changes = None
+        self.permissions = PermissionIndex(self)
+
+    @classmethod
+    def _get_pool(cls) -> ConnectionManager:
+        """Devuelve el gestor de conexiones compartido, creándolo si no existe."""
+        if cls._pool is None:
+            db_path = cls._instance.db_path if cls._instance else DB_PATH
+            cls._pool = ConnectionManager(db_path)
+        return cls._pool
+
+    @classmethod
+    def reader(cls):
+        """Context manager asíncrono con una conexión de solo lectura del pool."""
+        return cls._get_pool().reader()
 
     @classmethod
-    async def get_connection(cls) -> aiosqlite.Connection:
+    def writer(cls):
+        """Context manager asíncrono con la conexión de escritura serializada."""
+        return cls._get_pool().writer()
+
+    @classmethod
+    async def submit_write(cls, op: WriteOp):
         """
-        Mantiene una única conexión a SQLite por instancia del bot.
+        Ejecuta `op(conn)` dentro del siguiente lote de escritura y devuelve su
+        resultado una vez confirmado. `op` no debe llamar a `conn.commit()`.
         """
-        if cls._conn is None:
-            cls._conn = await aiosqlite.connect(DB_PATH)
-            await cls._conn.execute("PRAGMA foreign_keys = ON;")
-        return cls._conn
+        return await cls._get_pool().submit_write(op)
 
     async def connect(self):
         """
@@ -56,18 +208,18 @@ class Database:
         """
         from datetime import datetime
 
-        if hasattr(self, "_conn") and self._conn:
+        pool = self._get_pool()
+        if pool._writer is not None:
             print("ℹ️ [DB] Conexión ya activa. No se abrirá una nueva instancia.")
-            return self._conn
+            return pool._writer
 
         try:
-            self._conn = await aiosqlite.connect(DB_PATH)
-            await self._conn.execute("PRAGMA foreign_keys = ON;")
+            conn = await pool.get_writer()
 
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             print(
-                f"🕒 [DB] Conexión establecida correctamente ({DB_PATH}) — {timestamp}")
-            return self._conn
+                f"🕒 [DB] Conexión establecida correctamente ({pool.db_path}, WAL) — {timestamp}")
+            return conn
 
         except Exception as e:
             print(f"❌ [DB] Error al conectar con la base de datos: {e}")
@@ -84,14 +236,14 @@ class Database:
 
             # Inicializar submódulos
             try:
-                from database.event_db import EventDB
+                from .event_db import EventDB
                 cls._instance.events = EventDB(cls._instance)
             except Exception as e:
                 print(f"[DB WARNING] No se pudo cargar EventDB: {e}")
                 cls._instance.events = None
 
             try:
-                from database.track_db import TrackDB
+                from .track_db import TrackDB
                 cls._instance.tracks = TrackDB(cls._instance)
                 print("✅ [DB] Módulo TrackDB inicializado correctamente.")
             except Exception as e:
@@ -99,187 +251,57 @@ class Database:
                 cls._instance.tracks = None
 
             try:
-                from database.server_settings_db import ServerSettingsDB
+                from .reminder_db import ReminderDB
+                cls._instance.reminders = ReminderDB(cls._instance)
+            except Exception as e:
+                print(f"[DB WARNING] No se pudo cargar ReminderDB: {e}")
+                cls._instance.reminders = None
+
+            try:
+                from .wizard_session_db import WizardSessionDB
+                cls._instance.wizard_sessions = WizardSessionDB(cls._instance)
+            except Exception as e:
+                print(f"[DB WARNING] No se pudo cargar WizardSessionDB: {e}")
+                cls._instance.wizard_sessions = None
+
+            try:
+                from .bulk_import import BulkImporter
+                cls._instance.bulk = BulkImporter(cls._instance)
+            except Exception as e:
+                print(f"[DB WARNING] No se pudo cargar BulkImporter: {e}")
+                cls._instance.bulk = None
+
+            try:
+                from .server_settings_db import ServerSettingsDB
                 cls._instance.server_settings = ServerSettingsDB(cls._instance)
-                await cls._instance.server_settings.init_tables()
                 print("✅ [DB] Módulo ServerSettingsDB inicializado correctamente.")
             except Exception as e:
                 print(f"[DB WARNING] No se pudo cargar ServerSettingsDB: {e}")
                 cls._instance.server_settings = None
 
+            try:
+                from .change_feed import ChangeFeed
+                cls._instance.changes = ChangeFeed(cls._instance)
+                cls._instance.changes.subscribe("permission", cls._instance.permissions.on_changes)
+            except Exception as e:
+                print(f"[DB WARNING] No se pudo cargar ChangeFeed: {e}")
+                cls._instance.changes = None
+
         return cls._instance
 
     async def init_db(self):
         """
-        Inicializa las tablas principales si no existen.
+        Aplica las migraciones de esquema pendientes (ver `migrations.py`).
+        Si la base ya está en la última versión no se ejecuta ningún DDL.
         """
-        conn = await self.get_connection()
-
-        # TABLA SERVERS – Configuración de cada servidor
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS servers (
-            guild_id            INTEGER PRIMARY KEY,
-            language            TEXT DEFAULT 'en',
-            event_creator_role  INTEGER
-        );
-        """)
-
-        # TABLA EVENTOS – Datos principales del evento
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS events (
-            event_id                INTEGER PRIMARY KEY AUTOINCREMENT,
-            guild_id                INTEGER NOT NULL,
-            title                   TEXT NOT NULL,
-            description             TEXT,
-            -- Tipificado de evento para selección posterior en el scheduler
-            -- standard | league | tournament | championship
-            event_type              TEXT DEFAULT 'standard',
-
-            -- Compat para estructuras legacy y campeonatos
-            is_championship         INTEGER DEFAULT 0,
-            championship_id         INTEGER,
-
-            -- Publicación / estado
-            is_published            INTEGER DEFAULT 0,
-            status                  TEXT DEFAULT 'draft',          -- draft | scheduled | active | archived | closed
-            timezone                TEXT,
-
-            -- Fechas clave
-            event_datetime_utc      TEXT,                          -- fecha/hora del evento
-            publish_datetime_utc    TEXT,                          -- (opcional) si se programa publicación
-            registration_open_utc   TEXT,                          -- NUEVO: apertura de inscripciones
-            registration_close_utc  TEXT,                          -- (opcional) cierre de inscripciones
-
-            -- Logística
-            max_drivers             INTEGER,
-            broadcast_slots         INTEGER DEFAULT 0,
-
-            -- Reglas
-            allow_custom_skins      INTEGER DEFAULT 0,
-            rules_text              TEXT,
-            rules_attachment_url    TEXT,
-
-            -- Canales relacionados
-            publish_channel_id      INTEGER,
-            participants_channel_id INTEGER,
-
-            -- Trazabilidad
-            created_by              INTEGER NOT NULL,
-            created_at              TEXT NOT NULL,
-            last_edited_by          INTEGER,
-            last_edited_date        TEXT,
-            published_at            TEXT,
-            archived_at             TEXT,
-            archive_expires_at      TEXT,
-
-            -- Relación básica con servers
-            FOREIGN KEY (guild_id) REFERENCES servers(guild_id)
-        );
-        """)
-
-        # Índices adicionales para rendimiento
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_status ON events(status);")
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_archive_expires_at ON events(archive_expires_at);")
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_guild_id ON events(guild_id);")
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_title ON events(title);")
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_publish_dt ON events(publish_datetime_utc);")
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_event_dt ON events(event_datetime_utc);")
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_reg_open_dt ON events(registration_open_utc);")
-        await conn.execute("CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);")
-
-        # TABLA PARTICIPANTES – Inscripciones al evento
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS participants (
-            user_id         INTEGER NOT NULL,
-            event_id        INTEGER NOT NULL,
-            steam_id        TEXT,
-            name            TEXT,
-            team_name       TEXT,
-            car_model       TEXT,
-            timezone        TEXT,
-            has_custom_skin INTEGER DEFAULT 0,
-            attempts        INTEGER DEFAULT 0,
-            status          TEXT DEFAULT 'pending',
-            PRIMARY KEY (user_id, event_id),
-            FOREIGN KEY (event_id) REFERENCES events(event_id)
-        );
-        """)
-
-        # TABLA TRACKS – Circuitos disponibles por servidor
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS tracks (
-            id                INTEGER PRIMARY KEY AUTOINCREMENT,
-            guild_id          INTEGER NOT NULL,
-            name              TEXT NOT NULL,
-            layout            TEXT,
-            pit_slots         INTEGER NOT NULL,
-            broadcast_slots   INTEGER DEFAULT 0,
-            details           TEXT,
-            image_path        TEXT,
-            created_at        TEXT DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-
-        # TABLA VEHICLE_LISTS – Listas de coches definidas por el usuario
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS vehicle_lists (
-            id              INTEGER PRIMARY KEY AUTOINCREMENT,
-            name            TEXT NOT NULL,
-            description     TEXT,
-            created_by      INTEGER,
-            created_at      TEXT DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-
-        # TABLA VEHICLE_LIST_ITEMS – Vehículos asociados a cada lista
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS vehicle_list_items (
-            id          INTEGER PRIMARY KEY AUTOINCREMENT,
-            list_id     INTEGER NOT NULL,
-            model_name  TEXT NOT NULL,
-            FOREIGN KEY (list_id) REFERENCES vehicle_lists(id)
-        );
-        """)
-
-        await conn.commit()
+        async with self.writer() as conn:
+            version = await apply_migrations(conn)
+        print(f"✅ [DB] Esquema en versión {version}.")
 
         # ==============================================================
         # SISTEMA DE AUTORIZACIONES UNIFICADO (Usuarios, Roles y Módulos)
         # ==============================================================
 
-    async def _ensure_authorized_table(self):
-        """
-        Crea la tabla de entidades autorizadas si no existe.
-        Incluye control por módulo ('module_name'), usuario o rol.
-        También aplica migración automática si la columna aún no existe.
-        """
-        conn = await self.get_connection()
-
-        # Crear tabla si no existe
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS authorized_entities (
-            guild_id     INTEGER NOT NULL,
-            module_name  TEXT DEFAULT 'global',
-            entity_id    INTEGER NOT NULL,
-            entity_type  TEXT CHECK(entity_type IN ('user','role')) NOT NULL,
-            UNIQUE(guild_id, module_name, entity_id, entity_type)
-        );
-        """)
-
-        # 🔧 Migración automática para bases de datos antiguas (añade columna module_name si falta)
-        try:
-            cur = await conn.execute("PRAGMA table_info(authorized_entities);")
-            columns = [row[1] for row in await cur.fetchall()]
-            if "module_name" not in columns:
-                await conn.execute("ALTER TABLE authorized_entities ADD COLUMN module_name TEXT DEFAULT 'global';")
-                print(
-                    "🛠️ [DB] Migración aplicada: columna 'module_name' añadida a authorized_entities.")
-        except Exception as e:
-            print(
-                f"⚠️ [DB] Error durante la comprobación/migración de authorized_entities: {e}")
-
-        await conn.commit()
-
     async def add_authorized_entity(
         self,
         guild_id: int,
@@ -291,13 +313,14 @@ class Database:
         Registra una entidad (usuario o rol) como autorizada.
         Puede aplicarse globalmente o a un módulo específico.
         """
-        await self._ensure_authorized_table()
-        conn = await self.get_connection()
-        await conn.execute("""
-            INSERT OR IGNORE INTO authorized_entities (guild_id, module_name, entity_id, entity_type)
-            VALUES (?, ?, ?, ?);
-        """, (guild_id, module_name, entity_id, entity_type))
-        await conn.commit()
+        async def _op(conn):
+            await conn.execute("""
+                INSERT OR IGNORE INTO authorized_entities (guild_id, module_name, entity_id, entity_type)
+                VALUES (?, ?, ?, ?);
+            """, (guild_id, module_name, entity_id, entity_type))
+
+        await self.submit_write(_op)
+        self.permissions.grant(guild_id, module_name, entity_id, entity_type)
 
     async def remove_authorized_entity(
         self,
@@ -310,13 +333,14 @@ class Database:
         Elimina una entidad (usuario o rol) de la lista de autorizaciones.
         Si el módulo no se especifica, elimina solo la autorización global.
         """
-        await self._ensure_authorized_table()
-        conn = await self.get_connection()
-        await conn.execute("""
-            DELETE FROM authorized_entities
-            WHERE guild_id = ? AND module_name = ? AND entity_id = ? AND entity_type = ?;
-        """, (guild_id, module_name, entity_id, entity_type))
-        await conn.commit()
+        async def _op(conn):
+            await conn.execute("""
+                DELETE FROM authorized_entities
+                WHERE guild_id = ? AND module_name = ? AND entity_id = ? AND entity_type = ?;
+            """, (guild_id, module_name, entity_id, entity_type))
+
+        await self.submit_write(_op)
+        self.permissions.revoke(guild_id, module_name, entity_id, entity_type)
 
     async def is_authorized(self, guild_id: int, module: str, user) -> bool:
         """
@@ -331,35 +355,9 @@ class Database:
         if not hasattr(user, "id") or not hasattr(user, "roles"):
             return False
 
-        await self._ensure_authorized_table()
-        conn = await self.get_connection()
-
-        # --- Verificar usuario directamente ---
-        async with conn.execute("""
-            SELECT 1 FROM authorized_entities
-            WHERE guild_id = ? 
-              AND module_name IN (?, 'global')
-              AND entity_id = ? 
-              AND entity_type = 'user';
-        """, (guild_id, module, user.id)) as cursor:
-            if await cursor.fetchone():
-                return True
-
-        # --- Verificar roles ---
-        role_ids = [r.id for r in getattr(user, "roles", [])]
-        if not role_ids:
-            return False
-
-        placeholders = ",".join("?" * len(role_ids))
-        query = f"""
-            SELECT 1 FROM authorized_entities
-            WHERE guild_id = ?
-              AND module_name IN (?, 'global')
-              AND entity_type = 'role'
-              AND entity_id IN ({placeholders});
-        """
-        async with conn.execute(query, [guild_id, module, *role_ids]) as cursor:
-            return bool(await cursor.fetchone())
+        # Índice en memoria: sin consultas tras la primera carga del servidor
+        perms = await self.permissions.get(guild_id)
+        return perms.allows(module, user.id, (r.id for r in user.roles))
 
     async def safe_close(self):
         """
@@ -368,32 +366,77 @@ class Database:
         """
         from datetime import datetime
 
-        if hasattr(self, "_conn") and self._conn:
+        pool = type(self)._pool
+        if pool is not None and pool._writer is not None:
             try:
-                await self._conn.close()
+                await pool.close()
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                print(f"🔒 [DB] Conexión cerrada correctamente — {timestamp}")
-                self._conn = None
+                print(f"🔒 [DB] Conexiones cerradas correctamente — {timestamp}")
             except Exception as e:
                 print(f"⚠️ [DB] Error al cerrar la base de datos: {e}")
         else:
             print(
                 "ℹ️ [DB] No había conexión de base de datos activa al intentar cerrar.")
 
-    async def purge_archived_events(self):
+    async def next_archive_expiry(self) -> Optional[int]:
+        """Epoch UTC de la próxima caducidad de un evento archivado (None si no hay)."""
+        async with self.reader() as conn:
+            async with conn.execute("""
+                SELECT MIN(archive_expires_ts) FROM events
+                WHERE status = 'archived' AND archive_expires_ts IS NOT NULL;
+            """) as cur:
+                row = await cur.fetchone()
+                return row[0] if row else None
+
+    async def purge_archived_chunk(self, now_ts: int, limit: int = PURGE_CHUNK_SIZE,
+                                   fence=None) -> Dict[str, int]:
+        """
+        Elimina hasta `limit` eventos archivados caducados junto con sus
+        participantes y recordatorios, en una única operación de escritura corta.
+        Devuelve el número de filas eliminadas por tabla. Con `fence`
+        (`LeaseFence`) se aborta con `LeaseLost` si el lease ya no es nuestro.
+        """
+        async def _op(conn) -> Dict[str, int]:
+            if fence is not None:
+                await fence.check(conn)
+            async with conn.execute("""
+                SELECT event_id FROM events
+                WHERE status = 'archived' AND archive_expires_ts <= ?
+                ORDER BY archive_expires_ts
+                LIMIT ?;
+            """, (now_ts, limit)) as cur:
+                ids = [r[0] for r in await cur.fetchall()]
+            if not ids:
+                return {"events": 0, "participants": 0, "reminders": 0}
+
+            marks = ",".join("?" * len(ids))
+            counts = {}
+            for table in ("participants", "reminders", "events"):
+                cur = await conn.execute(f"DELETE FROM {table} WHERE event_id IN ({marks});", ids)
+                counts[table] = cur.rowcount
+            return counts
+
+        return await self.submit_write(_op)
+
+    async def purge_archived_events(self, chunk_size: int = PURGE_CHUNK_SIZE) -> Dict[str, int]:
         """
         Elimina eventos archivados cuya fecha de caducidad haya expirado.
-        Ejecutado bajo demanda al listar o iniciar un evento.
+        Trabaja por bloques de `chunk_size` cediendo el bucle entre bloques, de
+        modo que el escritor nunca queda ocupado por una purga larga.
         """
-        conn = await self.get_connection()
+        now_ts = int(time.time())
+        totals = {"events": 0, "participants": 0, "reminders": 0}
+
         try:
-            await conn.execute("""
-                DELETE FROM events
-                WHERE status = 'archived'
-                AND archive_expires_at IS NOT NULL
-                AND datetime(archive_expires_at) <= datetime('now');
-            """)
-            await conn.commit()
-            print("🧹 [DB] Eventos archivados expirados eliminados correctamente.")
+            while True:
+                counts = await self.purge_archived_chunk(now_ts, chunk_size)
+                for table, n in counts.items():
+                    totals[table] += n
+                if counts["events"] < chunk_size:
+                    break
+                await asyncio.sleep(0)
+            if totals["events"]:
+                print(f"🧹 [DB] {totals['events']} eventos archivados expirados eliminados.")
         except Exception as e:
             print(f"⚠️ [DB] Error al purgar eventos archivados: {e}")
+        return totals
@@ -11,23 +11,142 @@ Funciones clave:
 - insert_event(data, overwrite=False): inserta un evento o actualiza si overwrite=True.
 - get_event(event_id): devuelve un evento por ID.
 - list_events(...): lista eventos con filtros por servidor, estado, tipo o rango temporal.
+- list_events_page(...): página de eventos con paginación por clave (`event_ts`, `event_id`).
 - update_event(event_id, fields): actualiza campos arbitrarios.
 - schedule_event(event_id, user_id, publish_dt): programa publicación futura.
-- publish_event(event_id, user_id): marca como publicado (`active`).
+- publish_event(event_id, user_id): marca como publicado (`active`) si sigue
+  programado; devuelve False si otro proceso o comando ya cambió su estado.
 - archive_event(event_id, user_id): marca como archivado (papelera).
 - delete_event(event_id): elimina un evento por ID.
 
 Notas:
 - `status` es la fuente de verdad; `is_published` actúa como flag derivado.
-- Control de duplicados por (`guild_id`, `title`); usar `overwrite=True` para sobrescribir.
-- Auto-root de campeonatos: si `is_championship=1` y no hay `championship_id`, se autoasigna.
+- Control de duplicados por (`guild_id`, `title`) sin distinguir mayúsculas (índice
+  único); usar `overwrite=True` para sobrescribir.
+- Auto-root de campeonatos: si `is_championship=1` y no hay `championship_id`, se
+  autoasigna (trigger de base de datos).
 - Compatible con Scheduler Wizard (campos `publish_datetime_utc`, `registration_open_utc`, etc.).
+- Las lecturas devuelven `EventRecord` (registros con `__slots__` y acceso tipo dict);
+  usar `to_dict()` si se necesita una copia mutable.
+- Cada fecha ISO tiene una columna epoch INTEGER (`event_ts`, `publish_ts`, ...)
+  que el DAO mantiene sincronizada; las consultas temporales usan solo esas
+  columnas a través de `EventQuery`, sin envolverlas en funciones.
 """
 
 import aiosqlite
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from database.db import Database
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from .db import Database
+from .migrations import EPOCH_COLUMNS
+from .records import EventRecord
+from .reminder_db import ReminderDB
+from .timestamps import to_epoch
+
+
+# ---------------------------------------------------------
+# ⏱️ Columnas epoch
+# ---------------------------------------------------------
+def with_epochs(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Añade a `fields` las columnas epoch de cada fecha ISO presente."""
+    for iso_col, ts_col in EPOCH_COLUMNS.items():
+        if iso_col in fields:
+            fields[ts_col] = to_epoch(fields[iso_col])
+    return fields
+
+
+# Clave de sesión del Scheduler Wizard → columna de `events`
+_SESSION_ALIASES = {
+    "registration_open_datetime_utc": "registration_open_utc",
+    "registration_close_datetime_utc": "registration_close_utc",
+}
+
+# Columnas mínimas para los listados paginados
+PAGE_COLUMNS = ("event_id", "event_ts", "title", "status", "event_datetime_utc", "created_at")
+
+
+class EventPage(NamedTuple):
+    """Página de `list_events_page`; los cursores son None si no hay más en esa dirección."""
+    items: List[EventRecord]
+    next_cursor: Optional[Tuple[Optional[int], int]]
+    prev_cursor: Optional[Tuple[Optional[int], int]]
+
+
+class EventQuery:
+    """
+    Constructor de consultas sobre `events` que solo emite predicados
+    indexables: igualdades y rangos sobre columnas desnudas.
+    """
+
+    def __init__(self, columns: str = "*"):
+        self.columns = columns
+        self._where: List[str] = []
+        self.params: List[Any] = []
+        self._order = ""
+        self._limit: Optional[int] = None
+
+    def eq(self, column: str, value: Any) -> "EventQuery":
+        if value is not None:
+            self._where.append(f"{column} = ?")
+            self.params.append(value)
+        return self
+
+    def since(self, column: str, epoch: Optional[int]) -> "EventQuery":
+        if epoch is not None:
+            self._where.append(f"{column} >= ?")
+            self.params.append(epoch)
+        return self
+
+    def until(self, column: str, epoch: Optional[int]) -> "EventQuery":
+        if epoch is not None:
+            self._where.append(f"{column} <= ?")
+            self.params.append(epoch)
+        return self
+
+    def after_key(self, key: Optional[Tuple[Optional[int], int]], backwards: bool = False) -> "EventQuery":
+        """
+        Predicado de paginación por clave (`event_ts`, `event_id`).
+        Los eventos sin fecha (`event_ts` NULL) se ordenan al principio.
+        Con `backwards=True` selecciona las filas anteriores a la clave.
+        """
+        if key is None:
+            return self
+        ts, event_id = key
+        if not backwards:
+            if ts is None:
+                self._where.append("((event_ts IS NULL AND event_id > ?) OR event_ts IS NOT NULL)")
+                self.params.append(event_id)
+            else:
+                self._where.append("(event_ts > ? OR (event_ts = ? AND event_id > ?))")
+                self.params.extend([ts, ts, event_id])
+        else:
+            if ts is None:
+                self._where.append("(event_ts IS NULL AND event_id < ?)")
+                self.params.append(event_id)
+            else:
+                self._where.append(
+                    "(event_ts IS NULL OR event_ts < ? OR (event_ts = ? AND event_id < ?))")
+                self.params.extend([ts, ts, event_id])
+        return self
+
+    def order_by(self, *columns: str) -> "EventQuery":
+        self._order = ", ".join(columns)
+        return self
+
+    def limit(self, n: int) -> "EventQuery":
+        self._limit = n
+        return self
+
+    def build(self) -> Tuple[str, List[Any]]:
+        query = f"SELECT {self.columns} FROM events"
+        if self._where:
+            query += " WHERE " + " AND ".join(self._where)
+        if self._order:
+            query += f" ORDER BY {self._order}"
+        params = list(self.params)
+        if self._limit is not None:
+            query += " LIMIT ?"
+            params.append(self._limit)
+        return query, params
 
 
 class EventDB:
@@ -42,35 +161,35 @@ class EventDB:
 
     def __init__(self, db: Database):
         self.db = db
+        # Observadores de cambios confirmados: callback(event_id, fields | None)
+        self._listeners: List[Callable[[int, Optional[Dict[str, Any]]], None]] = []
 
     # ---------------------------------------------------------
     # 🧩 HELPERS INTERNOS
     # ---------------------------------------------------------
-    @staticmethod
-    def _dict_from_row(cursor, row) -> Dict[str, Any]:
-        cols = [c[0] for c in cursor.description]
-        return dict(zip(cols, row))
+    def add_listener(self, callback: Callable[[int, Optional[Dict[str, Any]]], None]) -> None:
+        """
+        Registra un observador que se invoca tras cada inserción, actualización
+        (`fields` modificados) o borrado (`None`) ya confirmado.
+        """
+        self._listeners.append(callback)
 
-    async def _conn(self) -> aiosqlite.Connection:
-        return await self.db.get_connection()
+    def _notify(self, event_id: int, fields: Optional[Dict[str, Any]]) -> None:
+        for callback in self._listeners:
+            try:
+                callback(event_id, fields)
+            except Exception as e:
+                print(f"⚠️ [EventDB] Error en observador de eventos: {e}")
 
     # ---------------------------------------------------------
     # 🟢 CREATE / INSERT
     # ---------------------------------------------------------
-    async def insert_event(self, data: dict, overwrite: bool = False) -> int:
+    @staticmethod
+    def _prepare(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Inserta un nuevo evento o lo actualiza si existe y overwrite=True.
-        Compatible con todos los campos del modelo actualizado.
+        Completa los valores por defecto de un evento nuevo (en el propio
+        dict) y separa sus recordatorios, que se guardan en `reminders`.
         """
-        conn = await self._conn()
-
-        # 🔎 Comprobar duplicado
-        cur = await conn.execute(
-            "SELECT event_id FROM events WHERE guild_id = ? AND title = ?",
-            (data.get("guild_id"), data.get("title"))
-        )
-        existing = await cur.fetchone()
-
         now_iso = datetime.utcnow().isoformat()
         data.setdefault("created_at", now_iso)
         data.setdefault("last_edited_date", now_iso)
@@ -83,48 +202,143 @@ class EventDB:
         data.setdefault("registration_open_utc", None)
         data.setdefault("registration_close_utc", None)
 
-        # Si ya existe y se solicita sobreescritura
-        if existing and overwrite:
-            event_id = existing[0]
-            fields = {**data, "last_edited_date": now_iso}
-            await self.update_event(event_id, fields)
-            print(f"♻️ Evento actualizado: {data.get('title')}")
-            return event_id
+        # Nombres usados por la sesión del Scheduler Wizard
+        for alias, column in _SESSION_ALIASES.items():
+            if alias in data:
+                value = data.pop(alias)
+                data[column] = data[column] or value
+        with_epochs(data)
+
+        # Recordatorios del Scheduler Wizard: se guardan en `reminders`, no en `events`
+        reminders = data.pop("reminders_list", None) or []
+        data.pop("reminders_enabled", None)
+        return reminders
+
+    async def insert_event(self, data: dict, overwrite: bool = False) -> int:
+        """
+        Inserta un nuevo evento o lo actualiza si existe y overwrite=True.
+        Compatible con todos los campos del modelo actualizado.
 
-        # Si existe y no se permite overwrite → error
-        if existing and not overwrite:
-            raise ValueError(
-                "Ya existe un evento con este nombre en este servidor.")
+        Una única sentencia `INSERT ... ON CONFLICT ... RETURNING` sobre el
+        índice único (`guild_id`, `title` COLLATE NOCASE): el duplicado se
+        detecta sin SELECT previo y el auto-root de campeonatos lo aplica el
+        trigger `trg_events_championship_root` en la misma transacción. Con
+        overwrite=True una consulta previa, en la misma operación de escritura,
+        distingue inserción de actualización.
+
+        Si `data` incluye `reminders_list` (sesión del Scheduler Wizard), los
+        recordatorios se guardan en la tabla `reminders` en la misma operación.
+        """
+        reminders = self._prepare(data)
 
-        # Inserción
-        placeholders = ", ".join([f":{k}" for k in data.keys()])
         columns = ", ".join(data.keys())
+        placeholders = ", ".join(f":{k}" for k in data.keys())
         query = f"INSERT INTO events ({columns}) VALUES ({placeholders})"
-        await conn.execute(query, data)
-        await conn.commit()
+        if overwrite:
+            # `created_at` se conserva al sobrescribir
+            sets = ", ".join(f"{k} = excluded.{k}" for k in data.keys() if k != "created_at")
+            query += f" ON CONFLICT(guild_id, title COLLATE NOCASE) DO UPDATE SET {sets}"
+        else:
+            query += " ON CONFLICT(guild_id, title COLLATE NOCASE) DO NOTHING"
+        query += " RETURNING event_id"
 
-        cur = await conn.execute("SELECT last_insert_rowid()")
-        new_id = (await cur.fetchone())[0]
-        print(f"🗓️ Nuevo evento insertado: {data.get('title')} (ID={new_id})")
+        async def _op(conn: aiosqlite.Connection):
+            created = True
+            if overwrite:
+                # Dentro de la misma transacción: nadie puede crear el título entre medias
+                async with conn.execute(
+                    "SELECT 1 FROM events WHERE guild_id = ? AND title = ? COLLATE NOCASE",
+                    (data.get("guild_id"), data.get("title")),
+                ) as cur:
+                    created = await cur.fetchone() is None
+            async with conn.execute(query, data) as cur:
+                row = await cur.fetchone()
+            if row is None:
+                raise ValueError(
+                    "Ya existe un evento con este nombre en este servidor.")
+            event_id = row[0]
 
-        # Auto-root de campeonatos
-        if int(data.get("is_championship", 0)) and not data.get("championship_id"):
-            await conn.execute(
-                "UPDATE events SET championship_id = ? WHERE event_id = ?",
-                (new_id, new_id),
-            )
-            await conn.commit()
+            added = []
+            if reminders:
+                if not created:
+                    await conn.execute(
+                        "DELETE FROM reminders WHERE event_id = ? AND status = 'pending'", (event_id,))
+                added = await ReminderDB.insert_for_event(conn, event_id, data["guild_id"], reminders)
+            return event_id, created, added
 
-        return new_id
+        event_id, created, added = await self.db.submit_write(_op)
+        self._notify(event_id, data)
+        if added and getattr(self.db, "reminders", None):
+            self.db.reminders.notify_added(added)
+        if created:
+            print(f"🗓️ Nuevo evento insertado: {data.get('title')} (ID={event_id})")
+        else:
+            print(f"♻️ Evento actualizado: {data.get('title')}")
+        return event_id
+
+    async def insert_series(self, rounds: List[Dict[str, Any]],
+                            root_id: Optional[int] = None) -> List[int]:
+        """
+        Inserta las rondas de una serie (liga / campeonato) y sus recordatorios
+        en una única transacción: o se crean todas o ninguna.
+
+        Las rondas conservan el tipo (`event_type`, `is_championship`) que
+        traigan, y todas quedan enlazadas por `championship_id` a la raíz de la
+        serie: `root_id` (el evento plantilla, que pasa a ser su propia raíz si
+        aún no lo era) o, sin él, la primera ronda. Lanza ValueError si algún
+        título ya existe en el servidor.
+        """
+        prepared = [(data, self._prepare(data)) for data in rounds]
+
+        async def _op(conn: aiosqlite.Connection):
+            ids, added = [], []
+            if root_id is not None:
+                await conn.execute("""
+                    UPDATE events SET championship_id = event_id
+                    WHERE event_id = ? AND COALESCE(championship_id, 0) = 0
+                """, (root_id,))
+            series_root = root_id
+            for data, reminders in prepared:
+                if series_root is not None:
+                    data["championship_id"] = series_root
+                columns = ", ".join(data.keys())
+                placeholders = ", ".join(f":{k}" for k in data.keys())
+                async with conn.execute(f"""
+                    INSERT INTO events ({columns}) VALUES ({placeholders})
+                    ON CONFLICT(guild_id, title COLLATE NOCASE) DO NOTHING
+                    RETURNING event_id
+                """, data) as cur:
+                    row = await cur.fetchone()
+                if row is None:
+                    raise ValueError(f"Ya existe un evento llamado '{data['title']}' en este servidor.")
+                event_id = row[0]
+                if series_root is None:
+                    # El trigger solo enlaza campeonatos: la raíz de una liga se fija aquí
+                    series_root = data["championship_id"] = event_id
+                    await conn.execute(
+                        "UPDATE events SET championship_id = ? WHERE event_id = ?", (event_id, event_id))
+                ids.append(event_id)
+                if reminders:
+                    added += await ReminderDB.insert_for_event(conn, event_id, data["guild_id"], reminders)
+            return ids, added
+
+        ids, added = await self.db.submit_write(_op)
+        for event_id, (data, _) in zip(ids, prepared):
+            self._notify(event_id, data)
+        if added and getattr(self.db, "reminders", None):
+            self.db.reminders.notify_added(added)
+        root = root_id if root_id is not None else (ids[0] if ids else None)
+        print(f"🏁 Serie insertada: {len(ids)} rondas (raíz ID={root})")
+        return ids
 
     # ---------------------------------------------------------
     # 📖 READ
     # ---------------------------------------------------------
-    async def get_event(self, event_id: int) -> Optional[Dict[str, Any]]:
-        conn = await self._conn()
-        cur = await conn.execute("SELECT * FROM events WHERE event_id = ?", (event_id,))
-        row = await cur.fetchone()
-        return self._dict_from_row(cur, row) if row else None
+    async def get_event(self, event_id: int) -> Optional[EventRecord]:
+        async with self.db.reader() as conn:
+            async with conn.execute("SELECT * FROM events WHERE event_id = ?", (event_id,)) as cur:
+                row = await cur.fetchone()
+                return EventRecord.from_row(cur, row) if row else None
 
     async def list_events(
         self,
@@ -132,7 +346,7 @@ class EventDB:
         status: Optional[str] = None,
         event_type: Optional[str] = None,
         after_date_utc: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[EventRecord]:
         """
         Devuelve una lista de eventos filtrados opcionalmente por:
         - Servidor (`guild_id`)
@@ -140,44 +354,124 @@ class EventDB:
         - Tipo (`event_type`)
         - Fecha posterior (`after_date_utc`, formato ISO UTC)
         """
-        conn = await self._conn()
-        query = "SELECT * FROM events WHERE 1=1"
-        params: list[Any] = []
-
-        if guild_id:
-            query += " AND guild_id = ?"
-            params.append(guild_id)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        if event_type:
-            query += " AND event_type = ?"
-            params.append(event_type)
-        if after_date_utc:
-            query += " AND datetime(event_datetime_utc) >= datetime(?)"
-            params.append(after_date_utc)
-
-        query += " ORDER BY datetime(event_datetime_utc) ASC"
-        cur = await conn.execute(query, params)
-        rows = await cur.fetchall()
-        return [self._dict_from_row(cur, r) for r in rows] if rows else []
+        query, params = (
+            EventQuery()
+            .eq("guild_id", guild_id or None)
+            .eq("status", status or None)
+            .eq("event_type", event_type or None)
+            .since("event_ts", to_epoch(after_date_utc))
+            .order_by("event_ts", "event_id")
+            .build()
+        )
+        async with self.db.reader() as conn:
+            async with conn.execute(query, params) as cur:
+                rows = await cur.fetchall()
+                return EventRecord.from_rows(cur, rows)
+
+    async def list_events_page(
+        self,
+        guild_id: int,
+        status: Optional[str] = None,
+        cursor: Optional[Tuple[Optional[int], int]] = None,
+        limit: int = 10,
+        columns: Sequence[str] = PAGE_COLUMNS,
+        backwards: bool = False,
+    ) -> EventPage:
+        """
+        Devuelve una página de eventos ordenada por (`event_ts`, `event_id`)
+        usando paginación por clave: el coste no depende del número de eventos
+        anteriores a `cursor`.
+
+        - `cursor`: clave (`event_ts`, `event_id`) a partir de la cual leer
+          (`EventPage.next_cursor` o `EventPage.prev_cursor` de otra página).
+        - `backwards=True`: lee la página anterior a `cursor`.
+        - `columns`: proyección; `event_ts` y `event_id` se añaden siempre.
+        """
+        projection = list(dict.fromkeys(["event_id", "event_ts", *columns]))
+        order = ("event_ts DESC", "event_id DESC") if backwards else ("event_ts", "event_id")
+
+        query, params = (
+            EventQuery(", ".join(projection))
+            .eq("guild_id", guild_id)
+            .eq("status", status or None)
+            .after_key(cursor, backwards=backwards)
+            .order_by(*order)
+            .limit(limit + 1)
+            .build()
+        )
+        async with self.db.reader() as conn:
+            async with conn.execute(query, params) as cur:
+                rows = await cur.fetchall()
+                items = EventRecord.from_rows(cur, rows[:limit])
+
+        has_more = len(rows) > limit
+        if backwards:
+            items.reverse()
+            has_prev, has_next = has_more, cursor is not None
+        else:
+            has_prev, has_next = cursor is not None, has_more
+
+        first = (items[0]["event_ts"], items[0]["event_id"]) if items else None
+        last = (items[-1]["event_ts"], items[-1]["event_id"]) if items else None
+        return EventPage(
+            items=items,
+            next_cursor=last if has_next else None,
+            prev_cursor=first if has_prev else None,
+        )
+
+    async def missed_publications(self, until_ts: int) -> List[Tuple[int, int]]:
+        """
+        Eventos programados cuyo `publish_ts` ya pasó (`<= until_ts`), como
+        [(event_id, publish_ts)] ordenados por plazo. Rango sobre
+        `idx_events_status_publish_ts`.
+        """
+        async with self.db.reader() as conn:
+            async with conn.execute("""
+                SELECT event_id, publish_ts FROM events
+                WHERE status = 'scheduled' AND publish_ts <= ?
+                ORDER BY publish_ts, event_id;
+            """, (until_ts,)) as cur:
+                return [(r[0], r[1]) for r in await cur.fetchall()]
 
     # ---------------------------------------------------------
     # ✏️ UPDATE
     # ---------------------------------------------------------
-    async def update_event(self, event_id: int, fields: Dict[str, Any]) -> bool:
-        """Actualiza uno o más campos del evento."""
+    @staticmethod
+    async def _apply_update(conn: aiosqlite.Connection, event_id: int, fields: Dict[str, Any],
+                            status: Optional[str] = None) -> bool:
+        """Ejecuta el UPDATE dentro de una operación de escritura ya abierta."""
+        with_epochs(fields)
+        sets = ", ".join(f"{k} = ?" for k in fields.keys())
+        values = list(fields.values()) + [event_id]
+        where = "event_id = ?"
+        if status is not None:
+            where += " AND status = ?"
+            values.append(status)
+        cur = await conn.execute(f"UPDATE events SET {sets} WHERE {where}", values)
+        return cur.rowcount > 0
+
+    async def update_event(self, event_id: int, fields: Dict[str, Any], fence=None,
+                           status: Optional[str] = None) -> bool:
+        """
+        Actualiza uno o más campos del evento. Con `fence` (`LeaseFence` de los
+        trabajos del líder) la escritura se aborta con `LeaseLost` si el lease
+        ya no es nuestro. Con `status` solo se actualiza si el evento sigue en
+        ese estado (comprobado en la misma escritura).
+        """
         if not fields:
             return False
 
         fields["last_edited_date"] = datetime.utcnow().isoformat()
-        sets = ", ".join(f"{k} = ?" for k in fields.keys())
-        values = list(fields.values()) + [event_id]
 
-        conn = await self._conn()
-        cur = await conn.execute(f"UPDATE events SET {sets} WHERE event_id = ?", values)
-        await conn.commit()
-        return cur.rowcount > 0
+        async def _op(conn: aiosqlite.Connection) -> bool:
+            if fence is not None:
+                await fence.check(conn)
+            return await self._apply_update(conn, event_id, fields, status)
+
+        updated = await self.db.submit_write(_op)
+        if updated:
+            self._notify(event_id, fields)
+        return updated
 
     # ---------------------------------------------------------
     # 🕓 CAMBIOS DE ESTADO
@@ -192,15 +486,18 @@ class EventDB:
         })
         print(f"🕓 Evento {event_id} programado para {publish_dt}")
 
-    async def publish_event(self, event_id: int, user_id: int):
-        """Marca el evento como publicado y asigna la fecha actual."""
+    async def publish_event(self, event_id: int, user_id: int, fence=None) -> bool:
+        """
+        Marca el evento como publicado y asigna la fecha actual, solo si sigue
+        programado. Devuelve False si ya no lo estaba (no hay que anunciarlo).
+        """
         now = datetime.utcnow().isoformat()
-        await self.update_event(event_id, {
+        return await self.update_event(event_id, {
             "status": "active",
             "is_published": 1,
             "published_at": now,
             "last_edited_by": user_id,
-        })
+        }, fence=fence, status="scheduled")
 
     async def archive_event(self, event_id: int, user_id: int):
         """Archiva el evento y define fecha de expiración a 30 días."""
@@ -218,7 +515,11 @@ class EventDB:
     # ---------------------------------------------------------
     async def delete_event(self, event_id: int) -> bool:
         """Elimina un evento por ID."""
-        conn = await self._conn()
-        cur = await conn.execute("DELETE FROM events WHERE event_id = ?", (event_id,))
-        await conn.commit()
-        return cur.rowcount > 0
+        async def _op(conn: aiosqlite.Connection) -> bool:
+            cur = await conn.execute("DELETE FROM events WHERE event_id = ?", (event_id,))
+            return cur.rowcount > 0
+
+        deleted = await self.db.submit_write(_op)
+        if deleted:
+            self._notify(event_id, None)
+        return deleted
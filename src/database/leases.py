@@ -0,0 +1,241 @@
+"""
+Archivo: leases.py
+Ubicación: src/database/
+
+Descripción:
+Arrendamientos ("leases") con caducidad sobre la tabla `leases` para elegir
+un único líder entre varios procesos que comparten la misma base de datos
+(despliegues blue/green, procesos por shard...). Solo el líder ejecuta los
+trabajos en segundo plano (publicación, recordatorios, purga).
+
+- acquire(): toma el lease si está libre, caducado o ya es nuestro. Es un
+  compare-and-swap en una sola sentencia (`INSERT ... ON CONFLICT DO UPDATE
+  ... WHERE`), atómico bajo el bloqueo de escritura de SQLite.
+- renew(): prolonga el lease solo si seguimos siendo el dueño con el mismo
+  `epoch` (token de cercado que sube en cada cambio de dueño).
+- release(): lo libera al cerrar para que otro proceso lo tome sin esperar
+  a la caducidad.
+
+`LeaderElection` repite acquire/renew cada `ttl / 3` segundos y llama a
+`on_elected` / `on_demoted` en cada cambio. Si el líder muere, otro proceso
+lo sustituye en como mucho `ttl + ttl / 3` segundos. `on_elected` corre en
+una tarea aparte para que los latidos sigan renovando el lease mientras los
+trabajos cargan su estado; al perder el lease se cancela si no ha terminado.
+
+Un líder pausado (GC, máquina suspendida) puede despertar con el lease ya en
+manos de otro proceso antes de que su latido lo detecte. Por eso las
+escrituras de los trabajos del líder pasan `election.fence` (`LeaseFence`):
+dentro de la misma transacción se comprueba que el lease sigue siendo nuestro
+con el mismo `epoch`, y si no se aborta la escritura con `LeaseLost`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+
+import aiosqlite
+
+from .db import Database
+
+LEASE_TTL = float(os.getenv("DB_LEASE_TTL", "5"))
+
+
+def default_owner() -> str:
+    """Identificador único del proceso (host:pid:aleatorio)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaseStore:
+    """Operaciones atómicas sobre la tabla `leases`."""
+
+    def __init__(self, db: Database, clock: Callable[[], float] = time.time):
+        self.db = db
+        self.clock = clock
+
+    async def acquire(self, name: str, owner: str, ttl: float) -> Optional[int]:
+        """Toma o renueva el lease. Devuelve su `epoch` o None si lo tiene otro."""
+        now = self.clock()
+
+        async def _op(conn: aiosqlite.Connection) -> Optional[int]:
+            async with conn.execute("""
+                INSERT INTO leases (name, owner, expires_at, epoch, acquired_at)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    epoch       = CASE WHEN leases.owner = excluded.owner
+                                       THEN leases.epoch ELSE leases.epoch + 1 END,
+                    acquired_at = CASE WHEN leases.owner = excluded.owner
+                                       THEN leases.acquired_at ELSE excluded.acquired_at END,
+                    owner       = excluded.owner,
+                    expires_at  = excluded.expires_at
+                WHERE leases.owner = excluded.owner OR leases.expires_at <= ?
+                RETURNING epoch
+            """, (name, owner, now + ttl, now, now)) as cur:
+                row = await cur.fetchone()
+            return row[0] if row else None
+
+        return await self.db.submit_write(_op)
+
+    async def renew(self, name: str, owner: str, epoch: int, ttl: float) -> bool:
+        """Prolonga el lease si sigue siendo nuestro (mismo dueño y `epoch`)."""
+        now = self.clock()
+
+        async def _op(conn: aiosqlite.Connection) -> bool:
+            cur = await conn.execute("""
+                UPDATE leases SET expires_at = ?
+                WHERE name = ? AND owner = ? AND epoch = ? AND expires_at > ?
+            """, (now + ttl, name, owner, epoch, now))
+            return cur.rowcount > 0
+
+        return await self.db.submit_write(_op)
+
+    async def release(self, name: str, owner: str) -> bool:
+        async def _op(conn: aiosqlite.Connection) -> bool:
+            cur = await conn.execute(
+                "UPDATE leases SET expires_at = 0 WHERE name = ? AND owner = ?", (name, owner))
+            return cur.rowcount > 0
+
+        return await self.db.submit_write(_op)
+
+    async def holder(self, name: str) -> Optional[str]:
+        """Dueño vigente del lease (None si está libre o caducado)."""
+        async with self.db.reader() as conn:
+            async with conn.execute(
+                "SELECT owner FROM leases WHERE name = ? AND expires_at > ?", (name, self.clock())
+            ) as cur:
+                row = await cur.fetchone()
+                return row[0] if row else None
+
+
+class LeaseLost(Exception):
+    """La escritura del líder se descarta: el lease caducó o lo tiene otro `epoch`."""
+
+
+class LeaseFence:
+    """Token de cercado de un `LeaderElection`, comprobado dentro de cada escritura."""
+
+    def __init__(self, election: "LeaderElection"):
+        self.election = election
+
+    async def check(self, conn: aiosqlite.Connection) -> None:
+        """Lanza `LeaseLost` si el lease ya no es nuestro (se llama dentro de la operación)."""
+        election = self.election
+        epoch = election.epoch
+        if epoch is not None:
+            async with conn.execute("""
+                SELECT 1 FROM leases
+                WHERE name = ? AND owner = ? AND epoch = ? AND expires_at > ?
+            """, (election.name, election.owner, epoch, election.clock())) as cur:
+                if await cur.fetchone() is not None:
+                    return
+        raise LeaseLost(f"Lease '{election.name}' perdido por {election.owner} (epoch {epoch}).")
+
+
+class LeaderElection:
+    """Mantiene (o espera) el liderazgo de `name` con latidos periódicos."""
+
+    def __init__(
+        self,
+        db: Database,
+        name: str,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+        ttl: float = LEASE_TTL,
+        owner: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = LeaseStore(db, clock)
+        self.name = name
+        self.owner = owner or default_owner()
+        self.ttl = ttl
+        self.heartbeat = ttl / 3
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.clock = clock
+        self.epoch: Optional[int] = None
+        self.fence = LeaseFence(self)
+        self._valid_until = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._elected: Optional[asyncio.Task] = None   # `on_elected` en curso
+
+    @property
+    def is_leader(self) -> bool:
+        return self.epoch is not None and self.clock() < self._valid_until
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"lease-{self.name}")
+
+    async def stop(self) -> None:
+        """Detiene los latidos y libera el lease si lo teníamos."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.epoch is not None:
+            await self._demote()
+            try:
+                await self.store.release(self.name, self.owner)
+            except Exception as e:
+                print(f"⚠️ [DB] No se pudo liberar el lease '{self.name}': {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await self.tick()
+            await asyncio.sleep(self.heartbeat)
+
+    async def tick(self) -> None:
+        """Un latido: renueva si somos líder, intenta tomar el lease si no."""
+        started = self.clock()
+        try:
+            if self.epoch is not None:
+                if await self.store.renew(self.name, self.owner, self.epoch, self.ttl):
+                    self._valid_until = started + self.ttl
+                else:
+                    print(f"⚠️ [DB] Lease '{self.name}' perdido por {self.owner}.")
+                    await self._demote()
+            else:
+                epoch = await self.store.acquire(self.name, self.owner, self.ttl)
+                if epoch is not None:
+                    self.epoch, self._valid_until = epoch, started + self.ttl
+                    print(f"👑 [DB] {self.owner} es líder de '{self.name}' (epoch {epoch}).")
+                    # Sin esperar: una carga larga no debe retrasar la siguiente renovación
+                    self._elected = asyncio.create_task(
+                        self._run_elected(), name=f"lease-{self.name}-elected")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️ [DB] Error en el latido del lease '{self.name}': {e}")
+            # Sin renovación confirmada no se sigue actuando como líder tras caducar
+            if self.epoch is not None and self.clock() >= self._valid_until:
+                await self._demote()
+
+    async def _run_elected(self) -> None:
+        try:
+            await self.on_elected()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️ [DB] Error al asumir el liderazgo de '{self.name}': {e}")
+
+    async def _demote(self) -> None:
+        self.epoch = None
+        self._valid_until = 0.0
+        elected, self._elected = self._elected, None
+        if elected is not None and not elected.done():
+            elected.cancel()
+            try:
+                await elected
+            except asyncio.CancelledError:
+                pass
+        try:
+            await self.on_demoted()
+        except Exception as e:
+            print(f"⚠️ [DB] Error al ceder el liderazgo de '{self.name}': {e}")
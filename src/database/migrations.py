@@ -0,0 +1,638 @@
+"""
+Archivo: migrations.py
+Ubicación: src/database/
+
+Descripción:
+Motor de migraciones versionadas del esquema SQLite, basado en
+`PRAGMA user_version`. Es la única fuente de verdad del esquema: sustituye a
+los `CREATE TABLE` / `CREATE INDEX` que antes se ejecutaban en cada arranque
+desde `Database.init_db`, al antiguo `schema.sql` y a `_ensure_authorized_table`.
+
+Funcionamiento:
+- `MIGRATIONS` es una lista ordenada de `Migration(version, name, steps)`.
+  Cada paso es una sentencia SQL o una corrutina `step(conn)`.
+- `apply_migrations(conn)` lee `user_version` y, si el esquema ya está al día,
+  retorna sin ejecutar ningún DDL (ruta rápida: una sola PRAGMA).
+- Cada migración pendiente se aplica en su propia transacción junto con el
+  nuevo `user_version`, de modo que un fallo no deja el esquema a medias.
+- Todos los pasos son idempotentes (`IF NOT EXISTS`, comprobación de columnas
+  existentes), por lo que también sirven para bases creadas por versiones
+  anteriores del bot (`user_version = 0`).
+
+Para cambiar el esquema: añadir una nueva `Migration` al final con la
+siguiente versión. Nunca modificar migraciones ya publicadas.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Sequence, Union
+
+import aiosqlite
+
+MigrationStep = Union[str, Callable[[aiosqlite.Connection], Awaitable[None]]]
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    steps: Sequence[MigrationStep]
+
+
+# ---------------------------------------------------------
+# 🧩 Helpers para pasos idempotentes
+# ---------------------------------------------------------
+async def _table_exists(conn: aiosqlite.Connection, table: str) -> bool:
+    async with conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ) as cur:
+        return await cur.fetchone() is not None
+
+
+async def _columns(conn: aiosqlite.Connection, table: str) -> List[str]:
+    async with conn.execute(f"PRAGMA table_info({table});") as cur:
+        return [row[1] for row in await cur.fetchall()]
+
+
+def add_columns(table: str, columns: Sequence[tuple[str, str]]) -> MigrationStep:
+    """Paso que añade las columnas indicadas si aún no existen en `table`."""
+    async def _step(conn: aiosqlite.Connection) -> None:
+        existing = set(await _columns(conn, table))
+        for name, ddl in columns:
+            if name not in existing:
+                await conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {ddl};")
+    return _step
+
+
+# ---------------------------------------------------------
+# 📦 v1 — Esquema base unificado
+# ---------------------------------------------------------
+_V1_TABLES = [
+    # TABLA SERVERS – Configuración de cada servidor
+    """
+    CREATE TABLE IF NOT EXISTS servers (
+        guild_id            INTEGER PRIMARY KEY,
+        language            TEXT DEFAULT 'en',
+        event_creator_role  INTEGER,
+        prefix              TEXT,
+        timezone            TEXT DEFAULT 'UTC'
+    );
+    """,
+    # TABLA EVENTOS – Datos principales del evento
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        event_id                INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id                INTEGER NOT NULL,
+        title                   TEXT NOT NULL,
+        description             TEXT,
+        -- standard | league | tournament | championship
+        event_type              TEXT DEFAULT 'standard',
+
+        -- Compat para estructuras legacy y campeonatos
+        is_championship         INTEGER DEFAULT 0,
+        championship_id         INTEGER,
+
+        -- Publicación / estado
+        is_published            INTEGER DEFAULT 0,
+        status                  TEXT DEFAULT 'draft',          -- draft | scheduled | active | archived | closed
+        timezone                TEXT,
+
+        -- Fechas clave
+        event_datetime_utc      TEXT,
+        publish_datetime_utc    TEXT,
+        registration_open_utc   TEXT,
+        registration_close_utc  TEXT,
+
+        -- Circuito y vehículos
+        track_name              TEXT,
+        track_variant           TEXT,
+        track_description       TEXT,
+        vehicle_list_id         INTEGER,
+        vehicle_text            TEXT,
+
+        -- Logística
+        max_drivers             INTEGER,
+        broadcast_slots         INTEGER DEFAULT 0,
+
+        -- Reglas y briefing
+        allow_custom_skins      INTEGER DEFAULT 0,
+        skins_url               TEXT,
+        skins_filename          TEXT,
+        rules_text              TEXT,
+        rules_attachment_url    TEXT,
+        rules_discord_channel   INTEGER,
+        has_briefing            INTEGER DEFAULT 0,
+        briefing_offset_minutes INTEGER,
+        briefing_channel_id     INTEGER,
+        briefing_type           TEXT,
+
+        -- Configuración de sesión
+        practice_time           INTEGER DEFAULT 0,
+        qualy_time              INTEGER DEFAULT 0,
+        race_time               INTEGER DEFAULT 0,
+        assists                 TEXT,
+        weather                 TEXT,
+        fuel_rate               REAL DEFAULT 100,
+        tire_wear_rate          REAL DEFAULT 100,
+        damage_multiplier       REAL DEFAULT 100,
+
+        -- Canales relacionados
+        publish_channel_id      INTEGER,
+        participants_channel_id INTEGER,
+
+        -- Trazabilidad
+        created_by              INTEGER NOT NULL,
+        created_at              TEXT NOT NULL,
+        last_edited_by          INTEGER,
+        last_edited_date        TEXT,
+        published_at            TEXT,
+        archived_at             TEXT,
+        archive_expires_at      TEXT,
+
+        FOREIGN KEY (guild_id) REFERENCES servers(guild_id)
+    );
+    """,
+    # TABLA PARTICIPANTES – Inscripciones al evento
+    """
+    CREATE TABLE IF NOT EXISTS participants (
+        user_id         INTEGER NOT NULL,
+        event_id        INTEGER NOT NULL,
+        steam_id        TEXT,
+        name            TEXT,
+        team_name       TEXT,
+        car_model       TEXT,
+        timezone        TEXT,
+        has_custom_skin INTEGER DEFAULT 0,
+        attempts        INTEGER DEFAULT 0,
+        status          TEXT DEFAULT 'pending',
+        PRIMARY KEY (user_id, event_id),
+        FOREIGN KEY (event_id) REFERENCES events(event_id)
+    );
+    """,
+    # TABLA TRACKS – Circuitos disponibles por servidor
+    """
+    CREATE TABLE IF NOT EXISTS tracks (
+        id                INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id          INTEGER NOT NULL,
+        name              TEXT NOT NULL,
+        layout            TEXT,
+        pit_slots         INTEGER NOT NULL,
+        broadcast_slots   INTEGER DEFAULT 0,
+        details           TEXT,
+        image_path        TEXT,
+        created_at        TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+    # TABLAS VEHICLE_LISTS / VEHICLE_LIST_ITEMS
+    """
+    CREATE TABLE IF NOT EXISTS vehicle_lists (
+        id              INTEGER PRIMARY KEY AUTOINCREMENT,
+        name            TEXT NOT NULL,
+        description     TEXT,
+        created_by      INTEGER,
+        created_at      TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS vehicle_list_items (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        list_id     INTEGER NOT NULL,
+        model_name  TEXT NOT NULL,
+        FOREIGN KEY (list_id) REFERENCES vehicle_lists(id) ON DELETE CASCADE
+    );
+    """,
+    # TABLAS TRACK_LISTS / TRACK_LIST_ITEMS
+    """
+    CREATE TABLE IF NOT EXISTS track_lists (
+        id              INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id        INTEGER,
+        name            TEXT NOT NULL,
+        description     TEXT,
+        created_by      INTEGER,
+        created_at      TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS track_list_items (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        list_id     INTEGER NOT NULL,
+        track_name  TEXT NOT NULL,
+        FOREIGN KEY (list_id) REFERENCES track_lists(id) ON DELETE CASCADE
+    );
+    """,
+    # TABLA AUTHORIZED_ENTITIES – Permisos por usuario/rol y módulo
+    """
+    CREATE TABLE IF NOT EXISTS authorized_entities (
+        guild_id     INTEGER NOT NULL,
+        module_name  TEXT DEFAULT 'global',
+        entity_id    INTEGER NOT NULL,
+        entity_type  TEXT CHECK(entity_type IN ('user','role')) NOT NULL,
+        UNIQUE(guild_id, module_name, entity_id, entity_type)
+    );
+    """,
+]
+
+# Columnas añadidas después de la creación original de cada tabla
+# (bases creadas por `db.py`, por `schema.sql` o por versiones intermedias).
+_V1_COLUMNS = [
+    add_columns("servers", [
+        ("language", "TEXT DEFAULT 'en'"),
+        ("event_creator_role", "INTEGER"),
+        ("prefix", "TEXT"),
+        ("timezone", "TEXT DEFAULT 'UTC'"),
+    ]),
+    add_columns("events", [
+        ("is_championship", "INTEGER DEFAULT 0"),
+        ("championship_id", "INTEGER"),
+        ("is_published", "INTEGER DEFAULT 0"),
+        ("registration_open_utc", "TEXT"),
+        ("registration_close_utc", "TEXT"),
+        ("track_name", "TEXT"),
+        ("track_variant", "TEXT"),
+        ("track_description", "TEXT"),
+        ("vehicle_list_id", "INTEGER"),
+        ("vehicle_text", "TEXT"),
+        ("max_drivers", "INTEGER"),
+        ("broadcast_slots", "INTEGER DEFAULT 0"),
+        ("skins_url", "TEXT"),
+        ("skins_filename", "TEXT"),
+        ("rules_discord_channel", "INTEGER"),
+        ("has_briefing", "INTEGER DEFAULT 0"),
+        ("briefing_offset_minutes", "INTEGER"),
+        ("briefing_channel_id", "INTEGER"),
+        ("briefing_type", "TEXT"),
+        ("practice_time", "INTEGER DEFAULT 0"),
+        ("qualy_time", "INTEGER DEFAULT 0"),
+        ("race_time", "INTEGER DEFAULT 0"),
+        ("assists", "TEXT"),
+        ("weather", "TEXT"),
+        ("fuel_rate", "REAL DEFAULT 100"),
+        ("tire_wear_rate", "REAL DEFAULT 100"),
+        ("damage_multiplier", "REAL DEFAULT 100"),
+        ("publish_channel_id", "INTEGER"),
+        ("participants_channel_id", "INTEGER"),
+    ]),
+    add_columns("track_lists", [("guild_id", "INTEGER")]),
+]
+
+
+# ---------------------------------------------------------
+# 🔐 v2 — authorized_entities: `module` (schema.sql) → `module_name`
+# ---------------------------------------------------------
+async def _unify_authorized_entities(conn: aiosqlite.Connection) -> None:
+    """
+    Reconstruye la tabla si procede de `schema.sql` (columna `module`, `id`,
+    `granted_at`) para dejar la definición canónica con `module_name`.
+    """
+    columns = await _columns(conn, "authorized_entities")
+    if "module" not in columns:
+        return
+
+    module_expr = "COALESCE(module_name, module, 'global')" if "module_name" in columns \
+        else "COALESCE(module, 'global')"
+
+    await conn.execute("ALTER TABLE authorized_entities RENAME TO authorized_entities_legacy;")
+    await conn.execute(_V1_TABLES[-1])
+    await conn.execute(f"""
+        INSERT OR IGNORE INTO authorized_entities (guild_id, module_name, entity_id, entity_type)
+        SELECT guild_id, {module_expr}, entity_id, entity_type
+        FROM authorized_entities_legacy
+        WHERE entity_type IN ('user', 'role');
+    """)
+    await conn.execute("DROP TABLE authorized_entities_legacy;")
+
+
+# ---------------------------------------------------------
+# ⚙️ v3 — server_settings (schema.sql) → servers
+# ---------------------------------------------------------
+async def _merge_server_settings(conn: aiosqlite.Connection) -> None:
+    """Copia la configuración de `server_settings` a `servers` y elimina la tabla duplicada."""
+    if not await _table_exists(conn, "server_settings"):
+        return
+
+    await conn.execute("""
+        INSERT INTO servers (guild_id, timezone, language)
+        SELECT guild_id, timezone, language FROM server_settings WHERE true
+        ON CONFLICT(guild_id) DO UPDATE SET
+            timezone = COALESCE(excluded.timezone, servers.timezone);
+    """)
+    await conn.execute("DROP TABLE server_settings;")
+
+
+# ---------------------------------------------------------
+# 📑 v4 — Índices
+# ---------------------------------------------------------
+_V4_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_events_status ON events(status);",
+    "CREATE INDEX IF NOT EXISTS idx_events_archive_expires_at ON events(archive_expires_at);",
+    "CREATE INDEX IF NOT EXISTS idx_events_guild_id ON events(guild_id);",
+    "CREATE INDEX IF NOT EXISTS idx_events_title ON events(title);",
+    "CREATE INDEX IF NOT EXISTS idx_events_publish_dt ON events(publish_datetime_utc);",
+    "CREATE INDEX IF NOT EXISTS idx_events_event_dt ON events(event_datetime_utc);",
+    "CREATE INDEX IF NOT EXISTS idx_events_reg_open_dt ON events(registration_open_utc);",
+    "CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);",
+    "CREATE INDEX IF NOT EXISTS idx_vehicle_list_items_list_id ON vehicle_list_items(list_id);",
+    "CREATE INDEX IF NOT EXISTS idx_track_list_items_list_id ON track_list_items(list_id);",
+    "CREATE INDEX IF NOT EXISTS idx_track_lists_guild_id ON track_lists(guild_id);",
+    # Índices heredados de schema.sql, sustituidos por los anteriores
+    "DROP INDEX IF EXISTS idx_events_guild_status;",
+    "DROP INDEX IF EXISTS idx_events_title_ci;",
+    "DROP INDEX IF EXISTS idx_events_publish_at;",
+]
+
+
+# ---------------------------------------------------------
+# ⏱️ v5 — Columnas epoch (INTEGER, segundos UTC) e índices compuestos
+# ---------------------------------------------------------
+# Columna ISO → columna epoch mantenida por EventDB. Las consultas temporales
+# filtran y ordenan por la columna epoch sin funciones, de modo que SQLite
+# puede recorrer los índices en lugar de escanear la tabla.
+EPOCH_COLUMNS = {
+    "event_datetime_utc": "event_ts",
+    "publish_datetime_utc": "publish_ts",
+    "registration_open_utc": "reg_open_ts",
+    "registration_close_utc": "reg_close_ts",
+    "archive_expires_at": "archive_expires_ts",
+}
+
+_V5_STEPS: List[MigrationStep] = [
+    add_columns("events", [(ts, "INTEGER") for ts in EPOCH_COLUMNS.values()]),
+    *(
+        f"UPDATE events SET {ts} = CAST(strftime('%s', {iso}) AS INTEGER) "
+        f"WHERE {iso} IS NOT NULL AND {ts} IS NULL;"
+        for iso, ts in EPOCH_COLUMNS.items()
+    ),
+    "CREATE INDEX IF NOT EXISTS idx_events_guild_status_ts ON events(guild_id, status, event_ts);",
+    "CREATE INDEX IF NOT EXISTS idx_events_guild_ts ON events(guild_id, event_ts);",
+    "CREATE INDEX IF NOT EXISTS idx_events_event_ts ON events(event_ts);",
+    "CREATE INDEX IF NOT EXISTS idx_events_status_publish_ts ON events(status, publish_ts);",
+    "CREATE INDEX IF NOT EXISTS idx_events_reg_open_ts ON events(reg_open_ts);",
+    "CREATE INDEX IF NOT EXISTS idx_events_status_archive_ts ON events(status, archive_expires_ts);",
+    # Índices sobre texto que ya no usa ninguna consulta temporal
+    "DROP INDEX IF EXISTS idx_events_guild_id;",
+    "DROP INDEX IF EXISTS idx_events_event_dt;",
+    "DROP INDEX IF EXISTS idx_events_publish_dt;",
+    "DROP INDEX IF EXISTS idx_events_reg_open_dt;",
+    "DROP INDEX IF EXISTS idx_events_archive_expires_at;",
+]
+
+
+# ---------------------------------------------------------
+# 🔑 v6 — Título único por servidor (sin distinguir mayúsculas)
+# ---------------------------------------------------------
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _nocase(title: str) -> str:
+    """Clave equivalente a `COLLATE NOCASE` (SQLite solo pliega ASCII)."""
+    return title.translate(_ASCII_LOWER)
+
+
+async def _rename_duplicate_titles(conn: aiosqlite.Connection) -> None:
+    """
+    Renombra los títulos repetidos por servidor (se conserva el evento más
+    antiguo) para que el índice único pueda crearse. El nuevo nombre nunca
+    choca con otro título existente y cada cambio queda registrado.
+    """
+    async with conn.execute(
+        "SELECT event_id, guild_id, title FROM events ORDER BY guild_id, event_id;"
+    ) as cur:
+        rows = await cur.fetchall()
+
+    taken = {(guild_id, _nocase(title)) for _, guild_id, title in rows}
+    seen = set()
+    for event_id, guild_id, title in rows:
+        key = (guild_id, _nocase(title))
+        if key not in seen:
+            seen.add(key)
+            continue
+
+        new_title, n = f"{title} ({event_id})", 1
+        while (guild_id, _nocase(new_title)) in taken:
+            n += 1
+            new_title = f"{title} ({event_id}-{n})"
+        taken.add((guild_id, _nocase(new_title)))
+        seen.add((guild_id, _nocase(new_title)))
+
+        await conn.execute("UPDATE events SET title = ? WHERE event_id = ?;", (new_title, event_id))
+        print(f"✏️ [DB] Título duplicado renombrado: evento {event_id} "
+              f"(guild {guild_id}) '{title}' → '{new_title}'")
+
+
+_V6_STEPS: List[MigrationStep] = [
+    # Renombrar duplicados previos para que el índice único pueda crearse
+    _rename_duplicate_titles,
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_guild_title_ci "
+    "ON events(guild_id, title COLLATE NOCASE);",
+    "DROP INDEX IF EXISTS idx_events_title;",
+    # Auto-root de campeonatos en la misma sentencia INSERT
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_events_championship_root
+    AFTER INSERT ON events
+    WHEN NEW.is_championship = 1 AND COALESCE(NEW.championship_id, 0) = 0
+    BEGIN
+        UPDATE events SET championship_id = NEW.event_id WHERE event_id = NEW.event_id;
+    END;
+    """,
+]
+
+
+# ---------------------------------------------------------
+# ⏰ v7 — Recordatorios persistidos
+# ---------------------------------------------------------
+_V7_STEPS: List[MigrationStep] = [
+    """
+    CREATE TABLE IF NOT EXISTS reminders (
+        reminder_id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_id             INTEGER NOT NULL,
+        guild_id             INTEGER NOT NULL,
+        fire_ts              INTEGER NOT NULL,               -- epoch UTC de envío
+        label                TEXT,
+        channel_id           INTEGER,                        -- NULL → canal del evento
+        notify_participants  INTEGER DEFAULT 1,              -- MD a los inscritos
+        status               TEXT DEFAULT 'pending',         -- pending | sent
+        sent_at              TEXT,
+        created_at           TEXT DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(event_id, fire_ts),
+        FOREIGN KEY (event_id) REFERENCES events(event_id) ON DELETE CASCADE
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_reminders_status_fire ON reminders(status, fire_ts);",
+]
+
+
+# ---------------------------------------------------------
+# 📝 v8 — Estado de inscripciones
+# ---------------------------------------------------------
+_V8_STEPS: List[MigrationStep] = [
+    # closed | open | full (lo gestiona RegistrationEngine)
+    add_columns("events", [("registration_state", "TEXT DEFAULT 'closed'")]),
+    "CREATE INDEX IF NOT EXISTS idx_participants_event_id ON participants(event_id);",
+]
+
+
+# ---------------------------------------------------------
+# 👑 v9 — Leases de liderazgo entre procesos
+# ---------------------------------------------------------
+_V9_STEPS: List[MigrationStep] = [
+    """
+    CREATE TABLE IF NOT EXISTS leases (
+        name         TEXT PRIMARY KEY,
+        owner        TEXT NOT NULL,
+        expires_at   REAL NOT NULL,                   -- epoch UTC (segundos)
+        epoch        INTEGER NOT NULL DEFAULT 1,      -- sube en cada cambio de dueño
+        acquired_at  REAL NOT NULL
+    );
+    """,
+]
+
+
+# ---------------------------------------------------------
+# 🧙 v10 — Sesiones persistidas de los wizards
+# ---------------------------------------------------------
+_V10_STEPS: List[MigrationStep] = [
+    """
+    CREATE TABLE IF NOT EXISTS wizard_sessions (
+        user_id     INTEGER NOT NULL,
+        wizard      TEXT NOT NULL,                    -- events | scheduler
+        step        INTEGER,
+        data        TEXT NOT NULL DEFAULT '{}',       -- JSON
+        created_at  TEXT,
+        updated_at  TEXT,
+        PRIMARY KEY (user_id, wizard)
+    ) WITHOUT ROWID;
+    """,
+]
+
+
+# ---------------------------------------------------------
+# 🔗 v11 — Espacio base de las sesiones (handoff entre wizards)
+# ---------------------------------------------------------
+_V11_STEPS: List[MigrationStep] = [
+    # Espacio cuyos datos ve este por debajo (p. ej. scheduler → events)
+    add_columns("wizard_sessions", [("base", "TEXT")]),
+]
+
+
+# ---------------------------------------------------------
+# 📓 v12 — Diario de cambios de las sesiones de los wizards
+# ---------------------------------------------------------
+_V12_STEPS: List[MigrationStep] = [
+    """
+    CREATE TABLE IF NOT EXISTS wizard_session_journal (
+        seq      INTEGER PRIMARY KEY,              -- orden de aplicación
+        user_id  INTEGER NOT NULL,
+        wizard   TEXT NOT NULL,
+        step     INTEGER,
+        delta    TEXT,                             -- JSON con las claves asignadas
+        ts       INTEGER NOT NULL                  -- epoch UTC (segundos)
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_wizard_session_journal_user ON wizard_session_journal(user_id);",
+]
+
+
+# ---------------------------------------------------------
+# 📡 v13 — Registro de cambios entre procesos (ChangeFeed)
+# ---------------------------------------------------------
+_NOW_TS = "CAST(strftime('%s','now') AS INTEGER)"
+
+
+def _change_trigger(name: str, when: str, table: str, entity: str, entity_id: str) -> str:
+    return f"""
+    CREATE TRIGGER IF NOT EXISTS {name}
+    AFTER {when} ON {table}
+    BEGIN
+        INSERT INTO change_log (entity, entity_id, ts) VALUES ('{entity}', {entity_id}, {_NOW_TS});
+    END;
+    """
+
+
+_V13_STEPS: List[MigrationStep] = [
+    f"""
+    CREATE TABLE IF NOT EXISTS change_log (
+        seq        INTEGER PRIMARY KEY AUTOINCREMENT,  -- cursor de los lectores
+        entity     TEXT NOT NULL,                       -- event | reminder | participants | permission
+        entity_id  INTEGER NOT NULL,
+        ts         INTEGER NOT NULL DEFAULT ({_NOW_TS}) -- epoch UTC (segundos), para la poda
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_change_log_ts ON change_log(ts);",
+    # Eventos: solo los campos que afectan a agenda, inscripciones y purga
+    # (no `registration_state`, que escribe el propio motor de inscripciones)
+    _change_trigger("trg_change_events_ins", "INSERT", "events", "event", "NEW.event_id"),
+    _change_trigger("trg_change_events_del", "DELETE", "events", "event", "OLD.event_id"),
+    _change_trigger(
+        "trg_change_events_upd",
+        "UPDATE OF status, publish_ts, archive_expires_ts, reg_open_ts, reg_close_ts, max_drivers",
+        "events", "event", "NEW.event_id",
+    ),
+    _change_trigger("trg_change_reminders_ins", "INSERT", "reminders", "reminder", "NEW.reminder_id"),
+    _change_trigger("trg_change_participants_ins", "INSERT", "participants", "participants", "NEW.event_id"),
+    _change_trigger("trg_change_participants_del", "DELETE", "participants", "participants", "OLD.event_id"),
+    _change_trigger("trg_change_auth_ins", "INSERT", "authorized_entities", "permission", "NEW.guild_id"),
+    _change_trigger("trg_change_auth_del", "DELETE", "authorized_entities", "permission", "OLD.guild_id"),
+    _change_trigger("trg_change_auth_upd", "UPDATE", "authorized_entities", "permission", "NEW.guild_id"),
+]
+
+
+# ---------------------------------------------------------
+# 📜 Historial de migraciones (orden estricto)
+# ---------------------------------------------------------
+MIGRATIONS: List[Migration] = [
+    Migration(1, "esquema base unificado", [*_V1_TABLES, *_V1_COLUMNS]),
+    Migration(2, "authorized_entities.module_name", [_unify_authorized_entities]),
+    Migration(3, "server_settings → servers", [_merge_server_settings]),
+    Migration(4, "índices de consulta", _V4_INDEXES),
+    Migration(5, "columnas epoch e índices compuestos", _V5_STEPS),
+    Migration(6, "título único por servidor", _V6_STEPS),
+    Migration(7, "tabla reminders", _V7_STEPS),
+    Migration(8, "estado de inscripciones", _V8_STEPS),
+    Migration(9, "tabla leases", _V9_STEPS),
+    Migration(10, "tabla wizard_sessions", _V10_STEPS),
+    Migration(11, "wizard_sessions.base", _V11_STEPS),
+    Migration(12, "tabla wizard_session_journal", _V12_STEPS),
+    Migration(13, "registro de cambios entre procesos", _V13_STEPS),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+# ---------------------------------------------------------
+# 🚀 Motor
+# ---------------------------------------------------------
+async def get_schema_version(conn: aiosqlite.Connection) -> int:
+    async with conn.execute("PRAGMA user_version;") as cur:
+        return (await cur.fetchone())[0]
+
+
+async def apply_migrations(conn: aiosqlite.Connection) -> int:
+    """
+    Aplica las migraciones pendientes y devuelve la versión resultante.
+    Si el esquema está al día no ejecuta ningún DDL.
+    """
+    current = await get_schema_version(conn)
+    if current >= LATEST_VERSION:
+        return current
+
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        try:
+            await conn.execute("BEGIN IMMEDIATE;")
+            for step in migration.steps:
+                if isinstance(step, str):
+                    await conn.execute(step)
+                else:
+                    await step(conn)
+            await conn.execute(f"PRAGMA user_version = {int(migration.version)};")
+            await conn.commit()
+        except Exception as e:
+            await conn.rollback()
+            print(f"❌ [DB] Migración v{migration.version} ({migration.name}) fallida: {e}")
+            raise
+        current = migration.version
+        print(f"🛠️ [DB] Migración aplicada: v{migration.version} — {migration.name}")
+
+    return current
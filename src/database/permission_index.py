@@ -0,0 +1,126 @@
+"""
+Archivo: permission_index.py
+Ubicación: src/database/
+
+Descripción:
+Índice en memoria de la tabla `authorized_entities`, usado por
+`Database.is_authorized`. Cada servidor se carga de forma perezosa la primera
+vez que se consulta (una única SELECT) y después se mantiene actualizado en el
+propio proceso mediante `grant()` / `revoke()`, llamados por
+`add_authorized_entity` y `remove_authorized_entity` tras confirmar la escritura.
+Las concesiones hechas por otros procesos sobre la misma base de datos llegan
+por `ChangeFeed` (`on_changes`): el servidor afectado se descarta y se recarga
+en la siguiente consulta.
+
+La comprobación de permisos queda reducida a intersecciones de conjuntos, sin
+accesos a la base de datos en la ruta caliente.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, Iterable, Optional, Set
+
+
+class GuildPermissions:
+    """Concesiones de un servidor: módulo → ids de usuarios / ids de roles."""
+
+    __slots__ = ("users", "roles")
+
+    def __init__(self):
+        self.users: Dict[str, Set[int]] = {}
+        self.roles: Dict[str, Set[int]] = {}
+
+    def _bucket(self, entity_type: str) -> Dict[str, Set[int]]:
+        return self.users if entity_type == "user" else self.roles
+
+    def add(self, module_name: str, entity_id: int, entity_type: str) -> None:
+        self._bucket(entity_type).setdefault(module_name, set()).add(entity_id)
+
+    def discard(self, module_name: str, entity_id: int, entity_type: str) -> None:
+        ids = self._bucket(entity_type).get(module_name)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del self._bucket(entity_type)[module_name]
+
+    def allows(self, module: str, user_id: int, role_ids: Iterable[int]) -> bool:
+        """True si el usuario o alguno de sus roles tiene permiso en `module` o en 'global'."""
+        for name in (module, "global"):
+            users = self.users.get(name)
+            if users and user_id in users:
+                return True
+            roles = self.roles.get(name)
+            if roles and not roles.isdisjoint(role_ids):
+                return True
+        return False
+
+
+class PermissionIndex:
+    """Caché por servidor de `authorized_entities` con carga perezosa."""
+
+    def __init__(self, db):
+        self._db = db
+        self._guilds: Dict[int, GuildPermissions] = {}
+        self._load_lock = asyncio.Lock()
+        # Se incrementa en cada grant/revoke para detectar cargas obsoletas
+        self._changes = 0
+
+    async def get(self, guild_id: int) -> GuildPermissions:
+        """Devuelve las concesiones del servidor, cargándolas si aún no están en memoria."""
+        perms = self._guilds.get(guild_id)
+        if perms is not None:
+            return perms
+
+        async with self._load_lock:
+            perms = self._guilds.get(guild_id)
+            while perms is None:
+                seen = self._changes
+                loaded = await self._load(guild_id)
+                # Si hubo cambios durante la SELECT, la carga puede estar desfasada
+                if seen == self._changes:
+                    perms = self._guilds[guild_id] = loaded
+        return perms
+
+    async def _load(self, guild_id: int) -> GuildPermissions:
+        perms = GuildPermissions()
+        async with self._db.reader() as conn:
+            async with conn.execute("""
+                SELECT module_name, entity_id, entity_type
+                FROM authorized_entities
+                WHERE guild_id = ?;
+            """, (guild_id,)) as cursor:
+                for module_name, entity_id, entity_type in await cursor.fetchall():
+                    perms.add(module_name or "global", entity_id, entity_type)
+        return perms
+
+    # ---------------------------------------------------------
+    # 🔄 Actualización en caliente
+    # ---------------------------------------------------------
+    def grant(self, guild_id: int, module_name: str, entity_id: int, entity_type: str) -> None:
+        self._changes += 1
+        perms = self._guilds.get(guild_id)
+        if perms is not None:
+            perms.add(module_name, entity_id, entity_type)
+
+    def revoke(self, guild_id: int, module_name: str, entity_id: int, entity_type: str) -> None:
+        self._changes += 1
+        perms = self._guilds.get(guild_id)
+        if perms is not None:
+            perms.discard(module_name, entity_id, entity_type)
+
+    async def on_changes(self, guild_ids: Optional[Set[int]]) -> None:
+        """Suscriptor de `ChangeFeed`: descarta los servidores cambiados (None = todos)."""
+        self._changes += 1
+        if guild_ids is None:
+            self.invalidate()
+            return
+        for guild_id in guild_ids:
+            self.invalidate(guild_id)
+
+    def invalidate(self, guild_id: int | None = None) -> None:
+        """Descarta el índice de un servidor (o de todos) para recargarlo en la próxima consulta."""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
@@ -0,0 +1,124 @@
+"""
+Archivo: records.py
+Ubicación: src/database/
+
+Descripción:
+Registros de fila compactos para las consultas de los DAOs. En lugar de
+construir un `dict` por fila (rehaciendo la lista de columnas a partir de
+`cursor.description` cada vez), cada registro guarda solo la tupla original
+de SQLite y una referencia a la "forma" de la consulta (`RowShape`), es decir,
+el mapeo columna → índice, que se construye una única vez por combinación de
+columnas y se comparte entre todas las filas.
+
+Los registros usan `__slots__` y mantienen acceso estilo diccionario
+(`rec["title"]`, `rec.get(...)`, `keys()`, `items()`, `dict(rec)`), de modo
+que los llamadores existentes no necesitan cambios. Son de solo lectura: para
+modificar los datos usar `to_dict()`.
+
+Clases:
+- EventRecord: filas de `events`.
+- TrackRecord: filas de `tracks`.
+- ParticipantRecord: filas de `participants`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type, TypeVar
+
+R = TypeVar("R", bound="RowRecord")
+
+
+class RowShape:
+    """Mapeo columna → índice compartido por todas las filas de una misma consulta."""
+
+    __slots__ = ("columns", "index")
+
+    _cache: Dict[Tuple[str, ...], "RowShape"] = {}
+
+    def __init__(self, columns: Tuple[str, ...]):
+        self.columns = columns
+        self.index = {name: i for i, name in enumerate(columns)}
+
+    @classmethod
+    def for_cursor(cls, cursor) -> "RowShape":
+        """Devuelve la forma (cacheada) correspondiente a `cursor.description`."""
+        columns = tuple(c[0] for c in cursor.description)
+        shape = cls._cache.get(columns)
+        if shape is None:
+            shape = cls._cache[columns] = cls(columns)
+        return shape
+
+
+class RowRecord(Mapping):
+    """Registro de solo lectura respaldado por la tupla de SQLite."""
+
+    __slots__ = ("_row", "_shape")
+
+    def __init__(self, row: Tuple[Any, ...], shape: RowShape):
+        self._row = row
+        self._shape = shape
+
+    # ---------- Construcción ----------
+
+    @classmethod
+    def from_row(cls: Type[R], cursor, row) -> R:
+        return cls(row, RowShape.for_cursor(cursor))
+
+    @classmethod
+    def from_rows(cls: Type[R], cursor, rows: Iterable[tuple]) -> List[R]:
+        shape = RowShape.for_cursor(cursor)
+        return [cls(row, shape) for row in rows]
+
+    # ---------- Protocolo Mapping ----------
+
+    def __getitem__(self, key: str) -> Any:
+        return self._row[self._shape.index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape.columns)
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shape.index
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._shape.index.get(key)
+        return default if i is None else self._row[i]
+
+    # ---------- Utilidades ----------
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._row[self._shape.index[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copia mutable del registro."""
+        return dict(zip(self._shape.columns, self._row))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class EventRecord(RowRecord):
+    """Fila de la tabla `events`."""
+
+    __slots__ = ()
+
+
+class TrackRecord(RowRecord):
+    """Fila de la tabla `tracks`."""
+
+    __slots__ = ()
+
+
+class ParticipantRecord(RowRecord):
+    """Fila de la tabla `participants`."""
+
+    __slots__ = ()
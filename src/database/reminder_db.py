@@ -0,0 +1,216 @@
+"""
+Archivo: reminder_db.py
+Ubicación: src/database/
+
+Descripción:
+Capa de acceso a datos para la tabla `reminders` (recordatorios de eventos).
+Los recordatorios se crean desde el Scheduler Wizard (`reminders_list` de la
+sesión, persistido por `EventDB.insert_event`) y los consume el
+`ReminderDispatcher` del bot.
+
+Funciones principales:
+- insert_for_event(conn, event_id, guild_id, reminders): inserta dentro de una
+  operación de escritura ya abierta (misma transacción que el evento).
+- add_reminders(event_id, guild_id, reminders): inserción independiente.
+- next_pending(after, limit): siguientes recordatorios pendientes por
+  (`fire_ts`, `reminder_id`) usando `idx_reminders_status_fire`.
+- pending(ids): de esos ids, los que siguen pendientes (cambios de otros
+  procesos recibidos por `ChangeFeed`).
+- mark_sent(reminder_id): marca como enviado solo si seguía pendiente
+  (idempotente: devuelve False si ya estaba enviado o ya no existe).
+- missed(until_ts) / mark_skipped(ids): recuperación tras una parada del bot;
+  los descartados quedan en `status='skipped'`.
+
+Formato de `reminders`: lista de dicts con `utc` (ISO) y opcionalmente
+`label`, `channel_id` y `notify_participants`.
+"""
+
+import aiosqlite
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from .db import Database
+from .timestamps import to_epoch
+from .records import RowRecord
+
+
+class ReminderRecord(RowRecord):
+    """Fila de la tabla `reminders`."""
+
+    __slots__ = ()
+
+
+class ReminderDB:
+    """Capa de persistencia para la tabla `reminders`."""
+
+    def __init__(self, db: Database):
+        self.db = db
+        # Observadores de recordatorios nuevos: callback(list[(reminder_id, fire_ts)])
+        self._listeners: List[Callable[[List[Tuple[int, int]]], None]] = []
+
+    def add_listener(self, callback: Callable[[List[Tuple[int, int]]], None]) -> None:
+        self._listeners.append(callback)
+
+    def notify_added(self, added: List[Tuple[int, int]]) -> None:
+        if not added:
+            return
+        for callback in self._listeners:
+            try:
+                callback(added)
+            except Exception as e:
+                print(f"⚠️ [ReminderDB] Error en observador de recordatorios: {e}")
+
+    # ---------------------------------------------------------
+    # 🟢 CREATE
+    # ---------------------------------------------------------
+    @staticmethod
+    async def insert_for_event(
+        conn: aiosqlite.Connection,
+        event_id: int,
+        guild_id: int,
+        reminders: Iterable[Dict[str, Any]],
+    ) -> List[Tuple[int, int]]:
+        """
+        Inserta los recordatorios de un evento dentro de una operación de
+        escritura abierta. Ignora entradas sin fecha válida y duplicados.
+        Devuelve [(reminder_id, fire_ts)] de los insertados.
+        """
+        now_iso = datetime.utcnow().isoformat()
+        added = []
+        for r in reminders:
+            fire_ts = to_epoch(r.get("utc"))
+            if fire_ts is None:
+                continue
+            async with conn.execute("""
+                INSERT INTO reminders
+                    (event_id, guild_id, fire_ts, label, channel_id, notify_participants, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(event_id, fire_ts) DO NOTHING
+                RETURNING reminder_id, fire_ts
+            """, (
+                event_id, guild_id, fire_ts, r.get("label"), r.get("channel_id"),
+                int(r.get("notify_participants", 1)), now_iso,
+            )) as cur:
+                row = await cur.fetchone()
+            if row:
+                added.append((row[0], row[1]))
+        return added
+
+    async def add_reminders(self, event_id: int, guild_id: int, reminders: Iterable[Dict[str, Any]]) -> int:
+        reminders = list(reminders)
+        added = await self.db.submit_write(
+            lambda conn: self.insert_for_event(conn, event_id, guild_id, reminders))
+        self.notify_added(added)
+        return len(added)
+
+    # ---------------------------------------------------------
+    # 📖 READ
+    # ---------------------------------------------------------
+    async def get_reminder(self, reminder_id: int) -> Optional[ReminderRecord]:
+        async with self.db.reader() as conn:
+            async with conn.execute(
+                "SELECT * FROM reminders WHERE reminder_id = ?", (reminder_id,)
+            ) as cur:
+                row = await cur.fetchone()
+                return ReminderRecord.from_row(cur, row) if row else None
+
+    async def list_for_event(self, event_id: int) -> List[ReminderRecord]:
+        async with self.db.reader() as conn:
+            async with conn.execute(
+                "SELECT * FROM reminders WHERE event_id = ? ORDER BY fire_ts", (event_id,)
+            ) as cur:
+                return ReminderRecord.from_rows(cur, await cur.fetchall())
+
+    async def next_pending(
+        self, after: Optional[Tuple[int, int]] = None, limit: int = 500
+    ) -> List[Tuple[int, int]]:
+        """
+        Siguientes recordatorios pendientes como [(reminder_id, fire_ts)],
+        ordenados por (`fire_ts`, `reminder_id`) a partir de la clave `after`.
+        """
+        query = "SELECT reminder_id, fire_ts FROM reminders WHERE status = 'pending'"
+        params: List[Any] = []
+        if after is not None:
+            query += " AND (fire_ts > ? OR (fire_ts = ? AND reminder_id > ?))"
+            params.extend([after[0], after[0], after[1]])
+        query += " ORDER BY fire_ts, reminder_id LIMIT ?"
+        params.append(limit)
+
+        async with self.db.reader() as conn:
+            async with conn.execute(query, params) as cur:
+                return [(r[0], r[1]) for r in await cur.fetchall()]
+
+    async def pending(self, reminder_ids: Iterable[int]) -> List[Tuple[int, int]]:
+        """De `reminder_ids`, los que siguen pendientes, como [(reminder_id, fire_ts)]."""
+        ids = list(reminder_ids)
+        if not ids:
+            return []
+        async with self.db.reader() as conn:
+            async with conn.execute(f"""
+                SELECT reminder_id, fire_ts FROM reminders
+                WHERE status = 'pending' AND reminder_id IN ({",".join("?" * len(ids))})
+                ORDER BY fire_ts, reminder_id
+            """, ids) as cur:
+                return [(r[0], r[1]) for r in await cur.fetchall()]
+
+    async def missed(self, until_ts: int) -> List[Tuple[int, int, int]]:
+        """
+        Recordatorios pendientes vencidos (`fire_ts <= until_ts`) como
+        [(reminder_id, event_id, fire_ts)], en una sola consulta de rango
+        sobre `idx_reminders_status_fire`.
+        """
+        async with self.db.reader() as conn:
+            async with conn.execute("""
+                SELECT reminder_id, event_id, fire_ts FROM reminders
+                WHERE status = 'pending' AND fire_ts <= ?
+                ORDER BY fire_ts, reminder_id
+            """, (until_ts,)) as cur:
+                return [(r[0], r[1], r[2]) for r in await cur.fetchall()]
+
+    # ---------------------------------------------------------
+    # ✏️ UPDATE / DELETE
+    # ---------------------------------------------------------
+    async def mark_sent(self, reminder_id: int, fence=None) -> bool:
+        """
+        Pasa el recordatorio a `sent` solo si seguía pendiente. Con `fence`
+        (`LeaseFence`) se aborta con `LeaseLost` si el lease ya no es nuestro.
+        """
+        now_iso = datetime.utcnow().isoformat()
+
+        async def _op(conn: aiosqlite.Connection) -> bool:
+            if fence is not None:
+                await fence.check(conn)
+            cur = await conn.execute("""
+                UPDATE reminders SET status = 'sent', sent_at = ?
+                WHERE reminder_id = ? AND status = 'pending'
+            """, (now_iso, reminder_id))
+            return cur.rowcount > 0
+
+        return await self.db.submit_write(_op)
+
+    async def mark_skipped(self, reminder_ids: Iterable[int], chunk_size: int = 500,
+                           fence=None) -> int:
+        """Descarta recordatorios pendientes sin enviarlos (`status='skipped'`)."""
+        ids = list(reminder_ids)
+        now_iso = datetime.utcnow().isoformat()
+
+        async def _op(conn: aiosqlite.Connection) -> int:
+            if fence is not None:
+                await fence.check(conn)
+            total = 0
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                cur = await conn.execute(f"""
+                    UPDATE reminders SET status = 'skipped', sent_at = ?
+                    WHERE status = 'pending' AND reminder_id IN ({",".join("?" * len(chunk))})
+                """, (now_iso, *chunk))
+                total += cur.rowcount
+            return total
+
+        return await self.db.submit_write(_op) if ids else 0
+
+    async def delete_for_event(self, event_id: int) -> int:
+        async def _op(conn: aiosqlite.Connection) -> int:
+            cur = await conn.execute("DELETE FROM reminders WHERE event_id = ?", (event_id,))
+            return cur.rowcount
+
+        return await self.db.submit_write(_op)
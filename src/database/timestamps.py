@@ -0,0 +1,33 @@
+"""
+Archivo: timestamps.py
+Ubicación: src/database/
+
+Descripción:
+Conversión de fechas ISO a segundos epoch UTC para las columnas INTEGER
+(`event_ts`, `publish_ts`, `fire_ts`, ...) que usan las consultas indexadas.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+
+def to_epoch(value: Any) -> Optional[int]:
+    """
+    Convierte una fecha ISO (o `datetime`) a segundos UTC.
+    Las fechas sin zona horaria se interpretan como UTC. Devuelve None si no
+    se puede interpretar.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
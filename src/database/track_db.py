@@ -14,6 +14,8 @@ Funciones principales:
 - delete_track(track_id): elimina un circuito.
 - get_or_create_track(name, layout, guild_id): busca o crea uno nuevo automáticamente.
 
+Las lecturas devuelven `TrackRecord` (acceso tipo dict, solo lectura).
+
 Campos gestionados:
     id, guild_id, name, layout, pit_slots, broadcast_slots,
     details, image_path, created_at
@@ -22,7 +24,8 @@ Campos gestionados:
 import aiosqlite
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from database.db import Database
+from .db import Database
+from .records import TrackRecord
 
 
 class TrackDB:
@@ -31,17 +34,6 @@ class TrackDB:
     def __init__(self, db: Database):
         self.db = db
 
-    # ---------------------------------------------------------
-    # 🧩 Helper interno
-    # ---------------------------------------------------------
-    async def _conn(self) -> aiosqlite.Connection:
-        return await self.db.get_connection()
-
-    @staticmethod
-    def _dict_from_row(cursor, row) -> Dict[str, Any]:
-        cols = [c[0] for c in cursor.description]
-        return dict(zip(cols, row))
-
     # ---------------------------------------------------------
     # 🟢 CREATE
     # ---------------------------------------------------------
@@ -58,42 +50,40 @@ class TrackDB:
         data.setdefault("broadcast_slots", 0)
         data.setdefault("created_at", datetime.utcnow().isoformat())
 
-        # Evitar duplicados (por nombre y layout dentro del mismo guild)
-        conn = await self._conn()
-        cur = await conn.execute("""
-            SELECT id FROM tracks
-            WHERE LOWER(name) = LOWER(?) AND IFNULL(layout,'') = IFNULL(?, '')
-              AND guild_id = ?;
-        """, (data["name"], data.get("layout", ""), data["guild_id"]))
-        existing = await cur.fetchone()
-        if existing:
-            raise ValueError(
-                "Ya existe un circuito con este nombre y diseño en este servidor.")
-
         cols = ", ".join(data.keys())
         placeholders = ", ".join([f":{k}" for k in data.keys()])
         query = f"INSERT INTO tracks ({cols}) VALUES ({placeholders})"
 
-        await conn.execute(query, data)
-        await conn.commit()
-
-        cur = await conn.execute("SELECT last_insert_rowid()")
-        new_id = (await cur.fetchone())[0]
+        async def _op(conn: aiosqlite.Connection) -> int:
+            # Evitar duplicados (por nombre y layout dentro del mismo guild)
+            async with conn.execute("""
+                SELECT id FROM tracks
+                WHERE LOWER(name) = LOWER(?) AND IFNULL(layout,'') = IFNULL(?, '')
+                  AND guild_id = ?;
+            """, (data["name"], data.get("layout", ""), data["guild_id"])) as cur:
+                existing = await cur.fetchone()
+            if existing:
+                raise ValueError(
+                    "Ya existe un circuito con este nombre y diseño en este servidor.")
+
+            cur = await conn.execute(query, data)
+            return cur.lastrowid
+
+        new_id = await self.db.submit_write(_op)
         print(f"🏁 Circuito creado: {data.get('name')} (ID={new_id})")
         return new_id
 
     # ---------------------------------------------------------
     # 📖 READ
     # ---------------------------------------------------------
-    async def get_track(self, track_id: int) -> Optional[Dict[str, Any]]:
-        conn = await self._conn()
-        cur = await conn.execute("SELECT * FROM tracks WHERE id = ?", (track_id,))
-        row = await cur.fetchone()
-        return self._dict_from_row(cur, row) if row else None
+    async def get_track(self, track_id: int) -> Optional[TrackRecord]:
+        async with self.db.reader() as conn:
+            async with conn.execute("SELECT * FROM tracks WHERE id = ?", (track_id,)) as cur:
+                row = await cur.fetchone()
+                return TrackRecord.from_row(cur, row) if row else None
 
-    async def list_tracks(self, guild_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def list_tracks(self, guild_id: Optional[int] = None) -> List[TrackRecord]:
         """Devuelve todos los circuitos registrados (opcionalmente filtrados por servidor)."""
-        conn = await self._conn()
         query = "SELECT * FROM tracks"
         params: list[Any] = []
         if guild_id:
@@ -101,9 +91,10 @@ class TrackDB:
             params.append(guild_id)
         query += " ORDER BY name ASC"
 
-        cur = await conn.execute(query, params)
-        rows = await cur.fetchall()
-        return [self._dict_from_row(cur, r) for r in rows] if rows else []
+        async with self.db.reader() as conn:
+            async with conn.execute(query, params) as cur:
+                rows = await cur.fetchall()
+                return TrackRecord.from_rows(cur, rows)
 
     # ---------------------------------------------------------
     # ✏️ UPDATE
@@ -115,19 +106,21 @@ class TrackDB:
         sets = ", ".join(f"{k} = ?" for k in fields.keys())
         values = list(fields.values()) + [track_id]
 
-        conn = await self._conn()
-        cur = await conn.execute(f"UPDATE tracks SET {sets} WHERE id = ?", values)
-        await conn.commit()
-        return cur.rowcount > 0
+        async def _op(conn: aiosqlite.Connection) -> bool:
+            cur = await conn.execute(f"UPDATE tracks SET {sets} WHERE id = ?", values)
+            return cur.rowcount > 0
+
+        return await self.db.submit_write(_op)
 
     # ---------------------------------------------------------
     # ❌ DELETE
     # ---------------------------------------------------------
     async def delete_track(self, track_id: int) -> bool:
-        conn = await self._conn()
-        cur = await conn.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
-        await conn.commit()
-        return cur.rowcount > 0
+        async def _op(conn: aiosqlite.Connection) -> bool:
+            cur = await conn.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
+            return cur.rowcount > 0
+
+        return await self.db.submit_write(_op)
 
     # ---------------------------------------------------------
     # 🔍 GET OR CREATE
@@ -136,13 +129,13 @@ class TrackDB:
         """
         Devuelve el ID del circuito si existe; de lo contrario lo crea.
         """
-        conn = await self._conn()
-        cur = await conn.execute("""
-            SELECT id FROM tracks
-            WHERE LOWER(name) = LOWER(?) AND IFNULL(layout,'') = IFNULL(?, '')
-              AND guild_id = ?;
-        """, (name, layout, guild_id))
-        row = await cur.fetchone()
+        async with self.db.reader() as conn:
+            async with conn.execute("""
+                SELECT id FROM tracks
+                WHERE LOWER(name) = LOWER(?) AND IFNULL(layout,'') = IFNULL(?, '')
+                  AND guild_id = ?;
+            """, (name, layout, guild_id)) as cur:
+                row = await cur.fetchone()
         if row:
             return row[0]
 
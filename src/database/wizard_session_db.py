@@ -0,0 +1,110 @@
+"""
+Archivo: wizard_session_db.py
+Ubicación: src/database/
+
+Descripción:
+Capa de acceso a datos para las tablas `wizard_sessions` (sesiones a medias de
+los wizards de eventos y de programación) y `wizard_session_journal` (diario
+de cambios). La usa `SessionStore` (`src/cogs/wizards_shared/session_store.py`),
+que escribe en diferido: las actualizaciones se acumulan en memoria y se
+vuelcan aquí en lotes.
+
+Cada usuario tiene una fila por espacio de nombres (`wizard`: events,
+scheduler); `base` indica el espacio que se ve por debajo tras un handoff.
+Los cambios sueltos (`update`, `next_step`) no reescriben la fila: se añaden
+al diario como deltas de pocas decenas de bytes, y la compactación los
+integra en la fila (foto) y los borra.
+
+Funciones principales:
+- load(user_id): filas de la sesión de un usuario y su cola del diario.
+- save(rows, user_ids, journal): reemplaza las sesiones de `user_ids` por
+  `rows` (vaciando su diario) y añade `journal`, todo en una sola escritura.
+- purge(before_iso): borra las sesiones sin cambios desde `before_iso`.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import aiosqlite
+from .db import Database
+
+# (user_id, wizard, step, data_json, base, created_at, updated_at)
+SessionRow = Tuple[int, str, Optional[int], str, Optional[str], Optional[str], Optional[str]]
+# (user_id, wizard, step, delta_json, ts)
+JournalRow = Tuple[int, str, Optional[int], Optional[str], int]
+
+
+class WizardSessionDB:
+    """Capa de persistencia para las tablas `wizard_sessions` y `wizard_session_journal`."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def load(self, user_id: int) -> Tuple[List[SessionRow], List[JournalRow]]:
+        """Filas (una por espacio de nombres) de la sesión y deltas pendientes, en orden."""
+        async with self.db.reader() as conn:
+            async with conn.execute("""
+                SELECT user_id, wizard, step, data, base, created_at, updated_at
+                FROM wizard_sessions WHERE user_id = ?;
+            """, (user_id,)) as cur:
+                rows = [tuple(row) for row in await cur.fetchall()]
+            async with conn.execute("""
+                SELECT user_id, wizard, step, delta, ts
+                FROM wizard_session_journal WHERE user_id = ? ORDER BY seq;
+            """, (user_id,)) as cur:
+                journal = [tuple(row) for row in await cur.fetchall()]
+        return rows, journal
+
+    async def save(self, rows: Sequence[SessionRow], user_ids: Iterable[int] = (),
+                   journal: Sequence[JournalRow] = ()) -> None:
+        """
+        Reemplaza las sesiones de `user_ids` (y de los usuarios de `rows`) y
+        añade los deltas de `journal`, en una escritura.
+        """
+        users = {*user_ids, *(row[0] for row in rows)}
+        if not users and not journal:
+            return
+
+        async def _op(conn: aiosqlite.Connection) -> None:
+            if users:
+                params = [(u,) for u in users]
+                await conn.executemany("DELETE FROM wizard_sessions WHERE user_id = ?;", params)
+                await conn.executemany("DELETE FROM wizard_session_journal WHERE user_id = ?;", params)
+            if rows:
+                await conn.executemany("""
+                    INSERT INTO wizard_sessions
+                        (user_id, wizard, step, data, base, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?);
+                """, rows)
+            if journal:
+                await conn.executemany("""
+                    INSERT INTO wizard_session_journal (user_id, wizard, step, delta, ts)
+                    VALUES (?, ?, ?, ?, ?);
+                """, journal)
+
+        await self.db.submit_write(_op)
+
+    async def purge(self, before_iso: str) -> int:
+        """Borra las sesiones abandonadas (sin cambios desde `before_iso`, tampoco en el diario)."""
+        before_ts = int(datetime.fromisoformat(before_iso).timestamp())
+
+        async def _op(conn: aiosqlite.Connection) -> int:
+            cur = await conn.execute("""
+                DELETE FROM wizard_sessions
+                WHERE updated_at < ?
+                  AND user_id NOT IN (
+                      SELECT user_id FROM wizard_session_journal WHERE ts >= ?
+                  );
+            """, (before_iso, before_ts))
+            purged = cur.rowcount
+            # Deltas sin foto a la que aplicarse
+            await conn.execute("""
+                DELETE FROM wizard_session_journal
+                WHERE user_id NOT IN (SELECT user_id FROM wizard_sessions);
+            """)
+            return purged
+
+        purged = await self.db.submit_write(_op)
+        if purged:
+            print(f"🧹 [WizardSessionDB] {purged} sesiones caducadas eliminadas.")
+        return purged
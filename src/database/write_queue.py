@@ -0,0 +1,148 @@
+"""
+Archivo: write_queue.py
+Ubicación: src/database/
+
+Descripción:
+Cola de escritura con *group commit* para la conexión de escritura única.
+Todas las mutaciones de los DAOs (eventos, circuitos, ajustes de servidor,
+autorizaciones y listas) se envían como operaciones asíncronas que reciben
+la conexión; la cola las agrupa en una sola transacción por ventana corta
+(`window_ms`) o al alcanzar `max_batch` operaciones.
+
+Garantías:
+- Cada operación se ejecuta dentro de su propio SAVEPOINT: si falla, solo se
+  revierte esa operación y su llamador recibe la excepción; el resto del lote
+  se confirma igualmente.
+- El awaitable de cada llamador se resuelve únicamente después del COMMIT del
+  lote (un único fsync por lote con `synchronous = FULL`).
+- Las operaciones NO deben llamar a `conn.commit()`: la cola gestiona la
+  transacción.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+import aiosqlite
+
+WriteOp = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+
+class WriteBatcher:
+    """Agrupa mutaciones concurrentes en transacciones compartidas."""
+
+    def __init__(self, manager, window_ms: float = 5.0, max_batch: int = 64):
+        self._manager = manager
+        self.window = window_ms / 1000
+        self.max_batch = max(1, max_batch)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+        # Estadísticas básicas para diagnóstico
+        self.batches = 0
+        self.ops = 0
+
+    # ---------------------------------------------------------
+    # 🔹 API pública
+    # ---------------------------------------------------------
+    async def submit(self, op: WriteOp) -> Any:
+        """
+        Encola una operación de escritura y espera a que su lote sea durable.
+        Devuelve el resultado de `op(conn)` o relanza su excepción.
+        """
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, future))
+        return await future
+
+    async def close(self) -> None:
+        """Vacía la cola pendiente y detiene el bucle de escritura."""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    # ---------------------------------------------------------
+    # 🧩 Bucle interno
+    # ---------------------------------------------------------
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="db-write-batcher")
+
+    async def _collect(self) -> List[Tuple[WriteOp, asyncio.Future]]:
+        """Espera la primera operación y acumula las que lleguen dentro de la ventana."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.window
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            try:
+                await self._commit_batch(batch)
+            except Exception as e:
+                # p. ej. no se pudo abrir la conexión de escritura
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _commit_batch(self, batch: List[Tuple[WriteOp, asyncio.Future]]) -> None:
+        results: list[tuple[asyncio.Future, bool, Any]] = []
+
+        async with self._manager.writer() as conn:
+            try:
+                await conn.execute("BEGIN IMMEDIATE;")
+                for op, future in batch:
+                    if future.cancelled():
+                        continue
+                    await conn.execute("SAVEPOINT write_op;")
+                    try:
+                        value = await op(conn)
+                    except Exception as e:
+                        await conn.execute("ROLLBACK TO write_op;")
+                        await conn.execute("RELEASE write_op;")
+                        results.append((future, False, e))
+                    else:
+                        await conn.execute("RELEASE write_op;")
+                        results.append((future, True, value))
+                await conn.commit()
+            except Exception as e:
+                # Fallo del lote completo (BEGIN/COMMIT): nadie queda confirmado
+                try:
+                    await conn.rollback()
+                except Exception:
+                    pass
+                print(f"❌ [DB] Error al confirmar lote de escritura: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        self.batches += 1
+        self.ops += len(results)
+        for future, ok, value in results:
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
@@ -29,6 +29,15 @@ def load_config() -> dict:
         "LOG_LEVEL": os.getenv("LOG_LEVEL", "INFO"),
         "DATABASE_PATH": os.getenv("DATABASE_PATH", os.path.join(BASE_DIR, "data", "bot.db")),
         "ENV": os.getenv("ENV", "dev"),  # dev / prod / test
+
+        # Recuperación de plazos vencidos tras una parada (bot_core/catchup.py)
+        "CATCHUP_RATE": os.getenv("CATCHUP_RATE"),
+        "CATCHUP_PUBLICATION_MODE": os.getenv("CATCHUP_PUBLICATION_MODE"),
+        "CATCHUP_PUBLICATION_MAX_AGE": os.getenv("CATCHUP_PUBLICATION_MAX_AGE"),
+        "CATCHUP_PUBLICATION_COLLAPSE": os.getenv("CATCHUP_PUBLICATION_COLLAPSE"),
+        "CATCHUP_REMINDER_MODE": os.getenv("CATCHUP_REMINDER_MODE"),
+        "CATCHUP_REMINDER_MAX_AGE": os.getenv("CATCHUP_REMINDER_MAX_AGE"),
+        "CATCHUP_REMINDER_COLLAPSE": os.getenv("CATCHUP_REMINDER_COLLAPSE"),
     }
 
     # Validación obligatoria
@@ -0,0 +1,178 @@
+"""
+Archivo: event_series.py
+Ubicación: src/utils/
+
+Descripción:
+Generador de series de eventos (ligas y campeonatos) a partir de un evento
+plantilla y una regla de recurrencia:
+
+- weekly / biweekly: N rondas cada 7 / 14 días a la misma hora local.
+- dates: fechas locales concretas (`AAAA-MM-DD HH:MM`).
+
+Las fechas relativas de la plantilla (publicación, apertura/cierre de
+inscripciones y recordatorios) se conservan como desfases respecto a la hora
+local del evento, y todas las fechas de todas las rondas se convierten a UTC
+en un único lote (`manager_timezones.localize_many`), de modo que un cambio de
+horario (DST) a mitad de temporada no desplaza la hora local de las rondas.
+
+La inserción (`create_series`) usa `EventDB.insert_series`: todas las rondas y
+sus recordatorios en una sola transacción. Las rondas heredan el tipo de la
+plantilla (liga, campeonato...) y quedan enlazadas a ella como raíz de la
+serie (`championship_id`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.utils import manager_timezones as tz
+
+RECURRENCE_DAYS = {"weekly": 7, "biweekly": 14}
+MAX_ROUNDS = 52
+ROUND_TITLE = "{title} — Ronda {n}"
+
+# Fechas de la plantilla que se trasladan a cada ronda (desfase respecto al evento)
+_RELATIVE_FIELDS = ("publish_datetime_utc", "registration_open_utc", "registration_close_utc")
+
+# Campos de la plantilla que no se copian a las rondas
+_SKIP_FIELDS = {
+    "event_id", "title", "status", "is_published", "championship_id",
+    "created_at", "created_by", "last_edited_by", "last_edited_date",
+    "published_at", "archived_at", "archive_expires_at", "registration_state",
+    "event_datetime_utc", *_RELATIVE_FIELDS,
+    "event_ts", "publish_ts", "reg_open_ts", "reg_close_ts", "archive_expires_ts",
+}
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """Regla de recurrencia de una serie."""
+
+    kind: str                                   # weekly | biweekly | dates
+    count: int = 0                              # nº de rondas (weekly / biweekly)
+    dates: Tuple[str, ...] = field(default_factory=tuple)
+
+    def __post_init__(self):
+        if self.kind not in (*RECURRENCE_DAYS, "dates"):
+            raise ValueError(f"Recurrencia desconocida: {self.kind}")
+        rounds = len(self.dates) if self.kind == "dates" else self.count
+        if not 1 <= rounds <= MAX_ROUNDS:
+            raise ValueError(f"El número de rondas debe estar entre 1 y {MAX_ROUNDS}.")
+
+    def local_datetimes(self, start: Optional[datetime]) -> List[datetime]:
+        """Horas locales (naive) de cada ronda."""
+        if self.kind == "dates":
+            return sorted(tz.parse_local(d) for d in self.dates)
+        if start is None:
+            raise ValueError("Falta la fecha de la primera ronda.")
+        step = timedelta(days=RECURRENCE_DAYS[self.kind])
+        return [start + step * i for i in range(self.count)]
+
+
+def _local(utc_value: Optional[str], zone_name: str) -> Optional[datetime]:
+    """ISO UTC → datetime naive en hora local de `zone_name`."""
+    if not utc_value:
+        return None
+    dt = datetime.fromisoformat(utc_value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=tz.UTC)
+    return dt.astimezone(tz.get_zone(zone_name)).replace(tzinfo=None)
+
+
+def build_series(
+    template: Mapping[str, Any],
+    rule: RecurrenceRule,
+    created_by: int,
+    start: Union[str, datetime, None] = None,
+    reminders: Sequence[Mapping[str, Any]] = (),
+    tz_name: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Construye los dicts de las rondas (listos para `EventDB.insert_series`).
+    `start` es la hora local de la primera ronda; por defecto, la de la plantilla.
+    """
+    zone_name = tz_name or template.get("timezone") or "UTC"
+    tz.get_zone(zone_name)  # valida la zona antes de calcular nada
+
+    event_local = _local(template.get("event_datetime_utc"), zone_name)
+    start_local = tz.parse_local(start) if isinstance(start, str) else (start or event_local)
+    round_times = rule.local_datetimes(start_local)
+
+    # Desfases (hora local) respecto al inicio del evento plantilla
+    offsets: Dict[str, timedelta] = {}
+    reminder_offsets: List[Tuple[Mapping[str, Any], timedelta]] = []
+    if event_local is not None:
+        for name in _RELATIVE_FIELDS:
+            value = _local(template.get(name), zone_name)
+            if value is not None:
+                offsets[name] = value - event_local
+        for r in reminders:
+            fire_ts = r.get("fire_ts")
+            if fire_ts is not None:
+                fire_local = datetime.fromtimestamp(fire_ts, tz.get_zone(zone_name)).replace(tzinfo=None)
+                reminder_offsets.append((r, fire_local - event_local))
+
+    # Todas las fechas locales de todas las rondas → UTC en un solo lote
+    per_round = 1 + len(offsets) + len(reminder_offsets)
+    local_values: List[datetime] = []
+    for when in round_times:
+        local_values.append(when)
+        local_values.extend(when + delta for delta in offsets.values())
+        local_values.extend(when + delta for _, delta in reminder_offsets)
+    utc_values = tz.localize_many(local_values, zone_name)
+
+    base = {k: v for k, v in template.items() if k not in _SKIP_FIELDS}
+    title = template["title"]
+    rounds = []
+    for n, when in enumerate(round_times, start=1):
+        chunk = utc_values[(n - 1) * per_round:n * per_round]
+        data = dict(base)
+        data.update({
+            "title": ROUND_TITLE.format(title=title, n=n),
+            "timezone": zone_name,
+            "created_by": created_by,
+            "event_datetime_utc": chunk[0].isoformat(),
+        })
+        for i, name in enumerate(offsets, start=1):
+            data[name] = chunk[i].isoformat()
+        data["status"] = "scheduled" if data.get("publish_datetime_utc") else "draft"
+        data["reminders_list"] = [
+            {
+                "utc": chunk[1 + len(offsets) + i].isoformat(),
+                "label": r.get("label"),
+                "channel_id": r.get("channel_id"),
+                "notify_participants": r.get("notify_participants", 1),
+            }
+            for i, (r, _) in enumerate(reminder_offsets)
+        ]
+        rounds.append(data)
+    return rounds
+
+
+async def create_series(
+    db,
+    template_id: int,
+    rule: RecurrenceRule,
+    created_by: int,
+    start: Union[str, datetime, None] = None,
+    tz_name: Optional[str] = None,
+) -> List[int]:
+    """Genera e inserta la serie a partir del evento `template_id`. Devuelve los ids."""
+    template = await db.events.get_event(template_id)
+    if template is None:
+        raise ValueError(f"No existe el evento {template_id}.")
+    reminders = await db.reminders.list_for_event(template_id)
+    rounds = build_series(dict(template), rule, created_by, start, reminders, tz_name)
+    # La plantilla (o la raíz de su serie, si ya pertenecía a una) encabeza las rondas
+    return await db.events.insert_series(rounds, root_id=template["championship_id"] or template_id)
+
+
+__all__ = [
+    "RECURRENCE_DAYS",
+    "MAX_ROUNDS",
+    "RecurrenceRule",
+    "build_series",
+    "create_series",
+]
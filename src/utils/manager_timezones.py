@@ -6,9 +6,18 @@ Descripción:
 Contiene las utilidades centrales de gestión de zonas horarias utilizadas por
 los wizards de Community Race Manager. Define las regiones disponibles, sus
 zonas horarias asociadas y helpers para conversión y validación de fechas.
+
+Servicio de conversión (único punto de parseo de fechas de los wizards):
+- get_zone(): objetos `ZoneInfo` cacheados por nombre.
+- parse_local(): parser propio de `AAAA-MM-DD HH:MM` (`strptime` solo como respaldo).
+- local_to_utc() / convert_to_utc(): fecha local → UTC (datetime / ISO8601).
+- localize_many(): conversión por lotes a UTC con una sola zona (series de
+  eventos, recordatorios); respeta los cambios de horario (DST).
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, List, Union
 from zoneinfo import ZoneInfo
 
 # --------------------------------------------------------
@@ -91,30 +100,95 @@ def list_timezones_by_region(region: str) -> list[tuple[str, str, str]]:
     return ZONES_BY_REGION.get(region, [])
 
 
+# --------------------------------------------------------
+# 🕒 SERVICIO DE CONVERSIÓN
+# --------------------------------------------------------
+UTC = timezone.utc
+LOCAL_FORMAT = "%Y-%m-%d %H:%M"
+
+LocalDatetime = Union[str, datetime]
+
+
+@lru_cache(maxsize=128)
+def get_zone(tz_name: str) -> ZoneInfo:
+    """Devuelve la zona `tz_name` (cacheada). Lanza ValueError si no existe."""
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        raise ValueError(f"Zona horaria inválida: {tz_name}") from None
+
+
+def is_valid_zone(tz_name: str) -> bool:
+    try:
+        get_zone(tz_name)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def now_utc() -> datetime:
+    return datetime.now(UTC)
+
+
+def parse_local(dt_str: str) -> datetime:
+    """
+    Parsea `AAAA-MM-DD HH:MM` (naive, hora local). Lanza ValueError si el
+    formato o la fecha no son válidos.
+
+    La forma canónica (16 caracteres) se trocea sin `strptime`; las variantes
+    que `strptime` acepta (p. ej. `2025-3-7 9:05`) pasan por él.
+    """
+    s = dt_str.strip()
+    if (len(s) == 16 and s[4] == "-" and s[7] == "-" and s[10] == " " and s[13] == ":"
+            and (s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16]).isdigit()):
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]))
+    try:
+        return datetime.strptime(s, "%Y-%m-%d %H:%M")
+    except ValueError:
+        raise ValueError(f"Formato de fecha inválido: {dt_str!r} (usa AAAA-MM-DD HH:MM)") from None
+
+
+def local_to_utc(value: LocalDatetime, tz_name: str) -> datetime:
+    """Convierte una fecha local (texto `AAAA-MM-DD HH:MM` o datetime naive) a UTC."""
+    local_dt = parse_local(value) if isinstance(value, str) else value
+    return local_dt.replace(tzinfo=get_zone(tz_name)).astimezone(UTC)
+
+
+def localize_many(values: Iterable[LocalDatetime], tz_name: str) -> List[datetime]:
+    """Versión por lotes de `local_to_utc` (una sola búsqueda de zona)."""
+    zone = get_zone(tz_name)
+    return [
+        (parse_local(v) if isinstance(v, str) else v).replace(tzinfo=zone).astimezone(UTC)
+        for v in values
+    ]
+
+
+def format_local(utc_dt: datetime, tz_name: str) -> str:
+    """Fecha UTC → texto `AAAA-MM-DD HH:MM` en la zona indicada."""
+    return utc_dt.astimezone(get_zone(tz_name)).strftime(LOCAL_FORMAT)
+
+
 def convert_to_utc(dt_str: str, tz_name: str) -> str:
     """
     Convierte una fecha/hora local (AAAA-MM-DD HH:MM) a UTC (ISO8601).
     """
     try:
-        local_zone = ZoneInfo(tz_name)
-        local_dt = datetime.strptime(
-            dt_str, "%Y-%m-%d %H:%M").replace(tzinfo=local_zone)
-        utc_dt = local_dt.astimezone(ZoneInfo("UTC"))
-        return utc_dt.isoformat()
+        return local_to_utc(dt_str, tz_name).isoformat()
     except Exception as e:
         raise ValueError(f"❌ Error al convertir fecha: {e}")
 
 
-def validate_future_datetime(utc_iso: str, min_offset_minutes: int = 0) -> bool:
+def validate_future_datetime(utc_value: Union[str, datetime], min_offset_minutes: int = 0) -> bool:
     """
-    Valida que una fecha UTC sea futura respecto a la actual.
+    Valida que una fecha UTC (ISO8601 o datetime) sea futura respecto a la actual.
     """
-    now_utc = datetime.now(ZoneInfo("UTC"))
     try:
-        dt = datetime.fromisoformat(utc_iso)
+        dt = datetime.fromisoformat(utc_value) if isinstance(utc_value, str) else utc_value
     except Exception:
         return False
-    return dt > (now_utc + timedelta(minutes=min_offset_minutes))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt > (now_utc() + timedelta(minutes=min_offset_minutes))
 
 
 # --------------------------------------------------------
@@ -125,6 +199,15 @@ __all__ = [
     "ZONES_BY_REGION",
     "list_regions",
     "list_timezones_by_region",
+    "UTC",
+    "LOCAL_FORMAT",
+    "get_zone",
+    "is_valid_zone",
+    "now_utc",
+    "parse_local",
+    "local_to_utc",
+    "localize_many",
+    "format_local",
     "convert_to_utc",
     "validate_future_datetime",
 ]
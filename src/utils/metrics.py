@@ -0,0 +1,58 @@
+"""
+Archivo: metrics.py
+Ubicación: src/utils/
+
+Descripción:
+Registro de métricas en proceso para los servicios en segundo plano
+(purga, recordatorios, sesiones, etc.). Sin dependencias externas: los
+valores se consultan con `snapshot()` (por ejemplo desde un comando de
+diagnóstico o un volcado a log).
+
+- Contadores (`incr`): valores acumulados (p. ej. eventos purgados).
+- Medidores (`gauge`): último valor observado (p. ej. sesiones activas).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Union
+
+Number = Union[int, float]
+
+
+class Metrics:
+    """Contadores y medidores con nombre, seguros entre hilos."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Number] = {}
+        self._gauges: Dict[str, Number] = {}
+
+    def incr(self, name: str, value: Number = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def gauge(self, name: str, value: Number) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def get(self, name: str, default: Number = 0) -> Number:
+        with self._lock:
+            if name in self._counters:
+                return self._counters[name]
+            return self._gauges.get(name, default)
+
+    def snapshot(self) -> Dict[str, Dict[str, Number]]:
+        with self._lock:
+            return {"counters": dict(self._counters), "gauges": dict(self._gauges)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+
+
+# Registro global del proceso
+metrics = Metrics()
+
+__all__ = ["Metrics", "metrics"]
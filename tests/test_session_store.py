@@ -0,0 +1,230 @@
+"""
+Archivo: test_session_store.py
+Ubicación: tests/
+
+Descripción:
+Pruebas de `SessionStore` (src/cogs/wizards_shared/session_store.py) con un
+backend falso en memoria que imita a `WizardSessionDB`: volcado diferido,
+diario de deltas, expulsión por el tope y cambios durante un volcado en curso.
+
+Uso:
+    python -m pytest -q tests
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.cogs.wizards_shared.session_store import SessionStore  # noqa: E402
+
+
+class FakeBackend:
+    """Misma interfaz que `WizardSessionDB` (load/save/purge) sobre dicts."""
+
+    def __init__(self):
+        self.sessions = {}    # user_id -> [SessionRow]
+        self.journal = {}     # user_id -> [JournalRow]
+        self.saves = 0
+        self.fail = 0         # próximos `save` que fallan
+        self.gate = None      # asyncio.Event que retiene `save` mientras no se active
+
+    async def load(self, user_id):
+        return list(self.sessions.get(user_id, [])), list(self.journal.get(user_id, []))
+
+    async def save(self, rows, user_ids=(), journal=()):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError("save fallido")
+        self.saves += 1
+        users = {*user_ids, *(row[0] for row in rows)}
+        for user_id in users:
+            self.sessions.pop(user_id, None)
+            self.journal.pop(user_id, None)
+        for row in rows:
+            self.sessions.setdefault(row[0], []).append(row)
+        for row in journal:
+            self.journal.setdefault(row[0], []).append(row)
+
+    async def purge(self, before_iso):
+        return 0
+
+    def data(self, user_id, name):
+        for row in self.sessions.get(user_id, []):
+            if row[1] == name:
+                return json.loads(row[3])
+        return None
+
+
+def _store(backend, **kwargs) -> SessionStore:
+    kwargs.setdefault("flush_interval", 0.01)
+    store = SessionStore("test", sweep_interval=3600, **kwargs)
+    store.attach(backend)
+    return store
+
+
+async def _settle(store: SessionStore) -> None:
+    """Espera a que termine el volcado programado."""
+    while store._flush_task is not None and not store._flush_task.done():
+        await asyncio.sleep(0.005)
+
+
+def test_changes_are_coalesced_into_one_write_and_recovered():
+    async def main():
+        backend = FakeBackend()
+        store = _store(backend)
+        store.start(1, "events", {"title": "GP"})
+        await store.assign(1, "events", {"laps": 10})
+        await store.assign(1, "events", {"laps": 12})
+        await _settle(store)
+        assert backend.saves == 1
+        assert backend.data(1, "events") == {"title": "GP", "laps": 12}
+
+        # Asignación suelta: va al diario y se aplica sobre la foto al recuperar
+        await store.assign(1, "events", {"track": "Spa"})
+        await _settle(store)
+        assert len(backend.journal[1]) == 1
+
+        fresh = _store(backend)
+        record = await fresh.hydrate(1)
+        assert dict(record.snapshot("events")) == {"title": "GP", "laps": 12, "track": "Spa"}
+        await store.close()
+        await fresh.close()
+
+    asyncio.run(main())
+
+
+def test_changes_during_an_inflight_save_are_flushed():
+    async def main():
+        backend = FakeBackend()
+        backend.gate = asyncio.Event()
+        store = _store(backend)
+        store.start(1, "events", {"title": "GP"})
+        await asyncio.sleep(0.03)          # el volcado queda retenido en `save`
+
+        store.start(2, "events", {"title": "Rally"})
+        backend.gate.set()
+        await _settle(store)
+
+        assert not store.pending
+        assert backend.data(2, "events") == {"title": "Rally"}
+        await store.close()
+
+    asyncio.run(main())
+
+
+def test_evicted_session_stays_visible_while_its_save_is_inflight():
+    async def main():
+        backend = FakeBackend()
+        backend.gate = asyncio.Event()
+        store = _store(backend, max_sessions=1)
+        store.start(1, "events", {"title": "GP"})
+        store.start(2, "events", {"title": "Rally"})    # expulsa al usuario 1 sin volcar
+        assert 1 not in store
+        await asyncio.sleep(0.03)
+
+        # La BD aún no tiene al usuario 1: se recupera de lo expulsado
+        record = await store.hydrate(1)
+        assert record is not None
+        assert dict(record.snapshot("events")) == {"title": "GP"}
+
+        backend.gate.set()
+        await _settle(store)
+        await store.close()
+        assert backend.data(1, "events") == {"title": "GP"}
+
+    asyncio.run(main())
+
+
+def test_session_evicted_during_its_save_is_written_again():
+    async def main():
+        backend = FakeBackend()
+        backend.gate = asyncio.Event()
+        store = _store(backend, max_sessions=1)
+        store.start(1, "events", {"title": "GP"})
+        await asyncio.sleep(0.03)          # el usuario 1 está en el volcado retenido
+
+        store.start(2, "events", {"title": "Rally"})    # lo expulsa durante el volcado
+        record = await store.hydrate(1)
+        assert dict(record.snapshot("events")) == {"title": "GP"}
+
+        await store.assign(1, "events", {"laps": 5})
+        backend.gate.set()
+        await _settle(store)
+        await store.close()
+        assert backend.data(1, "events") == {"title": "GP", "laps": 5}
+
+    asyncio.run(main())
+
+
+def test_failed_save_is_retried():
+    async def main():
+        backend = FakeBackend()
+        backend.fail = 1
+        store = _store(backend)
+        store.start(1, "events", {"title": "GP"})
+        await _settle(store)
+        assert backend.saves == 1
+        assert backend.data(1, "events") == {"title": "GP"}
+        await store.close()
+
+    asyncio.run(main())
+
+
+def test_end_deletes_the_stored_session():
+    async def main():
+        backend = FakeBackend()
+        store = _store(backend)
+        store.start(1, "events", {"title": "GP"})
+        await _settle(store)
+        store.end(1, "events")
+        await _settle(store)
+        assert 1 not in backend.sessions
+        assert await store.hydrate(1) is None
+        await store.close()
+
+    asyncio.run(main())
+
+
+def test_update_copies_only_while_a_view_is_alive():
+    async def main():
+        store = SessionStore("test", sweep_interval=3600)
+        store.start(1, "events", {"title": "GP"})
+        data = store.get(1).namespaces["events"].data
+
+        # Vista ya descartada: se modifica en el sitio
+        assert store.view(1, "events")["title"] == "GP"
+        await store.assign(1, "events", {"laps": 10})
+        assert store.get(1).namespaces["events"].data is data
+
+        # Vista conservada por el lector: no cambia bajo él
+        view = store.view(1, "events")
+        await store.assign(1, "events", {"laps": 12})
+        assert view["laps"] == 10
+        assert store.view(1, "events")["laps"] == 12
+        assert store.get(1).namespaces["events"].data is not data
+        await store.close()
+
+    asyncio.run(main())
+
+
+def test_handoff_view_sees_the_base_namespace():
+    async def main():
+        store = SessionStore("test", sweep_interval=3600)
+        store.start(1, "events", {"title": "GP", "laps": 10})
+        store.handoff(1, "events", "scheduler")
+        await store.assign(1, "scheduler", {"laps": 12})
+        view = store.view(1, "scheduler")
+        assert dict(view) == {"title": "GP", "laps": 12}
+
+        # La vista combinada también protege al espacio base
+        await store.assign(1, "events", {"title": "Rally"})
+        assert view["title"] == "GP"
+        assert store.view(1, "scheduler")["title"] == "Rally"
+        await store.close()
+
+    asyncio.run(main())